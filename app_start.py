@@ -1,7 +1,10 @@
 import sys
+import time
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from ui.main_window import CountdownBall
+from core.timer.checkpoint import CHECKPOINTS
+from core.timer.countdowns import COUNTDOWNS
 from utils.logger import logger
 
 
@@ -15,14 +18,23 @@ def main():
 
     app = QApplication(sys.argv)
     # 平台检查
-    if sys.platform != "win32":
+    if sys.platform != "win32" and not sys.platform.startswith("linux"):
         from PyQt5.QtWidgets import QMessageBox
-        QMessageBox.critical(None, "错误", "本程序仅支持 Windows 系统（因依赖 PowerPoint 检测和注册表）")
+        QMessageBox.critical(None, "错误", "本程序仅支持 Windows 和 Linux 系统（因依赖放映检测和开机自启）")
         sys.exit(1)
 
     # 创建主窗口
     ball = CountdownBall()
     ball.center_on_screen()
+
+    # 从检查点恢复上次的计时（上次关闭或崩溃时正在进行的倒计时）
+    started = time.perf_counter()
+    state = CHECKPOINTS.load()
+    ball.mode_manager.restore(state)
+    COUNTDOWNS.restore(state["countdowns"])
+    COUNTDOWNS.checkpoints = CHECKPOINTS
+    logger.info(f"检查点恢复耗时 {(time.perf_counter() - started) * 1000:.2f} ms")
+
     ball.show()
 
     logger.info("倒计时悬浮球已启动")
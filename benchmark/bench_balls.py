@@ -0,0 +1,66 @@
+"""
+多悬浮球基准：同一进程里 1 个球与 N 个球的 CPU、内存和唤醒次数对比
+
+所有球共用一个调度器、一份配置和一份预渲染图层，N 个球的开销应当接近 1 个球。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_balls [--balls 8] [--seconds 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import psutil
+from PyQt5.QtWidgets import QApplication
+
+from core.scheduler import SCHEDULER
+
+
+def pump(app, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.002)
+
+
+def measure(app, seconds):
+    """跑 seconds 秒，返回 (CPU 毫秒, RSS MB, 每秒唤醒次数)"""
+    process = psutil.Process()
+    cpu_start = time.process_time()
+    pump(app, seconds)
+    cpu = (time.process_time() - cpu_start) * 1000
+    return cpu, process.memory_info().rss / 1e6, SCHEDULER.stats(seconds)["wakeups_per_second"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多悬浮球基准")
+    parser.add_argument("--balls", type=int, default=8, help="悬浮球总数")
+    parser.add_argument("--seconds", type=float, default=5.0, help="每组测量的秒数")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from ui.main_window import CountdownBall
+
+    ball = CountdownBall()
+    ball.show()
+    ball.mode_manager.get_current_timer().start_countdown(10)  # 运行中：脉冲动画 + 每秒刷新
+    pump(app, 0.5)
+    single = measure(app, args.seconds)
+
+    for _ in range(args.balls - 1):
+        ball.ball_manager.open_mirror()
+    pump(app, 0.5)
+    multi = measure(app, args.seconds)
+
+    for label, (cpu, rss, wakeups) in (("1 个球", single), (f"{args.balls} 个球", multi)):
+        print(f"{label:>6}: CPU {cpu / args.seconds:.1f} ms/s, RSS {rss:.1f} MB, 唤醒 {wakeups:.1f} 次/秒")
+    print(f"增加: CPU x{multi[0] / max(single[0], 1e-9):.2f}, RSS +{multi[1] - single[1]:.1f} MB, "
+          f"唤醒 +{multi[2] - single[2]:.1f} 次/秒")
+    ball.ball_manager.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+多个具名倒计时基准：每个倒计时的内存占用与共用调度器的唤醒次数
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_countdowns [--count 10000]
+"""
+import argparse
+import time
+import tracemalloc
+
+from core.notify import NotificationService, RecordingBackend
+from core.scheduler import ManualDriver, TickScheduler
+from core.timer.clock import VirtualClock
+from core.timer.countdowns import CountdownManager
+
+
+def make_manager():
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+    notifier = NotificationService(scheduler, min_interval=0.0, dedup_window=0.0, max_queue=1_000_000)
+    recorder = RecordingBackend()
+    notifier.add_backend(recorder)
+    return clock, scheduler, CountdownManager(clock, scheduler, notifier), recorder
+
+
+def bench_memory(count):
+    """空闲与运行中的倒计时各自的平均内存（含名称字符串与字典项）"""
+    _, _, manager, _ = make_manager()
+    names = [f"timer-{i}" for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for name in names:
+        manager.add(name, 600, start=False)
+    idle = tracemalloc.get_traced_memory()[0] - before
+    for name in names:
+        manager.resume(name)
+    running = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"{count} 个倒计时: 空闲每个 {idle / count:.0f} 字节, 运行中每个 {running / count:.0f} 字节（含到点任务）")
+
+
+def bench_wakeups(count):
+    """count 个倒计时错开到点，跑满一小时虚拟时间"""
+    clock, scheduler, manager, recorder = make_manager()
+    manager.add_listener(lambda countdown: None)
+    for i in range(count):
+        manager.add(f"timer-{i}", 60 + i * 3600 / count)
+    start = time.perf_counter()
+    wakeups = clock.run(scheduler, 3600 + 61)
+    elapsed = time.perf_counter() - start
+    print(f"{count} 个倒计时运行 1 小时: 唤醒 {wakeups} 次, 到点提醒 {len(recorder.delivered)} 条, "
+          f"耗时 {elapsed * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多个具名倒计时基准")
+    parser.add_argument("--count", type=int, default=10000, help="倒计时个数")
+    args = parser.parse_args()
+    bench_memory(args.count)
+    bench_wakeups(args.count)
+
+
+if __name__ == "__main__":
+    main()
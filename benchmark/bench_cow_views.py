@@ -0,0 +1,84 @@
+"""
+牛马模式视图切换回归基准
+
+反复双击切换视图之后，每次唤醒应当只调用一次当前视图的刷新函数，
+跑过午饭时到点提醒恰好弹一次。调用次数超出预期时以非零状态退出。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_cow_views [--toggles 1 10 100 1000]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from core.scheduler import ManualDriver, TickScheduler
+from core.timer.clock import VirtualClock
+from core.timer.cow_timer import CowTimer
+from core.timer.events import TimerEvents
+
+
+class CountingEvents(TimerEvents):
+    """接收显示文字（计时器才会照常逐秒刷新）并计数提醒"""
+
+    def __init__(self):
+        self.notifies = 0
+        self.text = ""
+
+    def set_display_text(self, text):
+        self.text = text
+
+    def notify(self, title, message, topmost=False):
+        self.notifies += 1
+
+
+def count_calls(timer):
+    """把注册表里的每个刷新函数包一层计数，返回计数字典"""
+    calls = {"handler": 0}
+    for name, handler in list(timer.views.items()):
+        def counted(now=None, handler=handler):
+            calls["handler"] += 1
+            return handler(now)
+        timer.register_view(name, counted)
+    return calls
+
+
+def bench(toggles, seconds=None):
+    """切换 toggles 轮视图后回到倒计时，从 11:00 跑过午饭提醒（seconds 为 None 时跑到午饭后一分钟）"""
+    clock = VirtualClock(datetime(2025, 1, 6, 11, 0))
+    scheduler = TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+    events = CountingEvents()
+    timer = CowTimer(events, clock, scheduler)
+    timer.activate()
+    for _ in range(toggles * len(timer.views)):
+        timer.shift_view()
+    calls = count_calls(timer)
+    if seconds is None:
+        schedule = timer.schedule
+        lunch = next(start for start, name, _, _ in schedule.segments if name == "afternoon")
+        seconds = lunch - schedule.offset(clock.now()) + 60
+
+
+    start = time.perf_counter()
+    wakeups = clock.run(scheduler, seconds)
+    elapsed = time.perf_counter() - start
+    per_wakeup = calls["handler"] / max(1, wakeups)
+    print(f"切换 {toggles:>5} 轮: 唤醒 {wakeups} 次, 刷新函数调用 {calls['handler']} 次 "
+          f"(每次唤醒 {per_wakeup:.2f}), 提醒 {events.notifies} 次, "
+          f"每次唤醒 {elapsed / max(1, wakeups) * 1e6:.2f} µs")
+    return calls["handler"] == wakeups and events.notifies == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="牛马模式视图切换回归基准")
+    parser.add_argument("--toggles", type=int, nargs="+", default=[1, 10, 100, 1000], help="切换轮数")
+    parser.add_argument("--seconds", type=float, default=None, help="每组跑的虚拟秒数，要跑过午饭提醒，默认跑到午饭后一分钟")
+    args = parser.parse_args()
+    ok = all([bench(toggles, args.seconds) for toggles in args.toggles])
+    if not ok:
+        print("[回归] 每次唤醒的刷新函数调用次数或提醒次数超出预期")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
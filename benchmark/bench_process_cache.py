@@ -0,0 +1,109 @@
+"""
+进程信息缓存基准：每轮放映检测的进程查询次数与耗时
+
+模拟每轮检测都有 --windows 个标题像放映的候选窗口（分属若干真实进程），
+对比每次新建 psutil.Process 查询进程名与走 PROCESS_CACHE 的开销。
+走缓存时与 enum_slideshow_windows 一样，每轮先列一次 PID（psutil.pids()）清掉已退出的进程，
+命中的窗口不再打开进程。
+“进程查询”统计 psutil.Process 的创建与 name() 调用，在 Windows 上每一次都要 OpenProcess，
+在 Linux 上是读 /proc；“列 PID”在 Windows 上是一次 EnumProcesses。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_process_cache [--passes 1000] [--windows 5]
+"""
+import argparse
+import time
+
+import psutil
+
+from core.system.process_cache import ProcessCache
+
+COUNTED = ("__init__", "name")
+
+
+class QueryCounter:
+    """临时包装 psutil.Process 的方法，统计进程查询次数"""
+
+    def __init__(self):
+        self.queries = 0
+        self.listings = 0
+        self.originals = {}
+
+    def __enter__(self):
+        for attr in COUNTED:
+            original = self.originals[attr] = getattr(psutil.Process, attr)
+
+            def wrapper(*args, _original=original, **kwargs):
+                self.queries += 1
+                return _original(*args, **kwargs)
+
+            setattr(psutil.Process, attr, wrapper)
+        original_pids = self.originals["pids"] = psutil.pids
+
+        def pids():
+            self.listings += 1
+            return original_pids()
+
+        psutil.pids = pids
+        return self
+
+    def __exit__(self, *exc):
+        for attr in COUNTED:
+            setattr(psutil.Process, attr, self.originals[attr])
+        psutil.pids = self.originals["pids"]
+
+
+def candidate_pids(count):
+    """挑几个可以访问的真实进程充当放映窗口的所属进程"""
+    pids = []
+    for pid in psutil.pids():
+        try:
+            psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        pids.append(pid)
+        if len(pids) == count:
+            break
+    return pids
+
+
+def uncached_pass(pids):
+    for pid in pids:
+        psutil.Process(pid).name()
+
+
+def cached_pass(cache, pids):
+    cache.prune(psutil.pids())  # 与 enum_slideshow_windows 一样，每轮先列一次 PID
+    for pid in pids:
+        cache.name(pid)
+
+
+def measure(label, passes, run_pass):
+    with QueryCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(passes):
+            run_pass()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<6} 每轮进程查询 {counter.queries / passes:>5.2f} 次, 列 PID {counter.listings / passes:.2f} 次, "
+          f"耗时 {elapsed / passes * 1e6:>8.1f} µs")
+    return counter.queries / passes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="进程信息缓存基准")
+    parser.add_argument("--passes", type=int, default=1000, help="检测轮数")
+    parser.add_argument("--windows", type=int, default=5, help="每轮的候选窗口数")
+    args = parser.parse_args()
+
+    pids = candidate_pids(max(1, args.windows // 2))  # 一个进程可能有多个候选窗口
+    windows = [pids[i % len(pids)] for i in range(args.windows)]
+    cache = ProcessCache()
+
+    before = measure("不缓存", args.passes, lambda: uncached_pass(windows))
+    after = measure("缓存", args.passes, lambda: cached_pass(cache, windows))
+    stats = cache.stats()
+    print(f"进程查询减少 {1 - after / before:.0%}，缓存命中率 {stats['hit_rate']:.1%}（{stats['size']} 个进程）")
+
+
+if __name__ == "__main__":
+    main()
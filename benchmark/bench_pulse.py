@@ -0,0 +1,72 @@
+"""
+脉冲圈绘制基准：逐帧矢量绘制 vs 预渲染精灵帧
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_pulse [--frames 2000]
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QGuiApplication, QImage, QPainter, QPen
+
+from core.display.sprites import PULSE_STYLES, PulseSprites, pulse_value, ring_geometry
+
+SIZES = (80, 120, 300)
+
+
+def draw_vector(painter, size, style, phase, _sprites):
+    """原来的绘制方式：每帧算 sin 并抗锯齿画圆"""
+    (r, g, b), max_alpha, pen_width = PULSE_STYLES[style]
+    x, y, ring = ring_geometry(size, size)
+    painter.setBrush(Qt.NoBrush)
+    painter.setPen(QPen(QColor(r, g, b, int(max_alpha * pulse_value(phase))), pen_width))
+    painter.drawEllipse(x, y, ring, ring)
+
+
+def draw_sprite(painter, size, style, phase, sprites):
+    """精灵帧方式：按相位贴一张预渲染位图"""
+    painter.drawPixmap(0, 0, sprites.frame(style, size, size, 1.0, phase))
+
+
+def measure(draw, size, frames):
+    target = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    sprites = PulseSprites()
+    # 预热，排除首次渲染精灵帧的开销
+    for style in PULSE_STYLES:
+        sprites.frame(style, size, size, 1.0, 0)
+    samples = []
+    for i in range(frames):
+        style = ("green", "yellow", "red", "gold")[i // 50 % 4]
+        phase = i * 0.1
+        start = time.perf_counter()
+        painter = QPainter(target)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter, size, style, phase, sprites)
+        painter.end()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="脉冲圈绘制基准")
+    parser.add_argument("--frames", type=int, default=2000, help="每组测量的帧数")
+    args = parser.parse_args()
+
+    app = QGuiApplication([])
+    print(f"{'尺寸':>6} {'矢量均值ms':>12} {'矢量p95':>10} {'精灵均值ms':>12} {'精灵p95':>10} {'加速比':>8}")
+    for size in SIZES:
+        vector_mean, vector_p95 = measure(draw_vector, size, args.frames)
+        sprite_mean, sprite_p95 = measure(draw_sprite, size, args.frames)
+        print(f"{size:>6} {vector_mean:>12.4f} {vector_p95:>10.4f} {sprite_mean:>12.4f} {sprite_p95:>10.4f} "
+              f"{vector_mean / sprite_mean:>7.2f}x")
+    del app
+
+
+if __name__ == "__main__":
+    main()
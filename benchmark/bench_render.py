@@ -0,0 +1,178 @@
+"""
+TimerRenderer 离屏绘制基准
+
+在 QT_QPA_PLATFORM=offscreen 下把 TimerRenderer.draw 画到 QImage 上，
+遍历球体大小、设备像素比、计时状态和模式，统计帧率与单帧耗时分位数。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_render --save benchmark/render_baseline.json
+    python -m benchmark.bench_render --compare benchmark/render_baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import APP_CONFIG
+from core.display.renderer import TimerRenderer
+from core.timer.thresholds import color_state
+
+SIZES = (80, 120, 200, 300)
+DPRS = (1.0, 1.5, 2.0)
+MODES = ("normal", "slide", "cow")
+STATES = ("running", "paused", "warning", "critical", "overtime", "cow_income")
+
+
+class BenchTimer:
+    """只提供渲染器需要的属性的计时器替身"""
+
+    def __init__(self, mode, state):
+        self.mode = mode
+        self.total_seconds = 300
+        self.is_running = state != "paused"
+        self.remaining = {
+            "running": 200,
+            "paused": 200,
+            "warning": APP_CONFIG.WARNING_THRESHOLD,
+            "critical": APP_CONFIG.CRITICAL_THRESHOLD,
+            "overtime": -42,
+            "cow_income": 200,
+        }[state]
+        self.color = color_state(self.remaining)
+        if mode == "cow":
+            self.time_or_income = state != "cow_income"
+
+    def get_status_text(self):
+        return self.mode
+
+
+class BenchParent:
+    """渲染器的宿主替身，尺寸与像素比由基准设定"""
+
+    def __init__(self, size, dpr, timer):
+        self.size = size
+        self.dpr = dpr
+        self.mode_manager = self
+        self.timer = timer
+
+    def get_current_timer(self):
+        return self.timer
+
+    def rect(self):
+        return QRect(0, 0, self.size, self.size)
+
+    def devicePixelRatioF(self):
+        return self.dpr
+
+    def update(self, *args):
+        pass
+
+
+def scenarios():
+    for mode in MODES:
+        for state in STATES:
+            if state == "cow_income" and mode != "cow":
+                continue  # 收入视图只存在于牛马模式
+            yield mode, state
+
+
+def measure(size, dpr, mode, state, frames):
+    timer = BenchTimer(mode, state)
+    parent = BenchParent(size, dpr, timer)
+    renderer = TimerRenderer(parent)
+    if state == "cow_income":
+        renderer.text_renderer.set_text("123.₄₅")
+    else:
+        renderer.text_renderer.set_text(renderer.text_renderer.format_time(timer.remaining))
+
+    image = QImage(round(size * dpr), round(size * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    rect = parent.rect()
+
+    samples = []
+    for i in range(frames + 10):
+        renderer.pulse_animation = i * 0.1
+        start = time.perf_counter()
+        painter = QPainter(image)
+        renderer.draw(painter, timer, rect, dpr)
+        painter.end()
+        if i >= 10:  # 前几帧包含图层与精灵帧的首次渲染，不计入
+            samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    mean = statistics.mean(samples)
+    return {
+        "mean_ms": mean,
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95)],
+        "p99_ms": samples[int(len(samples) * 0.99)],
+        "fps": 1000 / mean if mean else float("inf"),
+    }
+
+
+def run(frames):
+    results = {}
+    for size in SIZES:
+        for dpr in DPRS:
+            for mode, state in scenarios():
+                key = f"{size}px@{dpr}x/{mode}/{state}"
+                results[key] = measure(size, dpr, mode, state, frames)
+                r = results[key]
+                print(f"{key:<36} {r['fps']:>10.0f} fps  p50 {r['p50_ms']:.4f}  "
+                      f"p95 {r['p95_ms']:.4f}  p99 {r['p99_ms']:.4f} ms")
+    return results
+
+
+def compare(results, baseline_path, tolerance):
+    """与基线比较 p50，超过容差视为回归"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if r["p50_ms"] > base["p50_ms"] * (1 + tolerance):
+            regressions.append((key, base["p50_ms"], r["p50_ms"]))
+    for key, before, after in regressions:
+        print(f"[回归] {key}: p50 {before:.4f} → {after:.4f} ms")
+    print(f"比较完成：{len(results)} 项，回归 {len(regressions)} 项（容差 {tolerance:.0%}）")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TimerRenderer 离屏绘制基准")
+    parser.add_argument("--frames", type=int, default=200, help="每个场景测量的帧数")
+    parser.add_argument("--save", metavar="PATH", help="把结果保存为基线 JSON")
+    parser.add_argument("--compare", metavar="PATH", help="与基线 JSON 比较，出现回归时返回非零")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="允许的 p50 变慢比例")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    results = run(args.frames)
+
+    ok = True
+    if args.compare:
+        ok = compare(results, args.compare, args.tolerance)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {"platform": platform.platform(), "python": platform.python_version(), "frames": args.frames},
+                "results": results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"基线已保存: {args.save}")
+    del app
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+放映检测基准：轮询后端与事件驱动后端的唤醒次数对比
+
+在虚拟时钟上让幻灯片模式空闲 --hours 小时，中间放映 --show 分钟，
+分别用轮询后端（每秒完整扫描一次）和脚本化的事件驱动后端驱动 SlideTimer。
+在 Windows 上另外测量一次真实的完整窗口扫描耗时。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_slide_detect [--hours 8] [--show 20]
+"""
+import argparse
+import sys
+import time
+
+from config.settings import APP_CONFIG
+from core.scheduler import ManualDriver, TickScheduler
+from core.system.detector import ScriptedDetector, SlideshowDetector
+from core.timer.clock import VirtualClock
+from core.timer.events import EventRecorder
+from core.timer.slide_timer import SlideTimer
+
+PID = 4242
+TITLE = "PowerPoint 幻灯片放映 - [演示文稿.pptx]"
+
+
+def run(make_detector, hours, show_minutes):
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+    show_start = hours * 3600 / 2
+    show_end = show_start + show_minutes * 60
+    detector = make_detector(clock, scheduler, show_start, show_end)
+    timer = SlideTimer(EventRecorder(), clock, scheduler, detector=detector)
+    start = time.perf_counter()
+    timer.activate()
+    wakeups = clock.run(scheduler, hours * 3600)
+    return wakeups, time.perf_counter() - start, detector
+
+
+class PollingBaseline(SlideshowDetector):
+    """原来的检测方式：在调度器上每秒完整扫描一次（只用作对照）"""
+
+    def __init__(self, scan, scheduler, interval=1.0):
+        super().__init__()
+        self.scan = scan  # 返回 (pid, 窗口标题)，没有放映时返回 None
+        self.scheduler = scheduler
+        self.interval = interval
+        self.job = None
+        self.scans = 0
+
+    def start(self):
+        self.poll()
+        if self.job is None:
+            self.job = self.scheduler.call_every(self.interval, self.poll, "slide-detect")
+
+    def stop(self):
+        self.scheduler.cancel(self.job)
+        self.job = None
+        super().stop()
+
+    def poll(self):
+        self.scans += 1
+        self.publish(*(self.scan() or (None, "")))
+
+
+def polling(clock, scheduler, show_start, show_end):
+    return PollingBaseline(lambda: (PID, TITLE) if show_start <= clock.monotonic() < show_end else None, scheduler)
+
+
+def scripted(clock, scheduler, show_start, show_end):
+    return ScriptedDetector([(show_start, PID, TITLE), (show_end, None, "")], scheduler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="放映检测基准")
+    parser.add_argument("--hours", type=float, default=8.0, help="模拟时长（小时）")
+    parser.add_argument("--show", type=float, default=20.0, help="中间放映的分钟数")
+    args = parser.parse_args()
+    APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION = int(args.show)
+
+    for label, factory in (("轮询", polling), ("事件驱动", scripted)):
+        wakeups, elapsed, detector = run(factory, args.hours, args.show)
+        scans = getattr(detector, "scans", 0)
+        print(f"{label:<6} 唤醒 {wakeups:>6} 次, 完整扫描 {scans:>6} 次, 耗时 {elapsed * 1000:.1f} ms")
+
+    if sys.platform == "win32":
+        from core.system.powerpoint import get_powerpoint_slideshow
+        rounds = 50
+        start = time.perf_counter()
+        for _ in range(rounds):
+            get_powerpoint_slideshow()
+        print(f"真实窗口扫描: 每次 {(time.perf_counter() - start) / rounds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+十分之一秒显示基准：临界窗口内 10 Hz 文字刷新的 CPU 开销
+
+依次测量：窗口外（每秒刷新）与窗口内（10 Hz 只刷新文字），并给出单帧文字绘制的耗时作参考。
+窗口内比窗口外多出的 CPU 超过预算时返回非零（窗口外的开销主要是脉冲动画）。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_tenths [--seconds 5] [--budget 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEventLoop, QRect, QTimer
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+from config.settings import APP_CONFIG
+from core.display.text import TimeTextRenderer
+from core.scheduler import SCHEDULER
+
+
+def run_loop(seconds):
+    """在真实事件循环里跑 seconds 秒，返回 (每秒 CPU 毫秒, 每秒唤醒次数)"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    cpu_start = time.process_time()
+    loop.exec_()
+    cpu = (time.process_time() - cpu_start) * 1000 / seconds
+    return cpu, SCHEDULER.stats(seconds)["wakeups_per_second"]
+
+
+def bench_draw(frames):
+    """每帧换一个十分之一秒文字，返回单帧文字绘制耗时（微秒）"""
+    renderer = TimeTextRenderer()
+    image = QImage(120, 120, QImage.Format_ARGB32_Premultiplied)
+    rect = QRect(0, 0, 120, 120)
+    texts = [renderer.format_tenths(tenths) for tenths in range(150, 0, -1)]
+
+    painter = QPainter(image)
+    start = time.perf_counter()
+    for i in range(frames):
+        renderer.text = texts[i % len(texts)]
+        renderer.draw(painter, rect)
+    elapsed = (time.perf_counter() - start) / frames * 1e6
+    painter.end()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="十分之一秒显示基准")
+    parser.add_argument("--seconds", type=float, default=5.0, help="每组测量的秒数")
+    parser.add_argument("--budget", type=float, default=20.0, help="窗口内允许增加的 CPU（毫秒/秒）")
+    parser.add_argument("--frames", type=int, default=3000, help="绘制对比的帧数")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from ui.main_window import CountdownBall
+
+    APP_CONFIG.SHOW_TENTHS = True
+    ball = CountdownBall()
+    ball.show()
+    timer = ball.mode_manager.get_current_timer()
+
+    # 窗口外：剩余时间远大于临界阈值
+    timer.start_countdown(10)
+    run_loop(0.5)
+    outside = run_loop(args.seconds)
+
+    # 窗口内：剩余时间刚好覆盖测量时长
+    timer.remaining = APP_CONFIG.CRITICAL_THRESHOLD + 0.5
+    timer.schedule_thresholds()
+    window = args.seconds + 1.0
+    if APP_CONFIG.CRITICAL_THRESHOLD < window:
+        print(f"[提示] 临界阈值 {APP_CONFIG.CRITICAL_THRESHOLD} 秒短于测量时长，窗口内数据会包含结束后的空闲")
+    run_loop(0.5)
+    inside = run_loop(args.seconds)
+    timer.reset()
+
+    draw = bench_draw(args.frames)
+
+    print(f"窗口外（整秒刷新）: CPU {outside[0]:.1f} ms/s, 唤醒 {outside[1]:.1f} 次/秒")
+    extra = inside[0] - outside[0]
+    print(f"窗口内（10 Hz 文字）: CPU {inside[0]:.1f} ms/s, 唤醒 {inside[1]:.1f} 次/秒")
+    print(f"增加: CPU +{extra:.1f} ms/s（预算 {args.budget:.0f} ms/s）, 唤醒 +{inside[1] - outside[1]:.1f} 次/秒")
+    print(f"十分之一秒文字单帧绘制: {draw:.1f} µs（每秒 10 帧，只占增加部分的很小一部分，主要开销是窗口重绘）")
+    del app
+    sys.exit(0 if extra <= args.budget else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+计时核心基准：不依赖 Qt，在虚拟时钟上跑完整场景
+
+有显示监听时每个模拟秒都要唤醒一次调度器（每次约几微秒），百万秒的倒计时要数秒；
+只关心提醒、不接收显示刷新的模拟（TimerEvents 没有实现任何显示方法）只在阈值和结束时醒来；
+牛马模式的到点提醒在刷新里发出，不走这条捷径。
+
+用法（在项目根目录执行）:
+    python -m benchmark.bench_timer_core [--ticks 1000000]
+"""
+import argparse
+import time
+from datetime import datetime
+
+from core.scheduler import ManualDriver, TickScheduler
+from core.timer.clock import VirtualClock
+from core.timer.cow_timer import CowTimer
+from core.timer.events import EventRecorder, TimerEvents
+from core.timer.normal_timer import NormalTimer
+
+
+class AlertEvents(TimerEvents):
+    """只接收颜色与结束提醒，不接收显示刷新"""
+
+    def __init__(self):
+        self.alerts = 0
+
+    def set_color_state(self, state):
+        self.alerts += 1
+
+    def flash_alert(self):
+        self.alerts += 1
+
+
+class CountingEvents(TimerEvents):
+    """只计数不记录，避免百万级事件占用内存"""
+
+    def __init__(self):
+        self.displays = 0
+
+    def update_display(self, remaining):
+        self.displays += 1
+
+
+def make_scheduler(clock):
+    return TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+
+
+def bench_cow_day():
+    """牛马模式：从 8:00 跑满 8 小时"""
+    clock = VirtualClock(datetime(2025, 1, 6, 8, 0))
+    scheduler = make_scheduler(clock)
+    events = EventRecorder(clock)
+    timer = CowTimer(events, clock, scheduler)
+    start = time.perf_counter()
+    timer.activate()
+    wakeups = clock.run(scheduler, 8 * 3600)
+    elapsed = time.perf_counter() - start
+    print(f"牛马模式 8 小时: 唤醒 {wakeups} 次, 事件 {len(events.events)} 条, 耗时 {elapsed * 1000:.1f} ms")
+
+
+def bench_normal_ticks(ticks):
+    """常规模式：一次走完 ticks 秒的倒计时"""
+    clock = VirtualClock()
+    scheduler = make_scheduler(clock)
+    events = CountingEvents()
+    timer = NormalTimer(events, clock, scheduler)
+    start = time.perf_counter()
+    timer.start_countdown(ticks / 60)
+    wakeups = clock.run(scheduler, ticks + 1)
+    elapsed = time.perf_counter() - start
+    print(f"常规模式 {ticks} 秒（每秒刷新显示）: 唤醒 {wakeups} 次, 刷新 {events.displays} 次, "
+          f"耗时 {elapsed * 1000:.1f} ms, 每次 {elapsed / max(1, wakeups) * 1e6:.2f} µs")
+
+
+def bench_normal_alerts(ticks):
+    """常规模式：同样的倒计时，但只接收提醒"""
+    clock = VirtualClock()
+    scheduler = make_scheduler(clock)
+    events = AlertEvents()
+    timer = NormalTimer(events, clock, scheduler)
+    start = time.perf_counter()
+    timer.start_countdown(ticks / 60)
+    wakeups = clock.run(scheduler, ticks + 1)
+    elapsed = time.perf_counter() - start
+    print(f"常规模式 {ticks} 秒（只接收提醒）: 唤醒 {wakeups} 次, 提醒 {events.alerts} 次, 耗时 {elapsed * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="计时核心基准")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="常规模式倒计时的秒数")
+    args = parser.parse_args()
+    bench_cow_day()
+    bench_normal_ticks(args.ticks)
+    bench_normal_alerts(args.ticks)
+
+
+if __name__ == "__main__":
+    main()
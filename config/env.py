@@ -1,7 +1,7 @@
 import os
+import sys
 from datetime import time, datetime
 from typing import Tuple
-import win32api
 from pydantic import BaseModel, field_validator, Field, model_validator
 from dotenv import load_dotenv
 
@@ -21,7 +21,9 @@ DEFAULT_ENV = {
     "COW_MODE_MOONING_ON_TIME": "8:30",
     "COW_INCOME_PER_MONTH": "3000",
     "COW_WORKING_DAYS_PER_MONTH": "25",
-    "BALL_SIZE": '120'
+    "BALL_SIZE": '120',
+    "ANIMATION_MAX_FPS": "20",
+    "SHOW_TENTHS": "0"
 }
 
 if not os.path.exists(ENV_PATH):
@@ -44,7 +46,15 @@ def reset_config():
 
         load_dotenv(ENV_PATH)
 
-        win32api.MessageBox(0, '配置已重置！重启软件生效！', '成功', 0)
+        if sys.platform == "win32":
+            import win32api  # 仅 Windows 可用，放在这里使配置模块可以在无界面环境下导入
+            win32api.MessageBox(0, '配置已重置！重启软件生效！', '成功', 0)
+        else:
+            from PyQt5.QtWidgets import QApplication, QMessageBox
+            if QApplication.instance() is not None:
+                QMessageBox.information(None, '成功', '配置已重置！重启软件生效！')
+            else:
+                print("[INFO] 配置已重置！重启软件生效！")
 
     except Exception as e:
         print(f"[ERROR] 重置配置失败: {e}")
@@ -130,6 +140,12 @@ class CountdownConfig(BaseModel):
     # 球体大小
     ball_size: int = Field(default=120, ge=1, le=500)
 
+    # 脉冲动画最高帧率
+    animation_max_fps: int = Field(default=20, ge=1, le=60)
+
+    # 临界阈值以内显示十分之一秒
+    show_tenths: bool = Field(default=False)
+
     # ----- 字段级校验 -----
     @field_validator(
         'cow_mode_odd_week_lunch_time',
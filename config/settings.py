@@ -27,6 +27,8 @@ class AppConfig:
         self.INCOME_PER_MONTH = config.cow_income_per_month
         self.WORKING_DAYS_PER_MONTH = config.cow_working_days_per_month
         self.BALL_SIZE = config.ball_size
+        self.ANIMATION_MAX_FPS = config.animation_max_fps
+        self.SHOW_TENTHS = config.show_tenths
 
     def reload(self):
         """重新加载配置"""
@@ -0,0 +1,97 @@
+import math
+import time
+
+from config.settings import APP_CONFIG
+from core.scheduler import SCHEDULER
+
+
+class FrameTicker:
+    """动画帧时钟
+
+    所有悬浮球的脉冲动画共用一个周期任务，只要还有订阅者就按
+    ANIMATION_MAX_FPS 唤醒一次，依次驱动每个订阅的控制器；相位从同一原点推算，
+    多个球的脉冲保持同步。
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.origin = clock()
+        self.subscribers = []
+        self.job = None
+
+    def subscribe(self, controller):
+        if controller not in self.subscribers:
+            self.subscribers.append(controller)
+        if self.job is None:
+            interval = 1.0 / max(1, APP_CONFIG.ANIMATION_MAX_FPS)
+            self.job = SCHEDULER.call_every(interval, self.on_frame, "pulse")
+
+    def unsubscribe(self, controller):
+        if controller in self.subscribers:
+            self.subscribers.remove(controller)
+        if not self.subscribers and self.job is not None:
+            SCHEDULER.cancel(self.job)
+            self.job = None
+
+    def on_frame(self):
+        for controller in list(self.subscribers):
+            controller.on_frame()
+
+
+# 创建单例实例
+FRAME_TICKER = FrameTicker()
+
+
+class AnimationController:
+    """脉冲动画控制器
+
+    只有在脉冲可见时才推进动画时钟：窗口隐藏、最小化、收进托盘或被遮挡时
+    完全停止。相位由时间推算，帧率可以通过 ANIMATION_MAX_FPS 限制。
+    """
+
+    PHASE_SPEED = 2.0  # 相位角速度（弧度/秒），与原先每 50ms 加 0.1 一致
+
+    def __init__(self, widget, renderer, ticker=FRAME_TICKER):
+        self.widget = widget
+        self.renderer = renderer
+        self.ticker = ticker
+        self.clock = ticker.clock
+        self.origin = ticker.origin
+        self.running = False
+
+    def phase(self):
+        """当前脉冲相位（0 ~ 2π）"""
+        return ((self.clock() - self.origin) * self.PHASE_SPEED) % (2 * math.pi)
+
+    def is_visible(self):
+        """窗口当前是否真的能被看到"""
+        widget = self.widget
+        if not widget.isVisible() or widget.isMinimized():
+            return False
+        tray_handler = getattr(widget, "tray_handler", None)
+        if tray_handler is not None and tray_handler.is_in_tray:
+            return False
+        window = widget.windowHandle()
+        if window is not None and not window.isExposed():
+            return False
+        return not widget.visibleRegion().isEmpty()
+
+    def sync(self):
+        """根据当前状态启动或停止动画时钟，状态变化时调用"""
+        wanted = self.renderer.wants_pulse() and self.is_visible()
+        if wanted and not self.running:
+            self.running = True
+            self.ticker.subscribe(self)
+        elif not wanted and self.running:
+            self.stop()
+
+    def stop(self):
+        self.running = False
+        self.ticker.unsubscribe(self)
+
+    def on_frame(self):
+        if not (self.renderer.wants_pulse() and self.is_visible()):
+            # 被遮挡后由下一次 expose 重绘重新启动
+            self.stop()
+            return
+        self.renderer.refresh()
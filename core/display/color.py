@@ -22,9 +22,9 @@ class ColorManager:
             # 更新env文件
             self._update_env_file(r, g, b)
 
-            # 触发界面更新
+            # 丢弃旧颜色的预渲染图层并触发界面更新
             if self.parent:
-                self.parent.update()
+                self.parent.timer_renderer.invalidate_layers()
 
     def _update_env_file(self, r, g, b):
         """更新env文件中的颜色配置"""
@@ -0,0 +1,64 @@
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QImage, QPainter, QPixmap, QRadialGradient
+
+from config.settings import APP_CONFIG
+
+
+def state_colors(state):
+    """颜色状态对应的渐变（中心色, 边缘色）"""
+    if state == "normal":
+        return APP_CONFIG.COLOR_NORMAL, APP_CONFIG.COLOR_GRADIENT_BOTTOM
+    r, g, b = APP_CONFIG.COLOR_CRITICAL if state == "critical" else APP_CONFIG.COLOR_WARNING
+    return (r, g, b), (max(0, r - 50), max(0, g - 50), max(0, b - 50))
+
+
+class LayerCache:
+    """预渲染图层缓存
+
+    球体背景圆盘按 (宽, 高, 设备像素比, 颜色状态) 渲染成预乘 ARGB 位图，
+    每帧只需要贴图。颜色或尺寸改变时调用 invalidate()。
+    同一进程里的所有悬浮球共用一个实例（LAYER_CACHE）。
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.hits = 0
+        self.misses = 0
+
+    def background(self, width, height, dpr, state):
+        key = (width, height, dpr, state)
+        pixmap = self.layers.get(key)
+        if pixmap is None:
+            self.misses += 1
+            pixmap = self._render_background(width, height, dpr, state)
+            self.layers[key] = pixmap
+        else:
+            self.hits += 1
+        return pixmap
+
+    def invalidate(self):
+        self.layers.clear()
+
+    @staticmethod
+    def _render_background(width, height, dpr, state):
+        image = QImage(round(width * dpr), round(height * dpr), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+
+        rect = QRect(0, 0, width, height)
+        top, bottom = state_colors(state)
+        gradient = QRadialGradient(rect.center(), 60)
+        gradient.setColorAt(0, QColor(*top))
+        gradient.setColorAt(1, QColor(*bottom))
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(gradient)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(rect)
+        painter.end()
+        return QPixmap.fromImage(image)
+
+
+# 创建单例实例
+LAYER_CACHE = LayerCache()
@@ -1,8 +1,30 @@
-import math
-from PyQt5.QtCore import QTimer, Qt, QRect
-from PyQt5.QtGui import QPainter, QRadialGradient, QPen, QColor
+from weakref import WeakSet
 
-from config.settings import APP_CONFIG
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter, QPen, QColor, QRegion, QFont, QFontMetrics
+
+from core.display.animation import AnimationController
+from core.display.layers import LAYER_CACHE
+from core.display.sprites import PULSE_SPRITES, ring_geometry
+from core.display.text import TimeTextRenderer
+from core.scheduler import SCHEDULER
+from core.timer.countdowns import COUNTDOWNS
+
+
+ARC_MARGIN = 10  # 进度弧线与窗口边缘的距离
+RING_GAP = 7  # 具名倒计时圆环之间的距离
+MAX_RINGS = 3  # 主球上最多显示的具名倒计时圆环数
+RING_COLORS = [(120, 200, 255), (255, 170, 60), (200, 130, 255)]
+PACING_COLORS = {"ahead": (80, 230, 120), "behind": (255, 90, 70)}  # 翻页节奏弧线：超前 / 落后
+
+RENDERERS = WeakSet()  # 进程内所有渲染器，共用图层失效时一起重绘
+
+
+def ring_region(rect, half_width):
+    """以 rect 为中线、向内外各扩 half_width 像素的环形区域"""
+    outer = QRegion(rect.adjusted(-half_width, -half_width, half_width, half_width), QRegion.Ellipse)
+    inner = QRegion(rect.adjusted(half_width, half_width, -half_width, -half_width), QRegion.Ellipse)
+    return outer.subtracted(inner)
 
 
 class TimerRenderer:
@@ -10,118 +32,240 @@ class TimerRenderer:
         self.parent = parent
         self.pulse_animation = 0  # 用于控制脉冲动画效果的数值变量
         self.indicator_rect = None  # 右上角状态显示器区域
+        self.painted = None  # 上一次绘制时各元素的状态
 
-        # 脉冲定时器
-        self.pulse_timer = QTimer(parent)
-        self.pulse_timer.timeout.connect(self.update_pulse)
-        self.pulse_timer.start(50)
+        # 脉冲动画只在可见的脉冲状态下运行
+        self.animation = AnimationController(parent, self)
+        # 预渲染的背景图层与脉冲圈精灵帧，所有悬浮球共用
+        self.layer_cache = LAYER_CACHE
+        self.pulse_sprites = PULSE_SPRITES
+        RENDERERS.add(self)
+        # 时间文字直接绘制，不再经过 QLabel
+        self.text_renderer = TimeTextRenderer()
+        # 提醒提示条（见 core.notify.OverlayBackend）
+        self.message = None
+        self.message_job = None
+        self.flash_job = None  # 闪烁提醒的下一步
 
-    def update_pulse(self):
-        """
-        定期更新脉冲动画的相位值
-        触发父窗口重绘以显示动画效果
-        """
-        self.pulse_animation = (self.pulse_animation + 0.1) % (2 * 3.14159)
-        self.parent.update()
+    def invalidate_layers(self):
+        """颜色或尺寸变化后丢弃预渲染图层（图层共用，所有悬浮球都要重绘）"""
+        self.layer_cache.invalidate()
+        self.pulse_sprites.invalidate()
+        for renderer in list(RENDERERS):
+            renderer.parent.update()
 
-    def start_flash_alert(self):  # 闪烁提醒
+    @staticmethod
+    def pulse_style(current_timer):
+        """当前状态对应的脉冲圈样式，不画脉冲时返回 None"""
+        if hasattr(current_timer, "time_or_income") and not current_timer.time_or_income:
+            return "gold"  # 牛马收入（金黄色）
+        if current_timer.total_seconds <= 0:
+            return None
+        if current_timer.is_running:
+            return "green"
+        if current_timer.remaining <= 0:  # 时间耗尽状态（红色）
+            return "red"
+        return "yellow"  # 暂停状态（黄色）
+
+    def wants_pulse(self):
+        """当前状态是否会画脉冲圈"""
+        return self.pulse_style(self.parent.mode_manager.get_current_timer()) is not None
+
+    def set_text(self, text):
+        """更新显示文字，只重绘变化的区域"""
+        self.text_renderer.set_text(text)
+        self.refresh()
+
+    def start_flash_alert(self):  # 闪烁提醒：绘制时覆盖文字颜色
         def _flash(step=0):
             if step < 6:
-                color = "red" if step % 2 == 0 else "white"
-                self.parent.time_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-                QTimer.singleShot(300, lambda: _flash(step + 1))
+                self.text_renderer.overlay_color = QColor("red") if step % 2 == 0 else QColor("white")
+                self.flash_job = SCHEDULER.call_later(0.3, lambda: _flash(step + 1), "flash")
             else:
-                self.parent.time_label.setStyleSheet("color: white; font-weight: normal;")
+                self.text_renderer.overlay_color = None
+                self.flash_job = None
+            self.refresh()
 
+        SCHEDULER.cancel(self.flash_job)
         _flash()
 
-    def paint_timer(self, event):
-        current_timer=self.parent.mode_manager.get_current_timer()
-        painter = QPainter(self.parent)
-        painter.setRenderHint(painter.Antialiasing)
-        center = self.parent.rect().center()
-        gradient = QRadialGradient(center, 60)
+    def show_message(self, text, duration=5.0):
+        """在球的下方叠加显示一条提示，duration 秒后自动消失"""
+        SCHEDULER.cancel(self.message_job)
+        self.message = text
+        self.message_job = SCHEDULER.call_later(duration, self.clear_message, "message")
+        self.refresh()
 
-        # 动态适配窗口大小
-        rect = self.parent.rect()
-        size = min(rect.width(), rect.height()) - 10  # 留20像素边距
-        x = (rect.width() - size) // 2
-        y = (rect.height() - size) // 2
-
-
-        # 根据剩余时间设置颜色
-        if current_timer.remaining == 0:
-            gradient.setColorAt(0, QColor(*APP_CONFIG.COLOR_NORMAL))
-            gradient.setColorAt(1, QColor(*APP_CONFIG.COLOR_GRADIENT_BOTTOM))
-        elif current_timer.remaining <0 or current_timer.remaining <= APP_CONFIG.CRITICAL_THRESHOLD:
-            r, g, b = APP_CONFIG.COLOR_CRITICAL
-            gradient.setColorAt(0, QColor(r, g, b))
-            gradient.setColorAt(1, QColor(max(0, r - 50), max(0, g - 50), max(0, b - 50)))
-        elif current_timer.remaining <= APP_CONFIG.WARNING_THRESHOLD:
-            r, g, b = APP_CONFIG.COLOR_WARNING
-            gradient.setColorAt(0, QColor(r, g, b))
-            gradient.setColorAt(1, QColor(max(0, r - 50), max(0, g - 50), max(0, b - 50)))
-        else:
-            gradient.setColorAt(0, QColor(*APP_CONFIG.COLOR_NORMAL))
-            gradient.setColorAt(1, QColor(*APP_CONFIG.COLOR_GRADIENT_BOTTOM))
+    def clear_message(self):
+        SCHEDULER.cancel(self.message_job)
+        self.message = None
+        self.message_job = None
+        self.refresh()
+
+    def detach(self):
+        """窗口关闭时调用：停掉动画和待执行的回调，不再参与共用图层的重绘"""
+        self.animation.stop()
+        SCHEDULER.cancel(self.flash_job)
+        self.flash_job = None
+        self.text_renderer.overlay_color = None
+        self.clear_message()
+        RENDERERS.discard(self)
+
+    @staticmethod
+    def message_geometry(rect):
+        """提示条区域：球的下部居中"""
+        height = max(12, int(rect.height() * 0.17))
+        return QRect(int(rect.width() * 0.1), int(rect.height() * 0.68), int(rect.width() * 0.8), height)
 
+    def arc_angle(self, current_timer):
+        """进度弧线的角度（1/16 度），没有进度时返回 None"""
+        if current_timer.total_seconds > 0 and current_timer.remaining > 0:
+            progress = 1.0 - (current_timer.remaining / current_timer.total_seconds)
+            return int(progress * 360 * 16)
+        return None
 
-        painter.setBrush(gradient)
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(self.parent.rect())
+    @staticmethod
+    def pacing_arc(current_timer):
+        """翻页节奏弧线 (起始角, 跨度)（1/16 度）：与进度弧线同一圆周，从计划位置画到实际位置"""
+        pacing = getattr(current_timer, "pacing", None)
+        total = current_timer.total_seconds
+        if pacing is None or total <= 0:
+            return None
+        positions = pacing()
+        if positions is None:
+            return None
+        planned, elapsed = (int(min(max(value / total, 0.0), 1.0) * 360 * 16) for value in positions)
+        if planned == elapsed:
+            return None
+        return 90 * 16 - planned, planned - elapsed
 
+    @staticmethod
+    def ring_rect(rect, index):
+        """第 index 个具名倒计时圆环的中线矩形（在进度弧线内侧）"""
+        margin = ARC_MARGIN + RING_GAP * (index + 1)
+        return rect.adjusted(margin, margin, -margin, -margin)
 
-        # 脉冲动画 - 金黄色 + 自适应窗口大小
-        if hasattr(current_timer, "time_or_income") and not current_timer.time_or_income:
-            pulse_value = abs(math.sin(self.pulse_animation)) * 0.5 + 0.5
-            pulse_color = QColor(255, 200, 0, int(180 * pulse_value))
-            painter.setBrush(Qt.NoBrush)
-            painter.setPen(QPen(pulse_color, 5))
-            painter.drawEllipse(x, y, size, size)
+    def ring_angles(self):
+        """球上显示的具名倒计时圆环角度（整度数，用于比较是否需要重绘）"""
+        if not getattr(self.parent, "show_rings", True):
+            return ()
+        return tuple(int(progress * 360) for _, progress in COUNTDOWNS.rings()[:MAX_RINGS])
 
-        else:
-            if current_timer.total_seconds > 0:
-                if current_timer.is_running:
-                    pulse_value = abs(math.sin(self.pulse_animation)) * 0.5 + 0.5
-                    pulse_color = QColor(0, 255, 0, int(100 * pulse_value))
-                    painter.setBrush(Qt.NoBrush)
-                    painter.setPen(QPen(pulse_color, 4))
-                    painter.drawEllipse(x, y, size, size)
-                elif current_timer.remaining <= 0:  # 时间耗尽状态（红色）
-                    pulse_value = abs(math.sin(self.pulse_animation)) * 0.5 + 0.5
-                    pulse_color = QColor(255, 0, 0, int(100 * pulse_value))
-                    painter.setBrush(Qt.NoBrush)
-                    painter.setPen(QPen(pulse_color, 4))
-                    painter.drawEllipse(x, y, size, size)
-                else:  # 暂停状态（黄色）
-                    pulse_value = abs(math.sin(self.pulse_animation)) * 0.5 + 0.5
-                    pulse_color = QColor(255, 200, 0, int(150 * pulse_value))
-                    painter.setBrush(Qt.NoBrush)
-                    painter.setPen(QPen(pulse_color, 6))
-                    painter.drawEllipse(x, y, size, size)
-
-        # 获取当前窗口尺寸
-        rect = self.parent.rect()
+    @staticmethod
+    def indicator_geometry(rect):
+        """右上角状态指示器区域"""
         size = min(rect.width(), rect.height())
+        indicator_size = max(8, int(size * 0.08))
+        indicator_margin = max(5, int(size * 0.03))
+        return QRect(rect.width() - indicator_margin - indicator_size, indicator_margin, indicator_size, indicator_size)
+
+    def frame_state(self, current_timer):
+        """当前帧各可视元素的状态，用于判断哪些区域需要重绘"""
+        rect = self.parent.rect()
+        style = self.pulse_style(current_timer)
+        indicator = None
+        if current_timer.total_seconds > 0 and current_timer.get_status_text() == "normal":
+            indicator = current_timer.is_running
+        overlay = self.text_renderer.overlay_color
+        return {
+            "background": (rect.width(), rect.height(), self.parent.devicePixelRatioF(), current_timer.color),
+            "pulse": (style, self.pulse_sprites.frame_index(self.animation.phase())) if style else None,
+            "arc": self.arc_angle(current_timer),
+            "pacing": self.pacing_arc(current_timer),
+            "rings": self.ring_angles(),
+            "indicator": indicator,
+            "text": (self.text_renderer.text, overlay.rgba() if overlay else None),
+            "message": self.message,
+        }
+
+    def dirty_region(self, key, state):
+        """元素在新旧两帧中占用的区域"""
+        rect = self.parent.rect()
+        if key == "pulse":
+            x, y, size = ring_geometry(rect.width(), rect.height())
+            return ring_region(QRect(x, y, size, size), 5)
+        if key in ("arc", "pacing"):
+            return ring_region(rect.adjusted(ARC_MARGIN, ARC_MARGIN, -ARC_MARGIN, -ARC_MARGIN), 4)
+        if key == "indicator":
+            return QRegion(self.indicator_geometry(rect).adjusted(-2, -2, 2, 2))
+        if key == "rings":
+            region = QRegion()
+            for index in range(max(len(state), len(self.painted["rings"]))):
+                region = region.united(ring_region(self.ring_rect(rect, index), 3))
+            return region
+        if key == "message":
+            return QRegion(self.message_geometry(rect).adjusted(-2, -2, 2, 2))
+        # 文字：旧文字和新文字的外接矩形
+        region = QRegion(self.text_renderer.text_rect(rect, state[0]))
+        return region.united(QRegion(self.text_renderer.text_rect(rect, self.painted["text"][0])))
+
+    def refresh(self):
+        """只重绘自上一帧以来发生变化的元素"""
+        state = self.frame_state(self.parent.mode_manager.get_current_timer())
+        if self.painted is None or state["background"] != self.painted["background"]:
+            self.parent.update()
+            return
+        region = QRegion()
+        for key in ("pulse", "arc", "pacing", "rings", "indicator", "text", "message"):
+            if state[key] != self.painted[key]:
+                region = region.united(self.dirty_region(key, state[key]))
+        if not region.isEmpty():
+            self.parent.update(region)
+
+    def paint_timer(self, event):
+        current_timer=self.parent.mode_manager.get_current_timer()
+        # 重新露出（expose）时会走到这里，顺便恢复动画时钟
+        self.animation.sync()
+        self.pulse_animation = self.animation.phase()
+        self.painted = self.frame_state(current_timer)
+        painter = QPainter(self.parent)
+        self.draw(painter, current_timer, self.parent.rect(), self.parent.devicePixelRatioF())
+        painter.end()
+
+    def draw(self, painter, current_timer, rect, dpr):
+        painter.setRenderHint(painter.Antialiasing)
+
+        # 按颜色状态（由阈值事件维护）选择预渲染的背景圆盘
+        background = self.layer_cache.background(
+            rect.width(), rect.height(), dpr, current_timer.color
+        )
+        painter.drawPixmap(0, 0, background)
+
+        # 脉冲动画：贴预渲染的精灵帧
+        style = self.pulse_style(current_timer)
+        if style is not None:
+            painter.drawPixmap(0, 0, self.pulse_sprites.frame(style, rect.width(), rect.height(), dpr, self.pulse_animation))
 
         #  进度弧线
-        if current_timer.total_seconds > 0 and current_timer.remaining > 0:
-            progress = 1.0 - (current_timer.remaining / current_timer.total_seconds)
-            angle = int(progress * 360 * 16)
-            arc_margin = 10
-            arc_width = rect.width() - 2 * arc_margin
-            arc_height = rect.height() - 2 * arc_margin
+        angle = self.arc_angle(current_timer)
+        if angle is not None:
             painter.setBrush(Qt.NoBrush)
             painter.setPen(QPen(QColor(255, 255, 255, 100), 5))
-            painter.drawArc(arc_margin, arc_margin, arc_width, arc_height, 90 * 16, -angle)
+            painter.drawArc(rect.adjusted(ARC_MARGIN, ARC_MARGIN, -ARC_MARGIN, -ARC_MARGIN), 90 * 16, -angle)
+
+        # 翻页节奏弧线：超前为绿色（计划位置在前），落后为红色（盖在进度弧线上）
+        pacing = self.pacing_arc(current_timer)
+        if pacing is not None:
+            start, span = pacing
+            r, g, b = PACING_COLORS["ahead" if span > 0 else "behind"]
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(QColor(r, g, b, 220), 3))
+            painter.drawArc(rect.adjusted(ARC_MARGIN, ARC_MARGIN, -ARC_MARGIN, -ARC_MARGIN), start, span)
+
+        # 具名倒计时圆环：底环 + 剩余部分
+        for index, angle in enumerate(self.ring_angles()):
+            r, g, b = RING_COLORS[index % len(RING_COLORS)]
+            ring = self.ring_rect(rect, index)
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(QColor(r, g, b, 60), 3))
+            painter.drawEllipse(ring)
+            painter.setPen(QPen(QColor(r, g, b, 220), 3))
+            painter.drawArc(ring, 90 * 16, -(360 - angle) * 16)
 
         #状态指示器
         if current_timer.total_seconds > 0 and current_timer.get_status_text() == "normal":
-            indicator_size = max(8, int(size * 0.08))
-            indicator_margin = max(5, int(size * 0.03))
-            x = rect.width() - indicator_margin - indicator_size
-            y = indicator_margin
-            self.indicator_rect = QRect(x, y, indicator_size, indicator_size)
+            self.indicator_rect = self.indicator_geometry(rect)
+            x, y, indicator_size = self.indicator_rect.x(), self.indicator_rect.y(), self.indicator_rect.width()
 
             if current_timer.is_running:
                 painter.setBrush(QColor(0, 255, 0, 200))
@@ -138,7 +282,18 @@ class TimerRenderer:
         else:
             self.indicator_rect = None
 
+        # 时间文字
+        self.text_renderer.draw(painter, rect)
 
-
-
-
+        # 提醒提示条
+        if self.message:
+            box = self.message_geometry(rect)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 140))
+            painter.drawRoundedRect(box, box.height() / 2, box.height() / 2)
+            font = QFont(self.text_renderer.font)
+            font.setPixelSize(max(8, int(box.height() * 0.6)))
+            painter.setFont(font)
+            painter.setPen(QColor(255, 255, 255, 230))
+            text = QFontMetrics(font).elidedText(self.message, Qt.ElideRight, box.width() - box.height())
+            painter.drawText(box, Qt.AlignCenter, text)
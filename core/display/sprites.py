@@ -0,0 +1,75 @@
+import math
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPixmap
+
+# 脉冲圈样式：(颜色, 最大透明度, 线宽)
+PULSE_STYLES = {
+    "gold": ((255, 200, 0), 180, 5),  # 牛马收入
+    "green": ((0, 255, 0), 100, 4),  # 运行中
+    "red": ((255, 0, 0), 100, 4),  # 时间耗尽
+    "yellow": ((255, 200, 0), 150, 6),  # 暂停
+}
+
+
+def pulse_value(phase):
+    """脉冲强度，范围 0.5 ~ 1.0"""
+    return abs(math.sin(phase)) * 0.5 + 0.5
+
+
+def ring_geometry(width, height):
+    """脉冲圈所在的正方形区域 (x, y, size)，四周留 5 像素"""
+    size = min(width, height) - 10
+    return (width - size) // 2, (height - size) // 2, size
+
+
+class PulseSprites:
+    """脉冲圈精灵帧
+
+    帧与帧之间只有透明度不同，所以按当前尺寸和设备像素比把每种样式
+    预渲染成 frames 张透明度递增的位图，绘制时按相位取最接近的一帧贴图。
+    同一进程里的所有悬浮球共用一个实例（PULSE_SPRITES）。
+    """
+
+    FRAMES = 12
+
+    def __init__(self, frames=FRAMES):
+        self.frames = frames
+        self.sheets = {}
+
+    def frame(self, style, width, height, dpr, phase):
+        key = (style, width, height, dpr)
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            sheet = self._render_sheet(style, width, height, dpr)
+            self.sheets[key] = sheet
+        return sheet[self.frame_index(phase)]
+
+    def frame_index(self, phase):
+        """相位对应的帧序号"""
+        return round((pulse_value(phase) - 0.5) * 2 * (self.frames - 1))
+
+    def invalidate(self):
+        self.sheets.clear()
+
+    def _render_sheet(self, style, width, height, dpr):
+        (r, g, b), max_alpha, pen_width = PULSE_STYLES[style]
+        x, y, size = ring_geometry(width, height)
+        sheet = []
+        for i in range(self.frames):
+            value = 0.5 + 0.5 * i / max(1, self.frames - 1)
+            image = QImage(round(width * dpr), round(height * dpr), QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(dpr)
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(QPen(QColor(r, g, b, int(max_alpha * value)), pen_width))
+            painter.drawEllipse(x, y, size, size)
+            painter.end()
+            sheet.append(QPixmap.fromImage(image))
+        return sheet
+
+
+# 创建单例实例
+PULSE_SPRITES = PulseSprites()
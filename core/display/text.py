@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QPointF, QRectF, QSizeF, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetricsF, QStaticText, QTransform
+
+from config.settings import APP_CONFIG
+
+TEXT_COLOR = QColor(255, 255, 255, 242)  # rgba(255,255,255,0.95)
+
+# 所有悬浮球共用的 QStaticText 缓存：(字体, 文字) -> QStaticText
+STATIC_TEXTS = OrderedDict()
+TENTHS_SCALE = 0.6  # 小数点及十分之一秒相对时间文字的字号比例
+
+
+def build_time_table(limit):
+    """预先生成 -limit ~ limit 秒对应的 "MM:SS" / "-MM:SS" 字符串"""
+    table = []
+    for remaining in range(-limit, limit + 1):
+        m, s = divmod(abs(remaining), 60)
+        table.append(f"-{m:02d}:{s:02d}" if remaining < 0 else f"{m:02d}:{s:02d}")
+    return table
+
+
+class TimeTextRenderer:
+    """时间文字渲染
+
+    用缓存的 QStaticText 直接画在球上，代替 QLabel.setText 触发的重新布局；
+    常用的 "MM:SS" 字符串来自预先生成的表，闪烁提醒只在绘制时换颜色。
+    排好版的文字按 (字体, 文字) 缓存在进程内共享的 STATIC_TEXTS 里。
+    """
+
+    CACHE_SIZE = 256
+
+    def __init__(self):
+        self.text = "00:00"
+        self.overlay_color = None  # 闪烁提醒时覆盖的文字颜色
+        self.static_texts = STATIC_TEXTS
+        self.set_font_size(26)
+        self.table_limit = 0
+        self.table = []
+        self.ensure_table()
+
+    def ensure_table(self):
+        """保证字符串表覆盖当前配置的最长时长"""
+        limit = max(APP_CONFIG.NORMAL_MODE_DEFAULT_DURATION, APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION) * 60
+        if limit > self.table_limit:
+            self.table_limit = limit
+            self.table = build_time_table(limit)
+
+    def format_time(self, remaining):
+        if not -self.table_limit <= remaining <= self.table_limit:
+            self.ensure_table()  # 默认时长可能在设置里调大了
+        if -self.table_limit <= remaining <= self.table_limit:
+            return self.table[remaining + self.table_limit]
+        m, s = divmod(abs(remaining), 60)
+        return f"-{m:02d}:{s:02d}" if remaining < 0 else f"{m:02d}:{s:02d}"
+
+    @staticmethod
+    def format_tenths(tenths):
+        """十分之一秒数 → “MM:SS.t” 形式的显示文字"""
+        seconds, tenth = divmod(tenths, 10)
+        m, s = divmod(seconds, 60)
+        return f"{m:02d}:{s:02d}.{tenth}"
+
+    @staticmethod
+    def is_tenths(text):
+        """是否为带十分之一秒的时间文字（收入文字也有小数点，但没有冒号）"""
+        return text[-2:-1] == "." and ":" in text
+
+    def set_text(self, text):
+        """更新要显示的文字，返回是否有变化"""
+        if text == self.text:
+            return False
+        self.text = text
+        return True
+
+    def set_font_size(self, point_size):
+        self.font = QFont("Arial", point_size, QFont.Bold)
+        self.font_key = self.font.key()
+        self.tenths_font = QFont("Arial", max(1, round(point_size * TENTHS_SCALE)), QFont.Bold)
+        self.tenths_key = self.tenths_font.key()
+        # 两种字号的上升高度，用于分秒与十分之一秒的基线对齐
+        self.ascent = QFontMetricsF(self.font).ascent()
+        self.tenths_ascent = QFontMetricsF(self.tenths_font).ascent()
+
+    def static_text(self, text, small=False):
+        """排好版的文字，small 为 True 时用十分之一秒的小字号"""
+        font, font_key = (self.tenths_font, self.tenths_key) if small else (self.font, self.font_key)
+        key = (font_key, text)
+        static = self.static_texts.get(key)
+        if static is None:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QTransform(), font)
+            self.static_texts[key] = static
+            if len(self.static_texts) > self.CACHE_SIZE:
+                self.static_texts.popitem(last=False)
+        else:
+            self.static_texts.move_to_end(key)
+        return static
+
+    def text_size(self, text):
+        """文字的 (宽, 高)"""
+        if self.is_tenths(text):
+            head = self.static_text(text[:-2]).size()
+            return head.width() + self.static_text(text[-2:], small=True).size().width(), head.height()
+        size = self.static_text(text).size()
+        return size.width(), size.height()
+
+    def text_origin(self, rect, width, height):
+        return QPointF(rect.center().x() + 0.5 - width / 2, rect.center().y() + 0.5 - height / 2)
+
+    def text_rect(self, rect, text):
+        """文字在 rect 中居中绘制时占用的区域（含抗锯齿余量）"""
+        width, height = self.text_size(text)
+        return QRectF(self.text_origin(rect, width, height), QSizeF(width, height)).toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def draw(self, painter, rect):
+        painter.setPen(self.overlay_color or TEXT_COLOR)
+        if self.is_tenths(self.text):
+            self.draw_tenths(painter, rect)
+            return
+        static = self.static_text(self.text)
+        size = static.size()
+        painter.setFont(self.font)
+        painter.drawStaticText(self.text_origin(rect, size.width(), size.height()), static)
+
+    def draw_tenths(self, painter, rect):
+        """分秒与小号的十分之一秒分两段绘制，基线对齐"""
+        head = self.static_text(self.text[:-2])
+        tail = self.static_text(self.text[-2:], small=True)
+        size = head.size()
+        origin = self.text_origin(rect, size.width() + tail.size().width(), size.height())
+        painter.setFont(self.font)
+        painter.drawStaticText(origin, head)
+        painter.setFont(self.tenths_font)
+        painter.drawStaticText(QPointF(origin.x() + size.width(), origin.y() + self.ascent - self.tenths_ascent), tail)
@@ -62,21 +62,17 @@ class MouseHandler:
         # 只有普通模式才允许暂停/继续
         if current_timer.total_seconds <= 0 or current_timer.get_status_text() != "normal":
             return
-        current_timer.is_running = not current_timer.is_running
         if current_timer.is_running:
-            current_timer.timer.start(1000)
+            current_timer.pause()
         else:
-            current_timer.timer.stop()
+            current_timer.resume()
         self.parent.update()
+        self.parent.sync_animation()
 
     def shift_cow_time_or_income(self):
         current_timer = self.parent.mode_manager.get_current_timer()
         # 只有牛马模式才切换
         if current_timer.get_status_text() != "cow":
             return
-        current_timer.time_or_income = not current_timer.time_or_income
-
-        if  current_timer.time_or_income:
-            current_timer.cow_timer.timeout.connect(current_timer.update_countdown)
-        else:
-            current_timer.cow_timer.timeout.connect(current_timer.update_income_display)
+        # 只保留一个刷新入口，不再重复连接信号
+        current_timer.shift_view()
@@ -1,12 +1,16 @@
 from core.timer.cow_timer import   CowTimer
 from core.timer.slide_timer import SlideTimer
 from core.timer.normal_timer import NormalTimer
+from core.timer.events import WidgetEvents
+from core.timer.checkpoint import CHECKPOINTS
 
 
 class ModeManager:
-    def __init__(self, parent):
+    def __init__(self, parent, checkpoints=CHECKPOINTS):
         self.parent = parent
         self.mode = "normal"
+        self.events = WidgetEvents(parent)  # 计时器通过它驱动界面
+        self.checkpoints = checkpoints
 
         # 创建不同模式的计时器实例
         self.timers = {
@@ -14,7 +18,15 @@ class ModeManager:
             "slide": SlideTimer,
             "cow": CowTimer
         }
-        self.current_timer = self.timers["normal"](self.parent)
+        # 已创建的计时器按模式缓存，切换模式时复用
+        self.instances = {}
+        self.current_timer = self._get_timer("normal")
+        self.current_timer.activate()
+
+    def _get_timer(self, mode):
+        if mode not in self.instances:
+            self.instances[mode] = self.timers[mode](self.events, checkpoints=self.checkpoints)
+        return self.instances[mode]
 
     def set_mode(self, mode):
         if mode not in self.timers:
@@ -25,13 +37,28 @@ class ModeManager:
         # 完全停止当前计时器
         self.current_timer.reset()
 
+        # 先清空旧模式的显示，新计时器激活时会画出自己的初始状态，之后未必每秒刷新
+        self.parent.update_display(0)
+
         # 切换到新计时器
         self.mode = mode
-        self.current_timer = self.timers[mode](self.parent)
-
-        # 重置显示
-        self.parent.update_display(0)
+        self.current_timer = self._get_timer(mode)
+        self.current_timer.activate()
+        self.parent.update()
+        if self.checkpoints is not None:
+            self.checkpoints.record_mode(mode)
 
+    def restore(self, state):
+        """按检查点恢复上次的模式和该模式计时器的状态"""
+        mode = state.get("mode")
+        record = state["timers"].get(mode if mode in self.timers else self.mode)  # 切换前取出，激活时可能改写
+        if mode in self.timers and mode != self.mode:
+            # 启动时计时器都是空闲的，直接切换，不走 set_mode 的重置和写盘
+            self.mode = mode
+            self.current_timer = self._get_timer(mode)
+            self.current_timer.activate()
+        if record:
+            self.current_timer.restore(record)
 
     def get_current_timer(self):
         return self.current_timer
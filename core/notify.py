@@ -0,0 +1,146 @@
+from collections import deque
+
+from core.scheduler import SCHEDULER
+from utils.logger import logger
+
+
+class Notification:
+    """一条待发送的提醒"""
+
+    __slots__ = ("title", "message", "topmost", "key", "created")
+
+    def __init__(self, title, message, topmost=False, key=None, created=0.0):
+        self.title = title
+        self.message = message
+        self.topmost = topmost  # 需要盖过全屏窗口的重要提醒
+        self.key = key if key is not None else (title, message)  # 去重键
+        self.created = created
+
+
+class NotificationBackend:
+    """提醒的展示方式，deliver 必须立即返回，不能阻塞事件循环"""
+
+    def deliver(self, notification):
+        pass
+
+
+class RecordingBackend(NotificationBackend):
+    """把送达的提醒记录下来（测试、基准与模拟使用）"""
+
+    def __init__(self):
+        self.delivered = []
+
+    def deliver(self, notification):
+        self.delivered.append((notification.title, notification.message, notification.topmost))
+
+
+class TrayBalloonBackend(NotificationBackend):
+    """系统托盘气泡"""
+
+    def __init__(self, tray_icon, duration_ms=5000):
+        self.tray_icon = tray_icon
+        self.duration_ms = duration_ms
+
+    def deliver(self, notification):
+        from PyQt5.QtWidgets import QSystemTrayIcon
+        if not QSystemTrayIcon.supportsMessages() or not self.tray_icon.isVisible():
+            return
+        icon = QSystemTrayIcon.Warning if notification.topmost else QSystemTrayIcon.Information
+        self.tray_icon.showMessage(notification.title, notification.message, icon, self.duration_ms)
+
+
+class OverlayBackend(NotificationBackend):
+    """在悬浮球上叠加显示几秒的提示条"""
+
+    def __init__(self, renderer, duration=5.0):
+        self.renderer = renderer
+        self.duration = duration
+
+    def deliver(self, notification):
+        self.renderer.show_message(notification.message, self.duration)
+
+
+class NotificationService:
+    """非阻塞提醒服务
+
+    计时器只调用 notify() 把提醒放进队列并立即返回，
+    由调度器在下一轮事件循环里逐条发给各个后端。
+    同一去重键在 dedup_window 秒内只发一次；两条提醒之间至少间隔 min_interval 秒；
+    队列超过 max_queue 条时丢弃最旧的。
+    """
+
+    def __init__(self, scheduler=None, min_interval=2.0, dedup_window=60.0, max_queue=20):
+        self.scheduler = scheduler or SCHEDULER
+        self.min_interval = min_interval
+        self.dedup_window = dedup_window
+        self.max_queue = max_queue
+        self.backends = []
+        self.queue = deque()
+        self.recent = {}  # 去重键 -> 最近一次入队时间
+        self.last_sent = None
+        self.drain_job = None
+        self.sent = 0
+        self.duplicates = 0
+        self.overflows = 0
+
+    def add_backend(self, backend):
+        if backend not in self.backends:
+            self.backends.append(backend)
+
+    def remove_backend(self, backend):
+        if backend in self.backends:
+            self.backends.remove(backend)
+
+    def notify(self, title, message, topmost=False, key=None):
+        """提醒入队，返回是否被接受（重复的提醒会被丢弃）"""
+        now = self.scheduler.clock()
+        notification = Notification(title, message, topmost, key, now)
+        last = self.recent.get(notification.key)
+        if last is not None and now - last < self.dedup_window:
+            self.duplicates += 1
+            return False
+        self.recent[notification.key] = now
+        if len(self.recent) > 4 * self.max_queue:
+            self.recent = {k: t for k, t in self.recent.items() if now - t < self.dedup_window}
+
+        self.queue.append(notification)
+        if len(self.queue) > self.max_queue:
+            self.queue.popleft()
+            self.overflows += 1
+        self._schedule_drain()
+        return True
+
+    def _schedule_drain(self):
+        if self.drain_job is not None or not self.queue:
+            return
+        delay = 0.0
+        if self.last_sent is not None:
+            delay = max(0.0, self.last_sent + self.min_interval - self.scheduler.clock())
+        self.drain_job = self.scheduler.call_later(delay, self._drain, "notify")
+
+    def _drain(self):
+        """发出队首的一条提醒，其余的按最小间隔排队"""
+        self.drain_job = None
+        if not self.queue:
+            return
+        notification = self.queue.popleft()
+        self.last_sent = self.scheduler.clock()
+        self.sent += 1
+        for backend in list(self.backends):
+            try:
+                backend.deliver(notification)
+            except Exception:
+                logger.exception(f"提醒发送失败: {type(backend).__name__}")
+        self._schedule_drain()
+
+    def stats(self):
+        return {
+            "queued": len(self.queue),
+            "sent": self.sent,
+            "duplicates": self.duplicates,
+            "overflows": self.overflows,
+        }
+
+
+# 创建单例实例
+NOTIFIER = NotificationService()
@@ -0,0 +1,184 @@
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+
+from utils.logger import logger
+
+
+class ScheduledJob:
+    """调度器中的一项回调"""
+
+    __slots__ = ("callback", "interval", "when", "name", "cancelled")
+
+    def __init__(self, callback, when, interval=None, name=None):
+        self.callback = callback
+        self.when = when
+        self.interval = interval  # 为 None 时只执行一次
+        self.name = name
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class QtTickDriver:
+    """用单个 QTimer 唤醒调度器"""
+
+    def __init__(self, on_wakeup):
+        from PyQt5.QtCore import QTimer, Qt
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(on_wakeup)
+
+    def arm(self, delay):
+        self.timer.start(max(0, math.ceil(delay * 1000)))
+
+    def disarm(self):
+        self.timer.stop()
+
+
+class ManualDriver:
+    """不依赖 Qt 的驱动，由调用方推进时间（见 VirtualClock.run）"""
+
+    def arm(self, delay):
+        pass
+
+    def disarm(self):
+        pass
+
+
+class TickScheduler:
+    """全局节拍调度器
+
+    所有计时器和动画都在这里登记回调，回调按截止时间放进小根堆，
+    只为最早的截止时间挂一个定时器，没有到期任务时不会唤醒。
+    时间单位统一为秒（单调时钟）。
+    """
+
+    STATS_WINDOW = 60.0  # 唤醒记录保留时长（秒）
+
+    def __init__(self, clock=time.monotonic, driver=None):
+        self.clock = clock
+        self.driver = driver
+        self._heap = []
+        self._seq = itertools.count()
+        self._cancelled = 0
+        self._armed_when = None
+        self._dispatching = False
+        self._recent_wakeups = deque()
+        self.total_wakeups = 0
+        self.total_callbacks = 0
+        self.started_at = clock()
+
+    # ----- 登记 / 取消 -----
+    def call_at(self, when, callback, name=None):
+        job = ScheduledJob(callback, when, name=name)
+        self._push(job)
+        return job
+
+    def call_later(self, delay, callback, name=None):
+        return self.call_at(self.clock() + delay, callback, name)
+
+    def call_every(self, interval, callback, name=None, first_delay=None):
+        delay = interval if first_delay is None else first_delay
+        job = ScheduledJob(callback, self.clock() + delay, interval, name)
+        self._push(job)
+        return job
+
+    def cancel(self, job):
+        if job is None or job.cancelled:
+            return
+        job.cancel()
+        self._cancelled += 1
+        # 堆里的作废项过多时整体压缩一次
+        if self._cancelled > 32 and self._cancelled > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        if not self._dispatching:
+            self._rearm()
+
+    def _push(self, job):
+        heapq.heappush(self._heap, (job.when, next(self._seq), job))
+        if self._dispatching:
+            return
+        if self._armed_when is None or job.when < self._armed_when:
+            self._rearm()
+
+    def next_deadline(self):
+        """最早的截止时间，没有任务时返回 None"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled = max(0, self._cancelled - 1)
+        return self._heap[0][0] if self._heap else None
+
+    # ----- 唤醒 -----
+    def run_due(self):
+        """执行所有已到期的回调，然后为下一个截止时间重新挂定时器"""
+        now = self.clock()
+        self._armed_when = None
+        self.total_wakeups += 1
+        self._recent_wakeups.append(now)
+        while self._recent_wakeups and self._recent_wakeups[0] < now - self.STATS_WINDOW:
+            self._recent_wakeups.popleft()
+
+        self._dispatching = True
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                self._cancelled = max(0, self._cancelled - 1)
+                continue
+            if job.interval is not None:
+                # 周期任务按原节拍对齐，落后太多则从当前时刻重新起算
+                job.when += job.interval
+                if job.when <= now:
+                    job.when = now + job.interval
+                heapq.heappush(self._heap, (job.when, next(self._seq), job))
+            else:
+                job.cancelled = True
+            self.total_callbacks += 1
+            try:
+                job.callback()
+            except Exception:
+                logger.exception(f"调度回调执行失败: {job.name or job.callback}")
+        self._dispatching = False
+        self._rearm()
+
+    def _rearm(self):
+        when = self.next_deadline()
+        if self.driver is None:
+            self.driver = QtTickDriver(self.run_due)
+        if when is None:
+            self._armed_when = None
+            self.driver.disarm()
+            return
+        self._armed_when = when
+        self.driver.arm(when - self.clock())
+
+    # ----- 统计 -----
+    def stats(self, window=10.0):
+        """
+        调度器运行统计
+
+        Args:
+            window (float): 计算唤醒频率的时间窗口（秒），不超过 STATS_WINDOW
+
+        Returns:
+            dict: 活跃任务数、累计唤醒/回调次数、最近窗口内每秒唤醒次数
+        """
+        now = self.clock()
+        window = min(window, self.STATS_WINDOW, max(now - self.started_at, 1e-9))
+        recent = sum(1 for t in self._recent_wakeups if t >= now - window)
+        return {
+            "jobs": len(self._heap) - self._cancelled,
+            "wakeups": self.total_wakeups,
+            "callbacks": self.total_callbacks,
+            "wakeups_per_second": recent / window,
+        }
+
+
+# 创建单例实例
+SCHEDULER = TickScheduler()
@@ -1,7 +1,21 @@
 
 import os
 import sys
-import winreg
+
+if sys.platform == "win32":
+    import winreg
+
+# Linux 下按 XDG 规范在 ~/.config/autostart 放 .desktop 文件
+XDG_AUTOSTART_DIR = os.path.join(os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "autostart")
+DESKTOP_FILE = os.path.join(XDG_AUTOSTART_DIR, "CountdownBall.desktop")
+
+
+def launch_command():
+    """开机时执行的命令：脚本方式运行时带上 Python 解释器"""
+    exe_path = os.path.abspath(sys.argv[0])
+    if exe_path.endswith(".py"):
+        return f'"{sys.executable}" "{exe_path}"'
+    return f'"{exe_path}"'
 
 
 class AutostartManager:
@@ -10,6 +24,12 @@ class AutostartManager:
 
     def is_autostart_enabled(self):
         """检查开机自启是否启用"""
+        if sys.platform != "win32":
+            try:
+                with open(DESKTOP_FILE, "r", encoding="utf-8") as f:
+                    return os.path.abspath(sys.argv[0]) in f.read()
+            except OSError:
+                return False
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -27,6 +47,9 @@ class AutostartManager:
 
     def set_autostart(self, enabled: bool):
         """设置开机自启"""
+        if sys.platform != "win32":
+            self.set_xdg_autostart(enabled)
+            return
         key = winreg.OpenKey(
             winreg.HKEY_CURRENT_USER,
             r"Software\Microsoft\Windows\CurrentVersion\Run",
@@ -52,3 +75,18 @@ class AutostartManager:
             except FileNotFoundError:
                 pass
         winreg.CloseKey(key)
+
+    def set_xdg_autostart(self, enabled: bool):
+        if enabled:
+            os.makedirs(XDG_AUTOSTART_DIR, exist_ok=True)
+            with open(DESKTOP_FILE, "w", encoding="utf-8") as f:
+                f.write("[Desktop Entry]\n"
+                        "Type=Application\n"
+                        "Name=CountdownBall\n"
+                        f"Exec={launch_command()}\n"
+                        "X-GNOME-Autostart-enabled=true\n")
+        else:
+            try:
+                os.remove(DESKTOP_FILE)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,144 @@
+import sys
+
+from core.scheduler import SCHEDULER
+
+
+class SlideshowDetector:
+    """
+    放映检测接口
+
+    pid / title 是当前检测到的放映（没有放映时 pid 为 None），
+    position 是放映程序报告的 (当前页, 总页数)，后端拿不到时为 None；
+    状态变化时依次调用 listeners(pid, title, position)。
+    后端自己感知变化（窗口事件、后台线程或脚本），调用方不需要定时轮询。
+    """
+
+    def __init__(self):
+        self.pid = None
+        self.title = ""
+        self.position = None
+        self.listeners = []
+
+    def add_listener(self, listener):
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def start(self):
+        """开始检测"""
+        pass
+
+    def stop(self):
+        """停止检测并清空状态（不通知 listeners）"""
+        self.pid = None
+        self.title = ""
+        self.position = None
+
+    def publish(self, pid, title="", position=None):
+        if pid is None:
+            title, position = "", None
+        if (pid, title, position) == (self.pid, self.title, self.position):
+            return
+        self.pid, self.title, self.position = pid, title, position
+        for listener in list(self.listeners):
+            listener(pid, title, position)
+
+
+class ThreadedDetector(SlideshowDetector):
+    """
+    后台线程检测后端
+
+    scan() 在 DetectionWorker 的后台线程里运行（限时、出错退避），
+    结果经排队信号回到 GUI 线程再发布。
+    interval 为 None 时不定时检测，只在 request() 时检测一次。
+    """
+
+    def __init__(self, scan, interval=1.0, timeout=2.0):
+        super().__init__()
+        from PyQt5.QtCore import Qt
+        from core.system.worker import DetectionWorker
+        self.worker = DetectionWorker(scan, interval, timeout)
+        self.worker.title_changed.connect(self.on_title_changed, Qt.QueuedConnection)
+        self.worker.position_changed.connect(self.on_position_changed, Qt.QueuedConnection)
+        self.worker.slideshow_started.connect(self.on_started, Qt.QueuedConnection)
+        self.worker.slideshow_ended.connect(self.on_ended, Qt.QueuedConnection)
+        self.pending_title = ""
+        self.pending_position = None
+
+    def start(self):
+        self.worker.start()
+
+    def stop(self):
+        self.worker.stop()
+        self.pending_title = ""
+        self.pending_position = None
+        super().stop()
+
+    def request(self):
+        self.worker.request()
+
+    def stats(self):
+        return self.worker.stats()
+
+    def on_title_changed(self, title):
+        self.pending_title = title
+        if self.pid is not None:
+            self.publish(self.pid, title, self.position)
+
+    def on_position_changed(self, position):
+        self.pending_position = position
+        if self.pid is not None:
+            self.publish(self.pid, self.title, position)
+
+    def on_started(self, pid):
+        if self.worker.thread is not None:  # 停止后才到达的信号丢弃
+            self.publish(pid, self.pending_title, self.pending_position)
+
+    def on_ended(self):
+        self.pending_title = ""
+        self.pending_position = None
+        self.publish(None)
+
+
+class ScriptedDetector(SlideshowDetector):
+    """
+    按脚本切换放映状态的假后端（测试、基准与模拟使用）
+
+    steps 为 [(单调时刻, pid 或 None, 窗口标题[, (当前页, 总页数)])]，在调度器上到点发布，
+    和事件驱动的后端一样不需要轮询，可以在任何平台上驱动 SlideTimer。
+    """
+
+    def __init__(self, steps, scheduler=None):
+        super().__init__()
+        self.steps = sorted(steps, key=lambda step: step[0])
+        self.scheduler = scheduler or SCHEDULER
+        self.jobs = []
+
+    def start(self):
+        self.stop()
+        now = self.scheduler.clock()
+        for at, *state in self.steps:
+            if at <= now:
+                self.publish(*state)  # 已经过去的步骤只保留最终状态
+            else:
+                self.jobs.append(self.scheduler.call_at(at, lambda state=state: self.publish(*state), "slide-script"))
+
+    def stop(self):
+        for job in self.jobs:
+            self.scheduler.cancel(job)
+        self.jobs = []
+        super().stop()
+
+
+def create_detector():
+    """按平台创建默认的放映检测后端"""
+    if sys.platform == "win32":
+        from core.system.powerpoint import WinEventDetector
+        return WinEventDetector()
+    if sys.platform.startswith("linux"):
+        from core.system.linux_presenters import LinuxPresentationDetector
+        return LinuxPresentationDetector()
+    return SlideshowDetector()  # 其他平台暂不支持检测，也不轮询
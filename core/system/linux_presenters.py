@@ -0,0 +1,179 @@
+import os
+
+from core.system.detector import ThreadedDetector
+from utils.logger import logger
+
+# 演示相关的进程名（/proc/<pid>/comm）→ 放映窗口的特征
+# None 表示进程运行即在放映；否则要有一个全屏窗口的 WM_CLASS 或标题含有其中某个关键字（小写比较），
+# 只是全屏还不够（Writer 全屏、看图软件 F11 都是全屏）。
+# Evince 的演示模式与 F11 全屏的窗口分不出来，所以不检测。
+PRESENTERS = {
+    "soffice.bin": ("libreoffice-impress", "presenting:"),  # Impress 放映窗口（新版标题为 “Presenting: 文稿”）
+    "okular": ("presentation",),  # Okular 演示模式单独开一个 “Presentation” 窗口
+    "pdfpc": None,  # 专门的 PDF 演示控制台，运行即放映
+    "impressive": None,
+    "pympress": None,
+}
+RECHECK_PASSES = 10  # 已知进程分这么多轮轮流复查一遍进程名
+
+
+class ProcScanner:
+    """
+    增量 /proc 扫描
+
+    每轮只列一次 /proc，只读取上一轮之后新出现的 PID 的进程名；
+    新 PID 在下一轮再读一次，避开 fork 之后还没 exec 成演示程序的瞬间。
+    其余已知 PID 每轮轮流复查一小批，RECHECK_PASSES 轮查完一遍：
+    早就在运行、后来才 exec 成演示程序的进程，以及两轮之间被复用的 PID，最迟一圈之后也会发现。
+    退出的 PID 从候选里去掉。
+    """
+
+    def __init__(self, proc="/proc", presenters=PRESENTERS):
+        self.proc = proc
+        self.presenters = presenters
+        self.seen = set()  # 上一轮的全部 PID
+        self.fresh = set()  # 上一轮新出现的 PID
+        self.recheck = []  # 本圈还没复查的已知 PID
+        self.candidates = {}  # 演示相关的进程：pid -> 进程名
+        self.reads = 0  # 读取进程信息的次数（基准与调试使用）
+
+    def scan(self):
+        """返回当前演示相关的进程 {pid: 进程名}"""
+        pids = {int(entry) for entry in os.listdir(self.proc) if entry.isdigit()}
+        new = pids - self.seen
+        for pid in new | (self.fresh & pids) | self.recheck_batch(pids):
+            name = self.read_name(pid)
+            if name in self.presenters:
+                self.candidates[pid] = name
+            else:
+                self.candidates.pop(pid, None)
+        for pid in self.seen - pids:
+            self.candidates.pop(pid, None)
+        self.fresh = new if self.seen else set()  # 第一轮之前就在的进程不必再读
+        self.seen = pids
+        return self.candidates
+
+    def recheck_batch(self, pids):
+        """本轮要复查的一小批已知 PID"""
+        if not self.seen:
+            return set()
+        if not self.recheck:
+            self.recheck = sorted(self.seen)
+        size = max(1, len(pids) // RECHECK_PASSES)
+        batch = self.recheck[-size:]
+        del self.recheck[-size:]
+        return set(batch) & pids
+
+    def read_name(self, pid):
+        self.reads += 1
+        try:
+            with open(f"{self.proc}/{pid}/comm", "r", encoding="utf-8", errors="replace") as f:
+                return f.read().strip()
+        except OSError:
+            return None  # 进程已经退出或无权读取
+
+    def cmdline(self, pid):
+        try:
+            with open(f"{self.proc}/{pid}/cmdline", "rb") as f:
+                return f.read().decode("utf-8", "replace").split("\0")
+        except OSError:
+            return []
+
+
+class X11Windows:
+    """通过 EWMH 属性读取全屏窗口的所属进程、标题和 WM_CLASS（需要 python-xlib，只在 X11 下可用）"""
+
+    def __init__(self):
+        from Xlib import display
+        self.display = display.Display()
+        self.root = self.display.screen().root
+        atom = self.display.intern_atom
+        self.client_list = atom("_NET_CLIENT_LIST")
+        self.wm_state = atom("_NET_WM_STATE")
+        self.fullscreen = atom("_NET_WM_STATE_FULLSCREEN")
+        self.wm_pid = atom("_NET_WM_PID")
+        self.wm_name = atom("_NET_WM_NAME")
+        self.utf8 = atom("UTF8_STRING")
+
+    def property(self, window, name, kind=0):
+        prop = window.get_full_property(name, kind)
+        return prop.value if prop is not None else None
+
+    def fullscreen_windows(self):
+        """{pid: [(窗口标题, WM_CLASS)]}，只包含处于全屏状态的窗口"""
+        result = {}
+        for window_id in self.property(self.root, self.client_list) or ():
+            window = self.display.create_resource_object("window", window_id)
+            try:
+                state = self.property(window, self.wm_state)
+                if state is None or self.fullscreen not in state:
+                    continue
+                pid = self.property(window, self.wm_pid)
+                if not pid:
+                    continue
+                title = self.property(window, self.wm_name, self.utf8)
+                title = title.decode("utf-8", "replace") if isinstance(title, bytes) else (title or "")
+                wm_class = " ".join(window.get_wm_class() or ())
+                result.setdefault(int(pid[0]), []).append((title, wm_class))
+            except Exception:
+                continue  # 窗口在查询过程中关闭
+        return result
+
+
+class LinuxPresentationDetector(ThreadedDetector):
+    """
+    Linux 下 LibreOffice Impress 与 PDF 演示程序的放映检测
+
+    在后台线程里每秒做一次增量 /proc 扫描；只有存在演示相关进程时才查询窗口：
+    Impress、Okular 要有标题或 WM_CLASS 像放映窗口的全屏窗口，窗口标题同时作为放映标题。
+    没有 python-xlib 或在 Wayland 下拿不到窗口信息时，Impress 只认命令行带 --show 的放映。
+    """
+
+    POLL_INTERVAL = 1.0
+
+    def __init__(self, proc="/proc"):
+        super().__init__(self.scan, interval=self.POLL_INTERVAL)
+        self.processes = ProcScanner(proc)
+        self.windows = None
+        self.windows_failed = False
+
+    def stop(self):
+        if self.worker.scans:
+            stats = self.stats()
+            logger.info(f"放映检测: 扫描 {stats['scans']} 次，超时 {stats['timeouts']} 次，"
+                        f"读取进程信息 {stats['proc_reads']} 次")
+        super().stop()
+
+    def stats(self):
+        return dict(super().stats(), proc_reads=self.processes.reads)
+
+    def fullscreen_windows(self):
+        """全屏窗口 {pid: [(标题, WM_CLASS)]}，拿不到窗口信息时返回 None"""
+        if self.windows is None and not self.windows_failed:
+            try:
+                self.windows = X11Windows()
+            except Exception as e:
+                self.windows_failed = True
+                logger.info(f"无法读取窗口信息，只按进程检测放映: {e}")
+        if self.windows is None:
+            return None
+        return self.windows.fullscreen_windows()
+
+    def scan(self):
+        """后台线程：返回 (pid, 标题) 或 None"""
+        candidates = self.processes.scan()
+        if not candidates:
+            return None
+        fullscreen = self.fullscreen_windows()
+        for pid, name in candidates.items():
+            keywords = PRESENTERS[name]
+            if fullscreen is not None:
+                for title, wm_class in fullscreen.get(pid, ()):
+                    text = f"{title} {wm_class}".lower()
+                    if keywords is None or any(keyword in text for keyword in keywords):
+                        return pid, title or name
+            if keywords is None:
+                return pid, name
+            if fullscreen is None and name == "soffice.bin" and "--show" in self.processes.cmdline(pid):
+                return pid, name
+        return None
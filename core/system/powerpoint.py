@@ -1,6 +1,10 @@
 import sys
 import psutil
 
+from core.system.detector import ThreadedDetector
+from core.system.process_cache import PROCESS_CACHE
+from utils.logger import logger
+
 if sys.platform == "win32":
     import ctypes
     from ctypes import wintypes
@@ -11,37 +15,205 @@ if sys.platform == "win32":
     GetWindowTextLengthW = user32.GetWindowTextLengthW
     GetWindowThreadProcessId = user32.GetWindowThreadProcessId
     IsWindowVisible = user32.IsWindowVisible
+    GetAncestor = user32.GetAncestor
+    SetWinEventHook = user32.SetWinEventHook
+    UnhookWinEvent = user32.UnhookWinEvent
     WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+    WINEVENTPROC = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                      wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    SetWinEventHook.restype = wintypes.HANDLE
+    SetWinEventHook.argtypes = [wintypes.UINT, wintypes.UINT, wintypes.HMODULE, WINEVENTPROC,
+                                wintypes.DWORD, wintypes.DWORD, wintypes.UINT]
+    UnhookWinEvent.argtypes = [wintypes.HANDLE]
+    GetAncestor.restype = wintypes.HWND
+    GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
 
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_HIDE = 0x8003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+# 分两段订阅，跳过中间的位置、焦点等高频事件
+HOOK_RANGES = ((EVENT_OBJECT_CREATE, EVENT_OBJECT_HIDE), (EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE))
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_ROOT = 2
 
-def get_powerpoint_slide_pid():
-    if sys.platform != "win32":
-        return None
-    slide_pids = set()
+SLIDESHOW_KEYWORDS = ("幻灯片放映", "Slide Show", "放映")
+POWERPOINT_PROCESS = "powerpnt.exe"
+
+
+def is_slideshow_title(title):
+    return any(keyword in title for keyword in SLIDESHOW_KEYWORDS)
+
+
+def window_title(hwnd):
+    length = GetWindowTextLengthW(hwnd)
+    if length == 0:
+        return ""
+    buffer = ctypes.create_unicode_buffer(length + 1)
+    GetWindowTextW(hwnd, buffer, length + 1)
+    return buffer.value
+
+
+def powerpoint_pid(hwnd):
+    """窗口属于 PowerPoint 进程时返回 PID，否则返回 None（进程名走缓存，不必每次打开进程）"""
+    pid = wintypes.DWORD()
+    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    try:
+        if PROCESS_CACHE.name(pid.value).lower() == POWERPOINT_PROCESS:
+            return pid.value
+    except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
+        pass
+    return None
+
+
+def slideshow_title(hwnd):
+    """可见且标题像放映窗口时返回标题，否则返回空字符串（不涉及进程）"""
+    if not IsWindowVisible(hwnd):
+        return ""
+    title = window_title(hwnd)
+    return title if title and is_slideshow_title(title) else ""
+
+
+def enum_slideshow_windows():
+    """枚举所有顶层窗口，返回 {hwnd: (pid, 标题)}"""
+    windows = {}
+    pruned = False
 
     def enum_window_callback(hwnd, _):
-        if not IsWindowVisible(hwnd):
-            return True
-        length = GetWindowTextLengthW(hwnd)
-        if length == 0:
+        nonlocal pruned
+        title = slideshow_title(hwnd)
+        if not title:
             return True
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        GetWindowTextW(hwnd, buffer, length + 1)
-        title = buffer.value
-        if "幻灯片放映" in title or "Slide Show" in title or "放映" in title:
-            pid = wintypes.DWORD()
-            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-            try:
-                proc = psutil.Process(pid.value)
-                if proc.name().lower() == "powerpnt.exe":
-                    slide_pids.add(pid.value)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
-                pass
+        if not pruned:
+            # 本轮第一次需要查进程时列一次 PID，清掉已退出进程的缓存
+            PROCESS_CACHE.prune(psutil.pids())
+            pruned = True
+        pid = powerpoint_pid(hwnd)
+        if pid:
+            windows[hwnd] = (pid, title)
         return True
 
+    EnumWindows(WNDENUMPROC(enum_window_callback), 0)
+    return windows
+
+
+def slide_position():
+    """
+    经 COM 读取 PowerPoint 放映的 (当前页, 总页数)，拿不到时返回 None
+
+    翻页不会改变放映窗口的标题，页码只能向 PowerPoint 要：SlideShowWindow.View.CurrentShowPosition。
+    在检测线程里调用，每次单独初始化 COM；没有 pywin32 或 PowerPoint 不响应时返回 None。
+    """
+    try:
+        import pythoncom
+        import win32com.client
+    except ImportError:
+        return None
+    pythoncom.CoInitialize()
+    try:
+        app = win32com.client.GetActiveObject("PowerPoint.Application")
+        if not app.SlideShowWindows.Count:
+            return None
+        window = app.SlideShowWindows(1)
+        index, count = window.View.CurrentShowPosition, window.Presentation.Slides.Count
+        return (index, count) if 1 <= index <= count else None  # 放映结束后的黑屏不算
+    except Exception:
+        return None
+    finally:
+        app = window = None  # 在 CoUninitialize 之前释放 COM 对象
+        pythoncom.CoUninitialize()
+
+
+def get_powerpoint_slideshow():
+    """完整扫描一遍，返回 (pid, 放映窗口标题)，没有放映时返回 None"""
+    if sys.platform != "win32":
+        return None
     try:
-        EnumWindows(WNDENUMPROC(enum_window_callback), 0)
+        windows = enum_slideshow_windows()
     except Exception as e:
         print(f"[DEBUG] 枚举窗口失败: {e}")
         return None
-    return next(iter(slide_pids)) if slide_pids else None
+    return next(iter(windows.values()), None)
+
+
+class WinEventDetector(ThreadedDetector):
+    """
+    事件驱动的 PowerPoint 放映检测
+
+    用 SetWinEventHook 订阅窗口创建、销毁、显示、隐藏和标题变化。
+    钩子是 WINEVENT_OUTOFCONTEXT 的，回调在 GUI 线程里只做廉价的过滤（是否顶层窗口、
+    标题是否像放映、是否已知的放映窗口），命中时才请求后台线程完整扫描一次；
+    没有放映相关的窗口变化时既不枚举窗口也不定时唤醒。
+    安装钩子失败时退回到后台线程每 POLL_INTERVAL 秒扫描一次。
+    翻页不产生窗口事件：放映中能经 COM 读到页码时，每 POSITION_INTERVAL 秒扫描一次跟踪页码，放映结束后恢复。
+    """
+
+    POLL_INTERVAL = 1.0
+    POSITION_INTERVAL = 1.0
+
+    def __init__(self):
+        super().__init__(self.scan, interval=None)
+        self.hwnds = frozenset()  # 最近一次扫描到的放映窗口，由后台线程整体替换
+        self.hooks = []
+        self.hooks_failed = False
+        self.callback = WINEVENTPROC(self.on_event)  # 保持引用，防止回调被回收
+
+    def start(self):
+        if not self.hooks and not self.hooks_failed:
+            flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+            for first, last in HOOK_RANGES:
+                hook = SetWinEventHook(first, last, None, self.callback, 0, 0, flags)
+                if not hook:
+                    logger.warning("安装窗口事件钩子失败，改为定时检测放映")
+                    self.unhook()
+                    self.hooks_failed = True
+                    break
+                self.hooks.append(hook)
+        self.worker.interval = self.idle_interval()
+        super().start()  # 后台线程立即扫描一次作为初始状态
+
+    def idle_interval(self):
+        """不在跟踪页码时的扫描间隔：有窗口事件钩子时为 None（只按事件扫描）"""
+        return self.POLL_INTERVAL if self.hooks_failed else None
+
+    def stop(self):
+        self.unhook()
+        if self.worker.scans:
+            stats = self.stats()
+            logger.info(f"放映检测: 扫描 {stats['scans']} 次，超时 {stats['timeouts']} 次，"
+                        f"进程缓存命中率 {stats['process_cache']['hit_rate']:.0%}")
+        super().stop()
+
+    def stats(self):
+        return dict(super().stats(), process_cache=PROCESS_CACHE.stats())
+
+    def unhook(self):
+        for hook in self.hooks:
+            UnhookWinEvent(hook)
+        self.hooks = []
+
+    def scan(self):
+        """后台线程：枚举所有顶层窗口，放映中再读一次页码"""
+        windows = enum_slideshow_windows()
+        self.hwnds = frozenset(windows)
+        show = next(iter(windows.values()), None)
+        position = slide_position() if show is not None else None
+        self.worker.interval = self.POSITION_INTERVAL if position is not None else self.idle_interval()
+        return None if show is None else show + (position,)
+
+    def on_event(self, hook, event, hwnd, id_object, id_child, thread, time_ms):
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        try:
+            if hwnd in self.hwnds:
+                self.request()  # 已知放映窗口销毁、隐藏或换标题（翻页）
+            elif event not in (EVENT_OBJECT_DESTROY, EVENT_OBJECT_HIDE) and GetAncestor(hwnd, GA_ROOT) == hwnd:
+                # 读其他进程窗口的标题不会向它发消息，窗口卡住也不会阻塞
+                if is_slideshow_title(window_title(hwnd)):
+                    self.request()
+        except Exception:
+            logger.exception("处理窗口事件失败")
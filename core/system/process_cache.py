@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+import psutil
+
+
+class ProcessInfo:
+    """缓存的进程信息"""
+
+    __slots__ = ("pid", "name")
+
+    def __init__(self, pid, name):
+        self.pid = pid
+        self.name = name
+
+
+class ProcessCache:
+    """
+    PID → 进程信息的 LRU 缓存
+
+    检测放映时每个候选窗口都要知道所属进程的名字，不缓存时每次都要打开进程查询。
+    命中时不再打开进程：每轮检测先用 prune() 按一次 PID 列表（psutil.pids()）清掉已退出的进程，
+    旧进程退出后只要列过一次 PID，条目就被清掉，这个 PID 再被复用时会重新读取。
+    只有在两次列 PID 之间退出又被复用的 PID 识别不到，间隔就是两轮放映检测之间的时间。
+    后台检测线程与超时未返回的检测线程可能同时访问，用锁保护。
+    """
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # pid -> ProcessInfo，按最近使用排序
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, pid):
+        """返回 ProcessInfo，进程不存在或无权访问时抛出 psutil 的异常"""
+        with self.lock:
+            info = self.entries.get(pid)
+            if info is not None:
+                self.entries.move_to_end(pid)
+                self.hits += 1
+                return info
+            self.misses += 1
+        info = ProcessInfo(pid, psutil.Process(pid).name())  # 查询在锁外进行
+        with self.lock:
+            self.entries[pid] = info
+            self.entries.move_to_end(pid)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return info
+
+    def name(self, pid):
+        return self.get(pid).name
+
+    def prune(self, alive_pids):
+        """清掉不在 alive_pids（最新的 PID 列表）里的进程：已经退出，PID 之后可能被复用"""
+        alive = alive_pids if isinstance(alive_pids, (set, frozenset, dict)) else set(alive_pids)
+        with self.lock:
+            for pid in [pid for pid in self.entries if pid not in alive]:
+                del self.entries[pid]
+                self.invalidations += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# 创建单例实例
+PROCESS_CACHE = ProcessCache()
@@ -36,17 +36,18 @@ class TrayHandler:
             self.show_from_tray()
 
     def show_from_tray(self):
+        # 先清除托盘标记，显示事件里动画控制器才会恢复
+        self.is_in_tray = False
         self.parent.showNormal()
         self.parent.activateWindow()
         self.parent.raise_()
-        self.is_in_tray = False
 
     def hide_to_tray(self, event=None):
         """隐藏到托盘"""
         if event:
             event.ignore()
-        self.parent.hide()
         self.is_in_tray = True
+        self.parent.hide()
 
 
 
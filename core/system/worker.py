@@ -0,0 +1,141 @@
+import threading
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from utils.logger import logger
+
+
+class DetectionWorker(QObject):
+    """
+    后台放映检测线程
+
+    在后台线程里调用 scan()（返回 (pid, 窗口标题) 或 (pid, 窗口标题, (当前页, 总页数))，没有放映时返回 None），
+    只把变化通过信号排队送回 GUI 线程，GUI 线程不再执行任何窗口枚举。
+    每次检测在单独的守护线程里运行并限时 timeout 秒：超时或出错后按指数退避拉长间隔，
+    上一次检测仍卡住时不再叠加新的检测。interval 为 None 时只在 request() 时检测。
+    """
+
+    slideshow_started = pyqtSignal(int)
+    slideshow_ended = pyqtSignal()
+    title_changed = pyqtSignal(str)  # 放映窗口标题变化，在 slideshow_started 之前发出
+    position_changed = pyqtSignal(object)  # 放映页码变化 (当前页, 总页数) 或 None，同样在 slideshow_started 之前发出
+
+    def __init__(self, scan, interval=1.0, timeout=2.0, max_backoff=30.0):
+        super().__init__()
+        self.scan = scan
+        self.interval = interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.thread = None
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+        self.hung = None  # 超时后仍在运行的检测线程
+        # 以下只在后台线程里读写
+        self.pid = None
+        self.title = ""
+        self.position = None
+        self.failures = 0
+        self.scans = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.last_duration = 0.0
+
+    def start(self):
+        """启动后台线程，立即检测一次"""
+        if self.thread is not None and self.thread.is_alive():
+            self.request()
+            return
+        self.stopped = threading.Event()  # 每次启动一个新的，旧线程看到的仍是已置位的那个
+        self.pid, self.title, self.position = None, "", None
+        self.thread = threading.Thread(target=self.run, args=(self.stopped,), name="slide-detect", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.wake.set()
+        self.thread = None
+
+    def request(self):
+        """尽快检测一次（例如收到窗口事件时）"""
+        self.wake.set()
+
+    def next_delay(self):
+        if self.failures:
+            base = self.interval or 1.0
+            return min(self.max_backoff, base * 2 ** self.failures)
+        return self.interval
+
+    def run(self, stopped):
+        delay = 0.0
+        while True:
+            if self.failures:
+                stopped.wait(delay)  # 退避期间不响应 request()
+            else:
+                self.wake.wait(delay)
+            self.wake.clear()
+            if stopped.is_set():
+                return
+            if self.scan_once():
+                self.failures = 0
+            else:
+                self.failures += 1
+            delay = self.next_delay()
+
+    def scan_once(self):
+        """检测一次，返回是否成功"""
+        if self.hung is not None and self.hung.is_alive():
+            return False  # 上一次检测还没返回，不叠加
+        self.hung = None
+        box = {}
+
+        def target():
+            try:
+                box["result"] = self.scan()
+            except Exception as e:
+                box["error"] = e
+
+        started = time.perf_counter()
+        thread = threading.Thread(target=target, name="slide-scan", daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        self.scans += 1
+        self.last_duration = time.perf_counter() - started
+        if thread.is_alive():
+            self.hung = thread
+            self.timeouts += 1
+            logger.warning(f"放映检测超过 {self.timeout:g} 秒未返回，退避后重试")
+            return False
+        if "error" in box:
+            self.errors += 1
+            logger.warning(f"放映检测失败: {box['error']}")
+            return False
+        self.deliver(box.get("result"))
+        return True
+
+    def deliver(self, result):
+        """只在状态变化时发信号"""
+        pid, title, *rest = result or (None, "")
+        position = rest[0] if rest else None
+        if pid and title != self.title:
+            self.title = title
+            self.title_changed.emit(title)
+        if pid and position != self.position:
+            self.position = position
+            self.position_changed.emit(position)
+        if pid != self.pid:
+            self.pid = pid
+            if pid:
+                self.slideshow_started.emit(pid)
+            else:
+                self.title, self.position = "", None
+                self.slideshow_ended.emit()
+
+    def stats(self):
+        return {
+            "scans": self.scans,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "failures": self.failures,
+            "last_ms": self.last_duration * 1000,
+        }
@@ -0,0 +1,72 @@
+import json
+import os
+
+from utils.logger import logger
+
+CHECKPOINT_PATH = "data/checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointStore:
+    """
+    计时状态检查点
+
+    记录当前模式、各模式计时器和具名倒计时的状态（截止时间用墙上时间的时间戳，
+    重启后仍然有效）。只在状态变化（开始、暂停、继续、结束、切换模式）时写盘，
+    先写临时文件再替换，写到一半崩溃也不会留下损坏的文件。
+    """
+
+    def __init__(self, path=CHECKPOINT_PATH):
+        self.path = path
+        self.state = self._empty()
+
+    @staticmethod
+    def _empty():
+        return {"version": CHECKPOINT_VERSION, "mode": None, "timers": {}, "countdowns": []}
+
+    def load(self):
+        """读取检查点，文件不存在或损坏时从空状态开始"""
+        self.state = self._empty()
+        if not os.path.exists(self.path):
+            return self.state
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") == CHECKPOINT_VERSION:
+                self.state.update(state)
+        except Exception as e:
+            logger.warning(f"读取检查点失败，忽略: {e}")
+        return self.state
+
+    def record_mode(self, mode):
+        if self.state["mode"] != mode:
+            self.state["mode"] = mode
+            self.write()
+
+    def record_timer(self, mode, record):
+        """记录某个模式计时器的状态，record 为 None 时删除"""
+        if record is None:
+            if self.state["timers"].pop(mode, None) is None:
+                return
+        else:
+            self.state["timers"][mode] = record
+        self.write()
+
+    def record_countdowns(self, records):
+        self.state["countdowns"] = records
+        self.write()
+
+    def write(self):
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"写入检查点失败: {e}")
+
+
+# 创建单例实例
+CHECKPOINTS = CheckpointStore()
@@ -0,0 +1,58 @@
+import time
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """真实时钟：单调时间用于计时，墙上时间用于牛马模式"""
+
+    @staticmethod
+    def monotonic():
+        return time.monotonic()
+
+    @staticmethod
+    def now():
+        return datetime.now()
+
+
+class VirtualClock:
+    """虚拟时钟，时间只在调用 advance / run 时前进，用于测试、基准与模拟"""
+
+    def __init__(self, start=None):
+        self.start = start or datetime(2025, 1, 6, 8, 0)
+        self.elapsed = 0.0
+
+    def monotonic(self):
+        return self.elapsed
+
+    def now(self):
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def advance(self, seconds):
+        self.elapsed += seconds
+
+    def run(self, scheduler, seconds):
+        """
+        推进虚拟时间并依次执行期间到期的调度任务
+
+        Args:
+            scheduler (TickScheduler): 使用本时钟的调度器
+            seconds (float): 推进的秒数
+
+        Returns:
+            int: 期间唤醒调度器的次数
+        """
+        end = self.elapsed + seconds
+        wakeups = 0
+        while True:
+            when = scheduler.next_deadline()
+            if when is None or when > end:
+                break
+            self.elapsed = max(self.elapsed, when)
+            scheduler.run_due()
+            wakeups += 1
+        self.elapsed = end
+        return wakeups
+
+
+# 创建单例实例
+SYSTEM_CLOCK = SystemClock()
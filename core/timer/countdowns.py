@@ -0,0 +1,232 @@
+import math
+from datetime import datetime, timedelta
+
+from core.notify import NOTIFIER
+from core.scheduler import SCHEDULER
+from core.timer.clock import SYSTEM_CLOCK
+
+EPSILON = 1e-6  # 与 CountdownEngine 一致，吸收截止时间加减的浮点误差
+RING_INTERVAL = 1.0  # 有圆环显示的倒计时运行时，刷新圆环的间隔（秒）
+
+
+class Countdown:
+    """一个具名倒计时
+
+    只保存截止时刻或冻结的剩余秒数，空闲时不占用调度器任务，
+    运行时也只在调度器里登记一个到点的一次性任务。
+    """
+
+    __slots__ = ("name", "total_seconds", "deadline", "frozen", "display", "job")
+
+    def __init__(self, name, seconds, display="ring"):
+        self.name = name
+        self.total_seconds = seconds
+        self.deadline = None  # 运行中：单调时钟上的截止时刻
+        self.frozen = float(seconds)  # 未运行：冻结的剩余秒数
+        self.display = display  # "ring"：主球上的圆环；"ball"：单独的悬浮球；None：不显示
+        self.job = None  # 到点任务
+
+    @property
+    def is_running(self):
+        return self.deadline is not None
+
+    def remaining_exact(self, now):
+        value = self.frozen if self.deadline is None else self.deadline - now
+        return max(0.0, value)
+
+    def remaining(self, now):
+        return math.ceil(self.remaining_exact(now) - EPSILON)
+
+    def progress(self, now):
+        """已走过的比例 0~1"""
+        if self.total_seconds <= 0:
+            return 1.0
+        return min(1.0, 1.0 - self.remaining_exact(now) / self.total_seconds)
+
+
+class CountdownManager:
+    """
+    多个具名倒计时
+
+    所有倒计时共用一个调度器：每个运行中的倒计时只登记一个到点任务，
+    圆环和单独悬浮球显示共用一个每秒一次的刷新任务，没有运行中的显示时停掉。
+    到点时通过提醒服务发出提醒，并通知 listeners（界面刷新）。
+    """
+
+    def __init__(self, clock=SYSTEM_CLOCK, scheduler=None, notifier=None):
+        self.clock = clock
+        self.scheduler = scheduler or SCHEDULER
+        self.notifier = notifier or NOTIFIER
+        self.countdowns = {}  # 名称 -> Countdown，保持添加顺序
+        self.listeners = []  # 状态变化时调用的回调，参数为 Countdown 或 None
+        self.ring_job = None
+        self.running_shown = 0  # 运行中且需要显示（圆环或悬浮球）的倒计时个数
+        self.checkpoints = None  # 设置后在状态变化时写检查点
+
+    def add_listener(self, listener):
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+            self._sync_ring_job()
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+            self._sync_ring_job()
+
+    # ---------- 增删 ----------
+    def add(self, name, seconds, display="ring", start=True):
+        """添加（或替换）一个倒计时"""
+        if name in self.countdowns:
+            self.remove(name)
+        countdown = self.countdowns[name] = Countdown(name, seconds, display)
+        if start:
+            self.start(name)
+        else:
+            self._changed(countdown)
+        return countdown
+
+    def add_until(self, name, until, display="ring"):
+        """添加一个到某个时刻（datetime.time）为止的倒计时，时刻已过则算到次日"""
+        now = self.clock.now()
+        target = datetime.combine(now.date(), until)
+        if target <= now:
+            target += timedelta(days=1)
+        return self.add(name, int((target - now).total_seconds()), display)
+
+    def remove(self, name):
+        countdown = self.countdowns.pop(name, None)
+        if countdown is not None:
+            self._stop(countdown)
+            self._changed(None)
+
+    def get(self, name):
+        return self.countdowns.get(name)
+
+    def __len__(self):
+        return len(self.countdowns)
+
+    def __iter__(self):
+        return iter(self.countdowns.values())
+
+    # ---------- 控制 ----------
+    def start(self, name):
+        """从头开始"""
+        countdown = self.countdowns[name]
+        countdown.frozen = float(countdown.total_seconds)
+        countdown.deadline = None
+        self.resume(name)
+
+    def pause(self, name):
+        countdown = self.countdowns[name]
+        if countdown.deadline is None:
+            return
+        countdown.frozen = countdown.remaining_exact(self.clock.monotonic())
+        self._stop(countdown)
+        self._changed(countdown)
+
+    def resume(self, name):
+        countdown = self.countdowns[name]
+        if countdown.deadline is not None or countdown.frozen <= 0:
+            return
+        countdown.deadline = self.clock.monotonic() + countdown.frozen
+        countdown.job = self.scheduler.call_at(countdown.deadline, lambda: self._finish(countdown), f"countdown-{name}")
+        if countdown.display is not None:
+            self.running_shown += 1
+        self._changed(countdown)
+
+    def set_display(self, name, display):
+        """切换显示方式："ring" / "ball" / None"""
+        countdown = self.countdowns[name]
+        if countdown.is_running:
+            self.running_shown += (display is not None) - (countdown.display is not None)
+        countdown.display = display
+        self._changed(countdown)
+
+    def toggle(self, name):
+        countdown = self.countdowns[name]
+        if countdown.is_running:
+            self.pause(name)
+        elif countdown.frozen > 0:
+            self.resume(name)
+        else:
+            self.start(name)
+
+    def _stop(self, countdown):
+        """取消到点任务并标记为未运行"""
+        if countdown.deadline is None:
+            return
+        if countdown.display is not None:
+            self.running_shown -= 1
+        countdown.deadline = None
+        self.scheduler.cancel(countdown.job)
+        countdown.job = None
+
+    def _finish(self, countdown):
+        self._stop(countdown)
+        countdown.frozen = 0.0
+        self.notifier.notify("倒计时", f"「{countdown.name}」时间到", topmost=True,
+                             key=("countdown", countdown.name, self.clock.monotonic()))
+        self._changed(countdown)
+
+    # ---------- 显示 ----------
+    def remaining(self, name):
+        return self.countdowns[name].remaining(self.clock.monotonic())
+
+    def rings(self):
+        """圆环显示的倒计时：[(Countdown, 进度 0~1)]"""
+        now = self.clock.monotonic()
+        return [(countdown, countdown.progress(now)) for countdown in self.countdowns.values()
+                if countdown.display == "ring" and (countdown.is_running or countdown.frozen > 0)]
+
+    # ---------- 检查点 ----------
+    def snapshot(self):
+        """所有倒计时的状态，运行中的截止时刻换成墙上时间的时间戳"""
+        now = self.clock.monotonic()
+        wall = self.clock.now().timestamp()
+        return [{
+            "name": countdown.name,
+            "total": countdown.total_seconds,
+            "frozen": countdown.frozen,
+            "deadline": wall + countdown.deadline - now if countdown.is_running else None,
+            "display": countdown.display,
+        } for countdown in self.countdowns.values()]
+
+    def restore(self, records):
+        """按检查点重建倒计时，关闭期间已经到点的直接走结束流程"""
+        checkpoints, self.checkpoints = self.checkpoints, None  # 恢复过程中不写盘
+        wall = self.clock.now().timestamp()
+        for record in records:
+            countdown = self.add(record["name"], record["total"], record.get("display"), start=False)
+            countdown.frozen = float(record.get("frozen", record["total"]))
+            if record.get("deadline") is not None:
+                left = record["deadline"] - wall
+                if left > EPSILON:
+                    countdown.frozen = left
+                    self.resume(countdown.name)
+                else:
+                    self._finish(countdown)
+        self.checkpoints = checkpoints
+
+    def _changed(self, countdown):
+        if self.checkpoints is not None:
+            self.checkpoints.record_countdowns(self.snapshot())
+        self._sync_ring_job()
+        for listener in list(self.listeners):
+            listener(countdown)
+
+    def _sync_ring_job(self):
+        """有运行中且需要显示的倒计时才保留刷新任务"""
+        wanted = self.listeners and self.running_shown > 0
+        if wanted and self.ring_job is None:
+            self.ring_job = self.scheduler.call_every(RING_INTERVAL, self._ring_tick, "countdown-rings")
+        elif not wanted and self.ring_job is not None:
+            self.scheduler.cancel(self.ring_job)
+            self.ring_job = None
+
+    def _ring_tick(self):
+        for listener in list(self.listeners):
+            listener(None)
+
+
+# 创建单例实例
+COUNTDOWNS = CountdownManager()
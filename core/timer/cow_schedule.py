@@ -0,0 +1,66 @@
+from bisect import bisect_right
+from datetime import datetime, time
+
+from config.settings import APP_CONFIG
+from core.timer.work_calendar import WORK_CALENDAR
+
+DAY_SECONDS = 24 * 3600
+
+
+def seconds_of(t):
+    """time → 当天零点起的秒数"""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+class CowDaySchedule:
+    """
+    牛马模式的单日时间表
+
+    每天编译一次，把一天切成若干段，每段记录倒计时目标与到点提示，
+    之后每次刷新只需要一次二分查找。跨过零点时重新编译。
+    是否上班由工作日历（见 WorkCalendar）决定，休息日只有一段。
+
+    段表元素: (起点秒, 名称, 倒计时目标秒 或 None, 提示)
+    """
+
+    def __init__(self, day, on_time, lunch_time, off_time, working=True, note=""):
+        self.day = day
+        self.working = working
+        self.note = note  # 节假日 / 调休备注
+        self.midnight = datetime.combine(day, time(0))
+        if not working:
+            # 休息日整天只有一段，没有倒计时，也没有收入
+            self.segments = [(0, "rest", None, note or "休息日")]
+            self.starts = [0]
+            self.work_start = self.work_end = 0
+            return
+        on, lunch, off = seconds_of(on_time), seconds_of(lunch_time), seconds_of(off_time)
+        lunch = max(lunch, 0)
+        off = max(off, lunch)
+        on = min(on, lunch)
+        # 午休没有单独配置结束时间，午休开始后直接倒数到下班
+        self.segments = [
+            (0, "before_start", lunch, "干饭第一！"),
+            (on, "morning", lunch, "干饭第一！"),
+            (lunch, "afternoon", off, "再加会吧，公司招你亏麻了！"),
+            (off, "after_off", None, "已下班"),
+        ]
+        self.starts = [segment[0] for segment in self.segments]
+        self.work_start = on
+        self.work_end = off
+
+    @classmethod
+    def compile(cls, day, calendar=WORK_CALENDAR):
+        """按工作日历、配置和 ISO 周的单双周编译某天的时间表"""
+        calendar.refresh()
+        week_number = day.isocalendar()[1]
+        lunch_time = APP_CONFIG.COW_MODE_ODD_WEEK_LUNCH_TIME if week_number % 2 == 1 else APP_CONFIG.COW_MODE_EVEN_WEEK_LUNCH_TIME
+        return cls(day, APP_CONFIG.COW_MODE_MOONING_ON_TIME, lunch_time, APP_CONFIG.COW_MODE_AFTERNOON_OFF_TIME,
+                   working=calendar.is_working_day(day), note=calendar.note(day))
+
+    def offset(self, now):
+        """now 距当天零点的秒数（浮点）"""
+        return (now - self.midnight).total_seconds()
+
+    def segment_at(self, offset):
+        return self.segments[bisect_right(self.starts, offset) - 1]
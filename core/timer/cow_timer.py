@@ -1,123 +1,142 @@
-import win32api
-from PyQt5.QtCore import QTimer
+import math
+
+from core.timer.clock import SYSTEM_CLOCK
+from core.timer.cow_schedule import CowDaySchedule, DAY_SECONDS
+from core.timer.income import INCOME_PREFIX, INCOME_VIEWS, SUBSCRIPT_TABLE, IncomeEngine, format_income
+from core.timer.thresholds import color_state
 from core.timer.timerbase import TimerBase
-from config.settings import APP_CONFIG
-import datetime
-from datetime import datetime
 
 
 class CowTimer(TimerBase):
-    """牛马模式计时类"""
+    """牛马模式计时类
+
+    时间表每天按工作日历编译一次（见 CowDaySchedule），每次刷新后算出显示文字下一次
+    变化的时刻再醒来，下班后整晚不再唤醒，直到次日零点重新编译。
+    """
 
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.cow_timer = QTimer(parent)
-        self.lunch_time = None
-        self.off_time = None
+    ALERTS_SCHEDULED = False  # 到点提醒要在倒计时显示 00:00 的那次刷新里发出
+
+    def __init__(self, events, clock=SYSTEM_CLOCK, scheduler=None, checkpoints=None):
+        super().__init__(events, clock, scheduler, checkpoints)
+        self.schedule = None  # 当天的时间表
+        self.alerted = None  # 已提醒过的 (日期, 提示)，同一个到点只提醒一次
+        self.income = IncomeEngine()
         self.income_per_second = 0
 
         self.get_cow_income()
+        # 视图注册表：视图名 → 刷新函数（返回距离文字下一次变化的秒数），按注册顺序双击切换
+        self.views = {}
+        self.register_view("countdown", self.update_countdown)
+        for view in INCOME_VIEWS:
+            self.register_view(view, self.update_income_display)
+        self.view = "countdown"
+
+    def register_view(self, name, handler):
+        """注册一个子视图，同名视图会被替换，不会叠加"""
+        self.views[name] = handler
+
+    @property
+    def time_or_income(self):
+        """True 表示倒计时视图，False 表示收入视图"""
+        return self.view == "countdown"
+
+    def activate(self):
         self.start_countdown()
-        # 控制两种子模式切换
-        self.time_or_income= True
-        if self.time_or_income:
-            self.cow_timer.timeout.connect(self.update_countdown)
-        else:
-            self.cow_timer.timeout.connect(self.update_income_display)
 
     def start_countdown(self, minutes=None):
-        now = datetime.now()
-        week_number = now.isocalendar()[1]
-        self.lunch_time = APP_CONFIG.COW_MODE_ODD_WEEK_LUNCH_TIME if week_number % 2 == 1 else APP_CONFIG.COW_MODE_EVEN_WEEK_LUNCH_TIME
-        self.off_time = APP_CONFIG.COW_MODE_AFTERNOON_OFF_TIME
-
+        self.schedule = None  # 配置可能已变化，重新编译时间表
         self.is_running = True
-        self.update_countdown()
-        self.cow_timer.start(1000)
-
-    def update_countdown(self):
-        remaining, tip_type = self.get_cow_countdown()
+        self.tick()
+
+    def day_schedule(self, now):
+        """当天的时间表，跨过零点时重新编译"""
+        if self.schedule is None or self.schedule.day != now.date():
+            self.schedule = CowDaySchedule.compile(now.date())
+            self.get_cow_income()  # 月份或工作日历可能变化
+        return self.schedule
+
+    def tick(self):
+        """唯一的刷新入口，只调用当前视图的刷新函数，并在文字下一次变化时再醒来"""
+        wait = self.views[self.view](self.clock.now())
+        self.schedule_tick(wait)
+
+    def shift_view(self):
+        """依次切换 倒计时 → 今日 → 本周 → 本月 → 本年 收入"""
+        names = list(self.views)
+        self.view = names[(names.index(self.view) + 1) % len(names)]
+        self.tick()
+
+    def update_countdown(self, now=None):
+        """刷新倒计时显示，返回距离文字下一次变化的秒数"""
+        now = now or self.clock.now()
+        remaining, tip_type = self.get_cow_countdown(now)
         self.total_seconds = remaining
         self.remaining = remaining
         self.is_running = True
+        # 牛马倒计时每秒都会重新计算，颜色状态顺带更新，只在变化时发出事件
+        self.set_color(color_state(remaining))
         if remaining == 0:
-            self.parent.time_label.setText("00:00")
-            win32api.MessageBox(0, tip_type, '我爱工作！', 0x00040000)
+            self.events.set_display_text("00:00")
+            if self.alerted != (self.schedule.day, tip_type):
+                self.alerted = (self.schedule.day, tip_type)
+                self.events.notify('我爱工作！', tip_type, topmost=True)
         elif remaining > 0:
             m, s = divmod(remaining, 60)
-            self.parent.time_label.setText(f"{m:02d}:{s:02d}")
-        else:
-            self.parent.time_label.setText("下班")
-
-        self.parent.update()
-
-    def get_cow_countdown(self):
-        now = datetime.now()
-        current_time = now.time()
-        if current_time < self.lunch_time:
-            target_dt = datetime.combine(now.date(), self.lunch_time)
-            delta = target_dt - now
-            return max(0, int(delta.total_seconds())), "干饭第一！"
-        elif current_time < self.off_time:
-            target_dt = datetime.combine(now.date(), self.off_time)
-            delta = target_dt - now
-            return max(0, int(delta.total_seconds())), "再加会吧，公司招你亏麻了！"
+            self.events.set_display_text(f"{m:02d}:{s:02d}")
         else:
-            return -1, "已下班"
+            self.events.set_display_text("下班" if self.schedule.working else "休息")
+
+        offset = self.schedule.offset(now)
+        if remaining < 0:
+            # 下班后（或休息日）文字不再变化，直到次日零点
+            return DAY_SECONDS - offset
+        # 显示值是向下取整的秒数，在下一个整秒变化
+        fraction = offset - math.floor(offset)
+        return 1.0 - fraction if fraction > 0 else 0.0
+
+    def get_cow_countdown(self, now=None):
+        now = now or self.clock.now()
+        schedule = self.day_schedule(now)
+        offset = schedule.offset(now)
+        _, _, target, tip = schedule.segment_at(offset)
+        if target is None:
+            return -1, tip
+        return max(0, int(target - offset)), tip
 
     def reset(self):
-        print(self.cow_timer)
-        self.cow_timer.stop()
-        self.is_running = False
-        self.remaining = 0
-        self.total_seconds = 0
+        self.cancel_tick()
+        self.engine.reset()
 
     def get_status_text(self):
         return "cow"
 
     def get_cow_income(self):
-
-        # 将 time 转换为 datetime，用于计算时间差
-        now_date = datetime.now().date()
-        start_dt = datetime.combine(now_date,APP_CONFIG.COW_MODE_MOONING_ON_TIME)
-        end_dt = datetime.combine(now_date, APP_CONFIG.COW_MODE_AFTERNOON_OFF_TIME)
-
-        # 计算每日工作时长（秒）
-        work_duration = end_dt - start_dt
-        work_seconds_per_day = int(work_duration.total_seconds())
-        # 计算每秒收入
-        secondly_income = APP_CONFIG.INCOME_PER_MONTH / (
-                APP_CONFIG.WORKING_DAYS_PER_MONTH * work_seconds_per_day
-        )
-        self.income_per_second = secondly_income
+        """按当天的工作日历准备收入引擎，并同步每秒收入"""
+        day = self.schedule.day if self.schedule is not None else self.clock.now().date()
+        self.income.prepare(day)
+        self.income_per_second = self.income.per_second
 
     # 将数字转换为下标形式
     @staticmethod
     def to_subscript(num):
-        subscript_map = {
-            '0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
-            '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉'
-        }
-        return ''.join(subscript_map.get(d, d) for d in num)
-
-    def update_income_display(self):
-        """每秒更新实时收入显示"""
-        now = datetime.now()
-        work_start_time = datetime.combine(now.date(), APP_CONFIG.COW_MODE_MOONING_ON_TIME)
-        work_end_time = datetime.combine(now.date(), APP_CONFIG.COW_MODE_AFTERNOON_OFF_TIME)
-
-        today_work_seconds = 0
-        if  work_start_time<= now <= work_end_time:
-            elapsed = now - work_start_time
-            today_work_seconds = int(elapsed.total_seconds())
-        else:
-            today_work_seconds = int((work_end_time - work_start_time).total_seconds())
-
-        current_income = f'{today_work_seconds * self.income_per_second:.2f}'
-
-        yuan_part=str(current_income).split(".")[0]
-        fen_part=str(current_income).split(".")[1]
-        current_income_value=f'{yuan_part}.{self.to_subscript(fen_part)}'
-
-        self.parent.time_label.setText(f"{current_income_value}")
-
+        return num.translate(SUBSCRIPT_TABLE)
+
+    def update_income_display(self, now=None):
+        """刷新实时收入显示，返回距离文字下一次变化的秒数"""
+        now = now or self.clock.now()
+        schedule = self.day_schedule(now)
+        offset = schedule.offset(now)
+        work_start, work_end = schedule.work_start, schedule.work_end
+
+        # 上班前按 0 计，下班后按整天计
+        today_work_seconds = int(min(max(offset - work_start, 0), work_end - work_start))
+        earned = self.income.earned(self.view, today_work_seconds)
+        self.events.set_display_text(format_income(earned, INCOME_PREFIX[self.view]))
+
+        if offset < work_start:
+            return work_start - offset
+        if offset > work_end or self.income.per_second <= 0:
+            return DAY_SECONDS - offset
+        # 下一次“分”变化对应的整秒
+        next_seconds = self.income.next_change(self.view, today_work_seconds)
+        return min(work_start + next_seconds, DAY_SECONDS) - offset
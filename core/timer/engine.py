@@ -0,0 +1,99 @@
+import math
+import time
+
+
+class CountdownEngine:
+    """基于截止时间的倒计时引擎
+
+    运行时只记录单调时钟上的截止时刻，剩余时间在每次读取时推算，
+    事件循环卡顿（弹窗、枚举窗口）之后自动追平，不会累积漂移。
+    """
+
+    EPSILON = 1e-6  # 吸收截止时间加减产生的浮点误差
+
+    def __init__(self, allow_overtime=False, clock=time.monotonic):
+        self.clock = clock
+        self.allow_overtime = allow_overtime  # 是否允许走到负数（超时）
+        self.total_seconds = 0
+        self._deadline = None  # 运行中：截止时刻
+        self._frozen = 0.0  # 未运行：冻结的剩余秒数
+
+    @property
+    def is_running(self):
+        return self._deadline is not None
+
+    def load(self, seconds):
+        """装载时长但不启动"""
+        self.total_seconds = seconds
+        self._deadline = None
+        self._frozen = float(seconds)
+
+    def start(self, seconds):
+        """装载时长并立即启动"""
+        self.load(seconds)
+        self.resume()
+
+    def pause(self):
+        if self._deadline is None:
+            return
+        self._frozen = self.remaining_exact()
+        self._deadline = None
+
+    def resume(self):
+        if self._deadline is not None:
+            return
+        self._deadline = self.clock() + self._frozen
+
+    def stop(self):
+        """停止计时，保留总时长与当前剩余时间"""
+        self.pause()
+
+    def reset(self):
+        self.total_seconds = 0
+        self._deadline = None
+        self._frozen = 0.0
+
+    def set_remaining(self, seconds):
+        """直接改写剩余时间，保持当前运行状态"""
+        if self._deadline is None:
+            self._frozen = float(seconds)
+        else:
+            self._deadline = self.clock() + seconds
+
+    def remaining_exact(self):
+        """剩余秒数（浮点）"""
+        if self._deadline is None:
+            value = self._frozen
+        else:
+            value = self._deadline - self.clock()
+        if not self.allow_overtime and value < 0:
+            return 0.0
+        return value
+
+    @property
+    def remaining(self):
+        """剩余秒数（整数，向上取整，与显示一致）"""
+        return math.ceil(self.remaining_exact() - self.EPSILON)
+
+    def crossing_at(self, value):
+        """remaining 第一次 ≤ value 的单调时刻，不在运行或已经越过时返回 None"""
+        if self._deadline is None:
+            return None
+        when = self._deadline - value - self.EPSILON
+        return when if when > self.clock() else None
+
+    @property
+    def remaining_tenths(self):
+        """剩余的十分之一秒数（整数，向上取整）"""
+        return math.ceil((self.remaining_exact() - self.EPSILON) * 10)
+
+    def next_change_in(self, step=1.0):
+        """距离按 step 秒取整的剩余时间下一次变化的秒数，不会再变化时返回 None"""
+        if self._deadline is None:
+            return None
+        exact = self._deadline - self.clock() - self.EPSILON
+        if exact <= 0 and not self.allow_overtime:
+            return None
+        units = exact / step
+        fraction = units - math.floor(units)
+        return (fraction if fraction > 0 else 1.0) * step
@@ -0,0 +1,113 @@
+from core.notify import NOTIFIER
+
+
+class TimerEvents:
+    """计时器的输出接口
+
+    计时器不直接操作窗口，只通过这里的方法输出显示与提醒，
+    界面、测试和模拟各自实现需要的部分。
+    """
+
+    DISPLAY_METHODS = ("update_display", "update_display_tenths", "set_display_text")
+
+    @property
+    def wants_display(self):
+        """是否有人接收显示刷新（实现了任一显示方法）；没有时（只关心提醒的无界面模拟）计时器不必每秒醒来"""
+        return any(getattr(type(self), name) is not getattr(TimerEvents, name) for name in self.DISPLAY_METHODS)
+
+    def update_display(self, remaining):
+        """显示剩余秒数"""
+        pass
+
+    def update_display_tenths(self, tenths):
+        """临界窗口内显示剩余时间（单位：十分之一秒）"""
+        self.update_display((tenths + 9) // 10)
+
+    def set_display_text(self, text):
+        """显示任意文字"""
+        pass
+
+    def update_pacing(self, slide, offset):
+        """幻灯片翻页：当前页码与落后（正）/ 超前（负）的秒数，不知道页码时为 None"""
+        pass
+
+    def flash_alert(self):
+        """时间耗尽的闪烁提醒"""
+        pass
+
+    def set_color_state(self, state):
+        """颜色状态变化：normal / warning / critical"""
+        pass
+
+    def notify(self, title, message, topmost=False):
+        """弹出提醒"""
+        pass
+
+
+class WidgetEvents(TimerEvents):
+    """Qt 适配层：把计时器事件转发给悬浮球窗口"""
+
+    def __init__(self, widget, notifier=None):
+        self.widget = widget
+        self.notifier = notifier or NOTIFIER
+
+    def update_display(self, remaining):
+        self.widget.update_display(remaining)
+
+    def update_display_tenths(self, tenths):
+        self.widget.update_display_tenths(tenths)
+
+    def set_display_text(self, text):
+        self.widget.set_display_text(text)
+
+    def update_pacing(self, slide, offset):
+        self.widget.update_pacing(slide, offset)
+
+    def flash_alert(self):
+        self.widget.flash_alert()
+
+    def set_color_state(self, state):
+        self.widget.set_color_state(state)
+
+    def notify(self, title, message, topmost=False):
+        # 只入队，不在计时回调里弹阻塞的对话框
+        self.notifier.notify(title, message, topmost)
+
+
+class EventRecorder(TimerEvents):
+    """把事件依次记录下来（测试、基准与模拟使用）"""
+
+    def __init__(self, clock=None):
+        self.clock = clock
+        self.events = []
+        self.text = ""
+
+    def _record(self, kind, *values):
+        stamp = self.clock.now() if self.clock is not None else None
+        self.events.append((stamp, kind) + values)
+
+    def update_display(self, remaining):
+        m, s = divmod(abs(remaining), 60)
+        self.set_display_text(f"-{m:02d}:{s:02d}" if remaining < 0 else f"{m:02d}:{s:02d}")
+
+    def update_display_tenths(self, tenths):
+        seconds, tenth = divmod(tenths, 10)
+        m, s = divmod(seconds, 60)
+        self.set_display_text(f"{m:02d}:{s:02d}.{tenth}")
+
+    def set_display_text(self, text):
+        if text != self.text:
+            self.text = text
+            self._record("display", text)
+
+    def update_pacing(self, slide, offset):
+        self._record("pacing", slide, None if offset is None else round(offset, 1))
+
+    def flash_alert(self):
+        self._record("flash")
+
+    def set_color_state(self, state):
+        self._record("color", state)
+
+    def notify(self, title, message, topmost=False):
+        self._record("notify", title, message)
@@ -0,0 +1,86 @@
+import math
+from datetime import date, datetime, timedelta
+
+from config.settings import APP_CONFIG
+from core.timer.work_calendar import WORK_CALENDAR
+
+# 收入视图：今日 / 本周 / 本月 / 本年，显示时加上的前缀
+INCOME_VIEWS = ("today", "week", "month", "year")
+INCOME_PREFIX = {"today": "", "week": "周", "month": "月", "year": "年"}
+
+SUBSCRIPT_TABLE = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+# 0-99 分对应的下标字符串，刷新时直接查表
+CENT_SUBSCRIPTS = [f"{cents:02d}".translate(SUBSCRIPT_TABLE) for cents in range(100)]
+
+
+def format_income(value, prefix=""):
+    """金额 → "元.₍分₎" 形式的显示文字"""
+    cents = round(value * 100)
+    sign = "-" if cents < 0 else ""
+    yuan, fen = divmod(abs(cents), 100)
+    return f"{prefix}{sign}{yuan}.{CENT_SUBSCRIPTS[fen]}"
+
+
+def next_month(day):
+    return date(day.year + (day.month == 12), day.month % 12 + 1, 1)
+
+
+class IncomeEngine:
+    """
+    牛马收入引擎
+
+    月薪按当月工作日历平摊到每个工作日，再按上下班时长平摊到每秒。
+    每天准备一次：把本周 / 本月 / 本年截至今天零点已赚到的部分算成常数，
+    之后任意视图的收入都是 基数 + 今日已上班秒数 × 每秒收入，不需要逐秒累加。
+    """
+
+    def __init__(self, calendar=WORK_CALENDAR):
+        self.calendar = calendar
+        self.day = None
+        self.work_seconds = 0  # 每天上班秒数
+        self.per_second = 0.0  # 今天的每秒收入，休息日为 0
+        self.bases = {view: 0.0 for view in INCOME_VIEWS}
+
+    def daily_income(self, year, month):
+        """某月每个工作日的收入，日历里整月休息时按配置的月工作日数折算"""
+        working_days = self.calendar.working_days_in_month(year, month) or APP_CONFIG.WORKING_DAYS_PER_MONTH
+        return APP_CONFIG.INCOME_PER_MONTH / working_days
+
+    def income_between(self, start, end):
+        """[start, end) 之间完整工作日的收入，按月分段，最多十几次循环"""
+        total = 0.0
+        day = start
+        while day < end:
+            stop = min(end, next_month(day))
+            days = self.calendar.working_days_between(day, stop)
+            if days:
+                total += days * self.daily_income(day.year, day.month)
+            day = stop
+        return total
+
+    def prepare(self, day):
+        """为某天计算每秒收入和各视图的基数"""
+        self.day = day
+        start = datetime.combine(day, APP_CONFIG.COW_MODE_MOONING_ON_TIME)
+        end = datetime.combine(day, APP_CONFIG.COW_MODE_AFTERNOON_OFF_TIME)
+        self.work_seconds = int((end - start).total_seconds())
+        if self.calendar.is_working_day(day) and self.work_seconds > 0:
+            self.per_second = self.daily_income(day.year, day.month) / self.work_seconds
+        else:
+            self.per_second = 0.0
+        self.bases = {
+            "today": 0.0,
+            "week": self.income_between(day - timedelta(days=day.weekday()), day),
+            "month": self.income_between(day.replace(day=1), day),
+            "year": self.income_between(date(day.year, 1, 1), day),
+        }
+
+    def earned(self, view, worked_seconds):
+        """某视图截至今天上班 worked_seconds 秒时的收入"""
+        return self.bases[view] + worked_seconds * self.per_second
+
+    def next_change(self, view, worked_seconds):
+        """显示的“分”下一次变化时的今日上班秒数（整数）"""
+        cents = round(self.earned(view, worked_seconds) * 100)
+        target = ((cents + 0.5) / 100 - self.bases[view]) / self.per_second
+        return max(math.ceil(target), worked_seconds + 1)
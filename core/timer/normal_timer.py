@@ -1,48 +1,74 @@
-import win32api
-from PyQt5.QtCore import QTimer
-
+from core.timer.clock import SYSTEM_CLOCK
 from core.timer.timerbase import TimerBase
 from config.settings import APP_CONFIG
 
 class NormalTimer(TimerBase):
     """常规倒计时类"""
 
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.timer = QTimer(parent)
-        self.timer.timeout.connect(self.update_countdown)
+    def __init__(self, events, clock=SYSTEM_CLOCK, scheduler=None, checkpoints=None):
+        super().__init__(events, clock, scheduler, checkpoints)
         self.note= False
 
     def start_countdown(self, minutes=None):
-        self.total_seconds = minutes * 60
-        self.remaining = self.total_seconds
-        self.is_running = True
-        self.parent.update_display(self.remaining)
-        self.timer.start(1000)
+        self.engine.start(minutes * 60)
+        self.events.update_display(self.remaining)
+        self.schedule_tick(self.engine.next_change_in())
+        self.schedule_thresholds()
+        self.save_checkpoint()
 
     def update_countdown(self):
-        if self.remaining <= 0:
-            self.timer.stop()
-            self.is_running = False
-            self.remaining = 0
-            self.parent.update_display(self.remaining)
-            self.parent.flash_alert()
+        # 剩余时间由截止时间推算，事件循环卡顿后一次追平
+        remaining = self.remaining
+        if remaining <= 0:
+            self.cancel_tick()
+            self.engine.stop()
+            self.events.update_display(0)
+            self.events.flash_alert()
+            self.save_checkpoint()
         else:
-            self.remaining -= 1
-            self.parent.update_display(self.remaining)
-            print( self.remaining)
-            print(APP_CONFIG.WARNING_THRESHOLD)
-            if self.note and self.remaining ==  APP_CONFIG.WARNING_THRESHOLD:
-                minutes = self.remaining // 60
-                remaining_sec = self.remaining % 60
-                win32api.MessageBox(0, f'剩余时间： {minutes}分{remaining_sec}秒', '提醒', 0)
+            # 只在显示值变化的时刻醒来
+            self.schedule_tick(self.engine.next_change_in())
+            self.show_remaining(remaining)
+
+    def threshold_reached(self, name):
+        # 警告阈值事件按截止时间准时触发，不依赖某一次刷新恰好落在阈值上
+        if name == "warning" and self.note:
+            minutes, remaining_sec = divmod(APP_CONFIG.WARNING_THRESHOLD, 60)
+            self.events.notify('提醒', f'剩余时间： {minutes}分{remaining_sec}秒')
+
+    def pause(self):
+        self.engine.pause()
+        self.cancel_tick()
+        self.cancel_thresholds()
+        self.save_checkpoint()
+
+    def resume(self):
+        self.engine.resume()
+        self.schedule_tick(self.engine.next_change_in())
+        self.schedule_thresholds()
+        self.save_checkpoint()
 
     def reset(self):
-        print(self.timer)
-        self.timer.stop()
-        self.is_running = False
-        self.remaining = 0
-        self.total_seconds = 0
+        self.cancel_tick()
+        self.cancel_thresholds()
+        self.engine.reset()
+        self.set_color("normal")
+        self.save_checkpoint()
+
+    def snapshot(self):
+        record = super().snapshot()
+        record["note"] = self.note
+        return record
+
+    def restore(self, record):
+        super().restore(record)
+        self.note = record.get("note", False)
+        if self.is_running:
+            self.update_countdown()  # 关闭期间已经到点的，直接走结束流程
+            if self.is_running:
+                self.schedule_thresholds()
+        else:
+            self.events.update_display(self.remaining)
 
     def get_status_text(self):
         return "normal"
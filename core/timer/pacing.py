@@ -0,0 +1,119 @@
+from core.timer.rule_file import RuleFile
+
+PACING_PATH = "data/pacing.txt"
+
+DEFAULT_PACING = """\
+# 幻灯片模式每页时间预算
+# 每行一条规则，字段用 | 分隔，# 开头的行为注释
+#
+#   deck|季度汇报.pptx|30,60,60*3,45  文稿名出现在放映窗口标题里时按页分配秒数，
+#                                    60*3 表示连续 3 页各 60 秒，超出列表的页没有预算
+#
+# 没有匹配的 deck 规则时，按倒计时总时长平均分给总页数（均匀预算）。
+# 当前页由放映程序报告（目前只有 Windows 上的 PowerPoint，经 COM 读取），
+# 拿不到页码时不画节奏弧线，只看倒计时本身
+"""
+
+
+def parse_budgets(text):
+    """解析 “30,60,60*3,45” 形式的每页秒数"""
+    budgets = []
+    for item in text.replace("，", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        seconds, _, count = item.partition("*")
+        budgets.extend([float(seconds)] * (int(count) if count else 1))
+    if not budgets or min(budgets) < 0:
+        raise ValueError("每页秒数不能为空或负数")
+    return budgets
+
+
+class SlidePacer(RuleFile):
+    """
+    幻灯片翻页节奏
+
+    检测后端报告的页码 (当前页, 总页数) 变化时查出当前页的计划区间 [开始, 结束)（相对放映开始的秒数），
+    每次刷新显示只需把已用时间和这个区间比较：超过结束时刻为落后，早于开始时刻为超前。
+    文稿按放映窗口标题匹配 deck 规则，规则文件在每场放映开始时按修改时间重新加载。
+    """
+
+    name = "翻页节奏规则"
+
+    def __init__(self, path=PACING_PATH):
+        super().__init__(path, DEFAULT_PACING)
+        self.decks = []  # [(文稿名, 每页秒数)]
+        self.total_seconds = 0  # 本场放映的倒计时总时长
+        self.reset()
+
+    def reset(self):
+        self.slide = None  # 当前页码，不知道页码时为 None
+        self.budgets = None  # 当前文稿的每页秒数；None 表示均匀预算
+        self.prefix = [0.0]  # budgets 的前缀和
+        self.per_slide = None  # 均匀预算下每页的秒数，看到总页数之前为 None
+        self.bounds = None  # 当前页的计划区间 (开始, 结束)
+
+    # ---------- 规则加载 ----------
+    def reset_rules(self):
+        self.decks = []
+
+    def _parse_rule(self, line):
+        parts = [part.strip() for part in line.split("|")]
+        kind = parts[0].lower()
+        if kind == "deck":
+            if not parts[1]:
+                raise ValueError("文稿名不能为空")
+            self.decks.append((parts[1].lower(), parse_budgets(parts[2])))
+        else:
+            raise ValueError(f"未知规则类型: {kind}")
+
+    # ---------- 放映过程 ----------
+    def start(self, title, total_seconds, position=None):
+        """新的一场放映开始：重新加载规则，按标题选择文稿预算"""
+        self.refresh()
+        self.reset()
+        lowered = title.lower()
+        for name, budgets in self.decks:
+            if name in lowered:
+                self.budgets = budgets
+                self.prefix = [0.0]
+                for seconds in budgets:
+                    self.prefix.append(self.prefix[-1] + seconds)
+                break
+        self.total_seconds = total_seconds
+        return self.on_position(position)
+
+    def on_position(self, position):
+        """放映页码 (当前页, 总页数) 变化，返回当前页是否变化"""
+        if position is None:
+            return False  # 暂时拿不到页码（如放映结束后的黑屏），保持上一页
+        slide, count = position
+        if not 1 <= slide <= count:
+            return False
+        if self.budgets is None:
+            self.per_slide = self.total_seconds / count
+        changed = slide != self.slide
+        self.slide = slide
+        self.bounds = self.slide_bounds(slide)
+        return changed
+
+    def slide_bounds(self, slide):
+        """第 slide 页的计划区间 (开始, 结束)"""
+        if self.budgets is None:
+            return (slide - 1) * self.per_slide, slide * self.per_slide
+        last = len(self.budgets)
+        if slide > last:
+            return self.prefix[last], self.prefix[last]
+        return self.prefix[slide - 1], self.prefix[slide]
+
+    def planned(self, elapsed):
+        """按计划此刻应有的已用时间：在当前页区间内为 elapsed 本身，否则为区间端点；不知道页码时返回 None"""
+        if self.bounds is None:
+            return None
+        start, end = self.bounds
+        return min(max(elapsed, start), end)
+
+    def offset(self, elapsed):
+        """落后（正数）或超前（负数）的秒数，不知道页码时返回 None"""
+        planned = self.planned(elapsed)
+        return None if planned is None else elapsed - planned
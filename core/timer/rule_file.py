@@ -0,0 +1,67 @@
+import os
+from abc import ABC, abstractmethod
+
+
+class RuleFile(ABC):
+    """
+    按行书写的规则文件
+
+    每行一条规则，# 开头的行为注释；文件不存在或读取失败时使用 default 里的默认规则。
+    refresh() 只在文件修改时间变化（或首次使用）时重新解析，解析失败的行打印后跳过。
+    子类实现 reset_rules() 与 _parse_rule(line)，需要时在 rules_loaded() 里整理解析结果。
+    """
+
+    name = "规则文件"  # 出错提示里的名字
+
+    def __init__(self, path, default):
+        self.path = path
+        self.default = default
+        self.mtime = None
+
+    def refresh(self):
+        """规则文件变化（或首次使用）时重新加载，返回是否重新加载"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        if self.mtime is not None and mtime == self.mtime:
+            return False
+        self.mtime = mtime if mtime is not None else 0
+        self.load_rules(self.read_lines())
+        return True
+
+    def read_lines(self):
+        if not os.path.exists(self.path):
+            return self.default.splitlines()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return f.read().splitlines()
+        except Exception as e:
+            print(f"[ERROR] 读取{self.name}失败，使用默认规则: {e}")
+            return self.default.splitlines()
+
+    def load_rules(self, lines):
+        """解析规则行，解析失败的行打印后跳过"""
+        self.reset_rules()
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                self._parse_rule(line)
+            except (ValueError, IndexError) as e:
+                print(f"[ERROR] {self.name}第 {number} 行无效，已忽略: {line} ({e})")
+        self.rules_loaded()
+
+    def reset_rules(self):
+        """清空上一次加载的规则"""
+        pass
+
+    def rules_loaded(self):
+        """全部规则解析完之后调用"""
+        pass
+
+    @abstractmethod
+    def _parse_rule(self, line):
+        """解析一行规则，无效时抛出 ValueError / IndexError"""
+        pass
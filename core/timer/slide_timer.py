@@ -1,4 +1,6 @@
-from PyQt5.QtCore import QTimer
+from core.timer.clock import SYSTEM_CLOCK
+from core.timer.pacing import SlidePacer
+from core.timer.thresholds import color_state
 from core.timer.timerbase import TimerBase
 from config.settings import APP_CONFIG
 
@@ -6,56 +8,136 @@ from config.settings import APP_CONFIG
 class SlideTimer(TimerBase):
     """PPT模式计时类"""
 
-    def __init__(self, parent):
-        super().__init__(parent)
+    def __init__(self, events, clock=SYSTEM_CLOCK, scheduler=None, detector=None, checkpoints=None):
+        super().__init__(events, clock, scheduler, checkpoints)
+        self.detector = detector  # SlideshowDetector，默认按平台创建
+        self.engine.allow_overtime = True  # 放映超时后继续走负数
         self.slideshow_pid = None
-        self.check_ppt_timer = QTimer(parent)
+        self.alerted = False
+        self.pending_restore = None  # 等待检测结果确认的检查点
+        self.pacer = SlidePacer()  # 按检测后端报告的页码比对翻页节奏
+
+    def activate(self):
         self.start_countdown()
-        self.check_ppt_timer.timeout.connect(self.update_countdown)
 
     def start_countdown(self, minutes=None):
+        if minutes is not None:
+            # 双击对话框在返回后才写配置，这里先换成新时长
+            APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION = minutes
+        if self.slideshow_pid:
+            self.restart_show()
+            return
         self.reload()
-        self.is_running = True
-        self.check_ppt_timer.start(1000)
-
+        if self.detector is None:
+            from core.system.detector import create_detector
+            self.detector = create_detector()
+        self.detector.add_listener(self.on_slideshow)
+        self.detector.start()
+        self.on_slideshow(self.detector.pid, self.detector.title, self.detector.position)
 
-    def update_countdown(self):
-        from core.system.powerpoint import get_powerpoint_slide_pid
-        current_pid = get_powerpoint_slide_pid()
-
-        if current_pid and not self.slideshow_pid:
-            print(f"[进入幻灯片放映] 检测到幻灯片播放 → 启动倒计时 ({APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION} 分钟)")
-            self.slideshow_pid = current_pid
-            self.is_running = True
-        elif not current_pid and self.slideshow_pid:
+    def on_slideshow(self, pid, title, position=None):
+        """检测后端报告放映状态变化（position 为 (当前页, 总页数)，拿不到时为 None）"""
+        if pid and not self.slideshow_pid:
+            record, self.pending_restore = self.pending_restore, None
+            if record is not None and record["pid"] == pid:
+                self.resume_from(record)  # 重启前的那场放映还在
+            else:
+                print(f"[进入幻灯片放映] 检测到幻灯片播放 → 启动倒计时 ({APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION} 分钟)")
+                self.slideshow_pid = pid
+                self.engine.start(APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION * 60)
+                self.alerted = False
+                self.schedule_thresholds()
+                self.save_checkpoint()
+                self.update_countdown()
+            self.pacer.start(title, self.total_seconds, position)
+            self.show_pacing()
+        elif not pid and self.slideshow_pid:
             print("[退出幻灯片放映] → 重置倒计时")
+            self.cancel_tick()
             self.reload()
             self.slideshow_pid = None
-            self.is_running = False
+            self.pacer.reset()
+            self.show_pacing()
+            self.save_checkpoint()
+        elif pid and self.pacer.on_position(position):
+            self.show_pacing()  # 翻页
 
-        elif not current_pid and not self.slideshow_pid:
-            self.reload()
-            self.is_running = False
+    def restart_show(self):
+        """放映中改了时长：按新时长从头计时，检测照常进行"""
+        self.cancel_tick()
+        self.engine.start(APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION * 60)
+        self.alerted = False
+        self.schedule_thresholds()
+        self.save_checkpoint()
+        self.update_countdown()
+        self.pacer.start(self.detector.title, self.total_seconds, self.detector.position)
+        self.show_pacing()
+
+    def pacing(self):
+        """(计划的已用秒数, 实际已用秒数)，不知道当前页码时返回 None（渲染时调用，只做比较）"""
+        if not self.is_running:
+            return None
+        elapsed = self.total_seconds - self.engine.remaining_exact()
+        planned = self.pacer.planned(elapsed)
+        return None if planned is None else (planned, elapsed)
 
-        # 只有在运行状态下才减少时间
-        if self.is_running:
-            if self.remaining == 0:
-                self.parent.flash_alert()
-            self.remaining -= 1
-            self.parent.update_display(self.remaining)
+    def show_pacing(self):
+        pacing = self.pacing()
+        self.events.update_pacing(self.pacer.slide, None if pacing is None else pacing[1] - pacing[0])
+
+    def update_countdown(self):
+        # 只有在放映计时中才刷新显示，剩余时间由截止时间推算；未放映时没有刷新任务
+        if not self.is_running:
+            return
+        remaining = self.remaining
+        if remaining <= 0 and not self.alerted:
+            self.alerted = True
+            self.events.flash_alert()
+        self.show_remaining(remaining)
+        self.schedule_tick(self.engine.next_change_in())
 
     def reload(self):
-        self.total_seconds = APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION * 60
-        self.remaining = self.total_seconds
-        self.parent.update_display(self.remaining)
+        self.engine.load(APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION * 60)
+        self.cancel_thresholds()
+        self.set_color(color_state(self.remaining))
+        self.events.update_display(self.remaining)
 
 
     def reset(self):
-        self.check_ppt_timer.stop()
-        self.is_running = False
-        self.remaining = 0
-        self.total_seconds = 0
+        self.cancel_tick()
+        self.cancel_thresholds()
+        self.pending_restore = None
+        if self.detector is not None:
+            self.detector.remove_listener(self.on_slideshow)
+            self.detector.stop()
+        self.engine.reset()
+        self.set_color("normal")
         self.slideshow_pid = None
+        self.pacer.reset()
+
+    def snapshot(self):
+        record = super().snapshot()
+        record["pid"] = self.slideshow_pid
+        record["alerted"] = self.alerted
+        return record
+
+    def restore(self, record):
+        """只有放映进程还在（程序崩溃后重启）才接着计时，电脑重启后从头开始"""
+        if not record.get("running") or not record.get("pid"):
+            return
+        if self.detector is None:
+            return
+        if self.detector.pid != record["pid"]:
+            self.pending_restore = record  # 后台检测可能还没报告，等放映开始的事件再比对
+            return
+        self.resume_from(record)
+
+    def resume_from(self, record):
+        super().restore(record)
+        self.slideshow_pid = record["pid"]
+        self.alerted = record.get("alerted", False)
+        self.schedule_thresholds()
+        self.update_countdown()
 
     def get_status_text(self):
         return "slide"
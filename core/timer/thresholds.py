@@ -0,0 +1,24 @@
+from config.settings import APP_CONFIG
+
+
+def threshold_levels(allow_overtime=False):
+    """倒计时依次越过的阈值：(名称, 剩余秒数, 越过后的颜色状态)"""
+    levels = [
+        ("warning", APP_CONFIG.WARNING_THRESHOLD, "warning"),
+        ("critical", APP_CONFIG.CRITICAL_THRESHOLD, "critical"),
+        ("zero", 0, "normal"),
+    ]
+    if allow_overtime:
+        levels.append(("overtime", -1, "critical"))
+    return levels
+
+
+def color_state(remaining):
+    """根据剩余时间得出颜色状态：normal / warning / critical"""
+    if remaining == 0:
+        return "normal"
+    if remaining < 0 or remaining <= APP_CONFIG.CRITICAL_THRESHOLD:
+        return "critical"
+    if remaining <= APP_CONFIG.WARNING_THRESHOLD:
+        return "warning"
+    return "normal"
@@ -1,14 +1,183 @@
 from abc import ABC, abstractmethod
 
+from core.scheduler import SCHEDULER
+from core.timer.clock import SYSTEM_CLOCK
+from core.timer.engine import CountdownEngine
+from core.timer.thresholds import color_state, threshold_levels
+from config.settings import APP_CONFIG
+
+TENTHS_STEP = 0.1  # 临界窗口内文字的刷新粒度（秒）
+
 
 class TimerBase(ABC):
-    """计时器基类，定义统一接口"""
+    """计时器基类，定义统一接口
+
+    计时状态全部保存在 CountdownEngine 中，子类只负责把它映射成事件。
+    不依赖 Qt：显示与提醒经 events（TimerEvents）输出，时钟与调度器可以注入，
+    测试和模拟时换成虚拟时钟即可。
+    """
+
+    # 提醒全部由阈值事件和时间耗尽时的那次刷新发出；在刷新里判断到点提醒的子类要设为 False
+    ALERTS_SCHEDULED = True
+
+    def __init__(self, events, clock=SYSTEM_CLOCK, scheduler=None, checkpoints=None):
+        self.events = events
+        self.clock = clock
+        self.scheduler = scheduler or SCHEDULER
+        self.checkpoints = checkpoints  # CheckpointStore，None 表示不记录检查点
+        self.engine = CountdownEngine(clock=clock.monotonic)
+        self.tick_job = None  # 在调度器中登记的下一次刷新
+        self.threshold_jobs = []  # 在调度器中登记的阈值事件
+        self.tenths_job = None  # 临界窗口内十分之一秒文字的刷新，不在窗口内时为 None
+        self.color = "normal"  # 颜色状态，只在阈值事件发生时改变
+
+    @property
+    def total_seconds(self):
+        return self.engine.total_seconds
+
+    @total_seconds.setter
+    def total_seconds(self, value):
+        self.engine.total_seconds = value
+
+    @property
+    def remaining(self):
+        return self.engine.remaining
+
+    @remaining.setter
+    def remaining(self, value):
+        self.engine.set_remaining(value)
+
+    @property
+    def is_running(self):
+        return self.engine.is_running
+
+    @is_running.setter
+    def is_running(self, value):
+        if value:
+            self.engine.resume()
+        else:
+            self.engine.pause()
+
+    def schedule_tick(self, delay):
+        """在 delay 秒后调用一次 tick，替换已登记的刷新"""
+        if self.ALERTS_SCHEDULED and not self.events.wants_display and self.engine.is_running:
+            # 没有人看显示：直接睡到时间耗尽，阈值事件本来就按时刻单独登记
+            delay = max(delay, self.engine.remaining_exact())
+        self.scheduler.cancel(self.tick_job)
+        # 稍微推后一点，保证醒来时显示值已经变化
+        self.tick_job = self.scheduler.call_later(delay + 0.002, self.tick, self.get_status_text())
+
+    def tick(self):
+        """调度器回调入口"""
+        self.update_countdown()
+
+    def cancel_tick(self):
+        self.scheduler.cancel(self.tick_job)
+        self.tick_job = None
+
+    def schedule_thresholds(self):
+        """按截止时间算出各阈值的准确时刻并登记一次性事件（开始或继续计时时调用）"""
+        self.cancel_thresholds()
+        self.set_color(color_state(self.remaining))
+        for name, value, state in threshold_levels(self.engine.allow_overtime):
+            when = self.engine.crossing_at(value)
+            if when is not None:
+                job = self.scheduler.call_at(when, lambda name=name, state=state: self.on_threshold(name, state),
+                                             f"{self.get_status_text()}-{name}")
+                self.threshold_jobs.append(job)
+        self.sync_tenths()
 
-    def __init__(self, parent):
-        self.parent = parent
-        self.total_seconds = 0
-        self.remaining = 0
-        self.is_running = False
+    def cancel_thresholds(self):
+        for job in self.threshold_jobs:
+            self.scheduler.cancel(job)
+        self.threshold_jobs = []
+        self.cancel_tenths()
+
+    def on_threshold(self, name, state):
+        self.set_color(state)
+        self.threshold_reached(name)
+        self.sync_tenths()  # critical 进入窗口、zero 离开窗口
+
+    # ---------- 十分之一秒显示 ----------
+    def in_tenths_window(self):
+        """是否处于需要显示十分之一秒的临界窗口（运行中且剩余不超过临界阈值）"""
+        return (APP_CONFIG.SHOW_TENTHS and self.events.wants_display and self.engine.is_running
+                and 0 < self.remaining <= APP_CONFIG.CRITICAL_THRESHOLD)
+
+    def sync_tenths(self):
+        """进入临界窗口时开始 10 Hz 的文字刷新，离开时停掉"""
+        if self.in_tenths_window():
+            if self.tenths_job is None:
+                self.tenths_tick()
+        elif self.tenths_job is not None:
+            self.cancel_tenths()
+            self.events.update_display(self.remaining)  # 换回整秒显示
+
+    def tenths_tick(self):
+        """只刷新文字：不检测放映、不改颜色，到下一个十分之一秒再醒来"""
+        self.tenths_job = None
+        if not self.in_tenths_window():
+            return
+        self.events.update_display_tenths(self.engine.remaining_tenths)
+        delay = self.engine.next_change_in(TENTHS_STEP)
+        if delay is not None:
+            self.tenths_job = self.scheduler.call_later(delay + 0.002, self.tenths_tick,
+                                                        f"{self.get_status_text()}-tenths")
+
+    def cancel_tenths(self):
+        self.scheduler.cancel(self.tenths_job)
+        self.tenths_job = None
+
+    def show_remaining(self, remaining):
+        """整秒刷新时显示剩余时间，十分之一秒刷新接管文字时不覆盖"""
+        if self.tenths_job is None:
+            self.events.update_display(remaining)
+
+    def threshold_reached(self, name):
+        """越过阈值（warning / critical / zero / overtime）时调用，子类按需提醒"""
+        pass
+
+    def set_color(self, state):
+        if state != self.color:
+            self.color = state
+            self.events.set_color_state(state)
+
+    # ---------- 检查点 ----------
+    def snapshot(self):
+        """当前计时状态，截止时间换算成墙上时间戳"""
+        engine = self.engine
+        record = {
+            "total": engine.total_seconds,
+            "running": engine.is_running,
+            "remaining": engine.remaining_exact(),
+            "warning": APP_CONFIG.WARNING_THRESHOLD,
+            "critical": APP_CONFIG.CRITICAL_THRESHOLD,
+        }
+        if engine.is_running:
+            record["deadline"] = self.clock.now().timestamp() + record["remaining"]
+        return record
+
+    def restore(self, record):
+        """按检查点恢复计时状态，运行中的按截止时间推算剩余时间"""
+        self.cancel_tick()
+        self.cancel_thresholds()
+        remaining = record.get("remaining", 0)
+        if record.get("running") and record.get("deadline") is not None:
+            remaining = record["deadline"] - self.clock.now().timestamp()
+        self.engine.load(record.get("total", 0))
+        self.engine.set_remaining(remaining)
+        if record.get("running"):
+            self.engine.resume()
+        self.set_color(color_state(self.remaining))
+
+    def save_checkpoint(self):
+        """状态变化时调用，不在每次刷新时调用"""
+        if self.checkpoints is not None:
+            self.checkpoints.record_timer(self.get_status_text(), self.snapshot())
+
+    def activate(self):
+        """切换到该模式时调用"""
+        pass
 
     @abstractmethod
     def start_countdown(self, minutes=None):
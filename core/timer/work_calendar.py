@@ -0,0 +1,151 @@
+from bisect import bisect_right
+from datetime import date, timedelta
+
+from core.timer.rule_file import RuleFile
+
+CALENDAR_PATH = "data/calendar.txt"
+
+DEFAULT_CALENDAR = """\
+# 牛马模式工作日历
+# 每行一条规则，字段用 | 分隔，# 开头的行为注释
+#
+#   weekend|6,7                        每周固定休息的星期（1=周一 … 7=周日），默认 6,7
+#   holiday|2025-01-28|2025-02-04|春节  放假，起止日期都包含，只写一个日期表示放一天
+#   workday|2025-01-26|春节调休         调休上班
+#   rotation|2025-01-06|1111110111110  轮班（如大小周）：从锚定日起按 1 上班 0 休息循环，
+#                                      覆盖锚定日之后的 weekend 规则
+#
+# 优先级：workday / holiday > rotation > weekend
+weekend|6,7
+"""
+
+
+def parse_date(text):
+    return date.fromisoformat(text.strip())
+
+
+class WorkCalendar(RuleFile):
+    """
+    工作日历
+
+    按年把每天是否上班编译成位图（每天 1 bit），之后查询某天是否上班只需一次位运算；
+    同时记录每月的工作日数，供收入计算使用。调用 refresh() 时若规则文件有修改则重新加载。
+    """
+
+    name = "工作日历"
+
+    def __init__(self, path=CALENDAR_PATH):
+        super().__init__(path, DEFAULT_CALENDAR)
+        self.reset_rules()
+
+    # ---------- 规则加载 ----------
+    def reset_rules(self):
+        self.weekend = {6, 7}
+        self.holidays = {}  # date -> 备注
+        self.workdays = {}  # date -> 备注
+        self.rotations = []  # [(锚定日, 模式)]，按锚定日排序
+        self.rotation_starts = []
+        self.years = {}  # 年 -> (位图, 每月工作日数, 截至每天之前的累计工作日数)
+
+    def rules_loaded(self):
+        self.rotations.sort(key=lambda item: item[0])
+        self.rotation_starts = [anchor for anchor, _ in self.rotations]
+
+    def _parse_rule(self, line):
+        parts = [part.strip() for part in line.split("|")]
+        kind = parts[0].lower()
+        if kind == "weekend":
+            days = {int(x) for x in parts[1].replace("，", ",").split(",") if x.strip()}
+            if not days <= set(range(1, 8)):
+                raise ValueError("星期必须在 1-7 之间")
+            self.weekend = days
+        elif kind == "holiday":
+            start = parse_date(parts[1])
+            end, note = start, ""
+            if len(parts) > 2:
+                try:
+                    end = parse_date(parts[2])
+                    note = parts[3] if len(parts) > 3 else ""
+                except ValueError:
+                    note = parts[2]
+            if end < start:
+                raise ValueError("结束日期早于开始日期")
+            day = start
+            while day <= end:
+                self.holidays[day] = note
+                day += timedelta(days=1)
+        elif kind == "workday":
+            self.workdays[parse_date(parts[1])] = parts[2] if len(parts) > 2 else ""
+        elif kind == "rotation":
+            pattern = parts[2]
+            if not pattern or set(pattern) - {"0", "1"}:
+                raise ValueError("轮班模式只能由 0 和 1 组成")
+            self.rotations.append((parse_date(parts[1]), pattern))
+        else:
+            raise ValueError(f"未知规则类型: {kind}")
+
+    # ---------- 位图编译 ----------
+    def _rule_says_working(self, day):
+        if day in self.workdays:
+            return True
+        if day in self.holidays:
+            return False
+        index = bisect_right(self.rotation_starts, day) - 1
+        if index >= 0:
+            anchor, pattern = self.rotations[index]
+            return pattern[(day - anchor).days % len(pattern)] == "1"
+        return day.isoweekday() not in self.weekend
+
+    def _compile_year(self, year):
+        first = date(year, 1, 1)
+        days = (date(year + 1, 1, 1) - first).days
+        bitmap = bytearray((days + 7) // 8)
+        month_counts = [0] * 12
+        prefix = [0] * (days + 1)
+        for index in range(days):
+            day = first + timedelta(days=index)
+            working = self._rule_says_working(day)
+            if working:
+                bitmap[index >> 3] |= 1 << (index & 7)
+                month_counts[day.month - 1] += 1
+            prefix[index + 1] = prefix[index] + working
+        return bitmap, month_counts, prefix
+
+    def _year(self, year):
+        compiled = self.years.get(year)
+        if compiled is None:
+            compiled = self.years[year] = self._compile_year(year)
+        return compiled
+
+    # ---------- 查询 ----------
+    def is_working_day(self, day):
+        if self.mtime is None:
+            self.refresh()
+        bitmap = self._year(day.year)[0]
+        index = day.timetuple().tm_yday - 1
+        return bool(bitmap[index >> 3] & (1 << (index & 7)))
+
+    def working_days_in_month(self, year, month):
+        if self.mtime is None:
+            self.refresh()
+        return self._year(year)[1][month - 1]
+
+    def working_days_between(self, start, end):
+        """[start, end) 之间的工作日数，end 最多到 start 次年的 1 月 1 日"""
+        if self.mtime is None:
+            self.refresh()
+        if end <= start:
+            return 0
+        prefix = self._year(start.year)[2]
+        first = date(start.year, 1, 1)
+        return prefix[(end - first).days] - prefix[(start - first).days]
+
+    def note(self, day):
+        """节假日 / 调休的备注，没有时返回空字符串"""
+        if self.mtime is None:
+            self.refresh()
+        return self.workdays.get(day) or self.holidays.get(day, "")
+
+
+# 创建单例实例
+WORK_CALENDAR = WorkCalendar()
@@ -0,0 +1,184 @@
+"""
+时间旅行模拟：在虚拟时钟上快速回放一段时间，不需要显示器
+
+按顺序输出每一条显示文字、颜色状态与提醒，并统计每模拟小时的 CPU 开销，
+用于在推广配置改动之前检查计时顺序问题。
+
+示例:
+    python simulate.py cow --start 2025-01-09T07:00 --hours 168
+    python simulate.py slide --minutes 45 --show 60-3000
+    python simulate.py slide --minutes 8 --show 60-600 --flip 20
+    python simulate.py normal --minutes 5 --pause 120:30 --note
+    python simulate.py normal --minutes 1 --tenths
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+from config.settings import APP_CONFIG
+from core.scheduler import ManualDriver, TickScheduler
+from core.system.detector import ScriptedDetector
+from core.timer.clock import VirtualClock
+from core.timer.cow_timer import CowTimer
+from core.timer.events import TimerEvents
+from core.timer.normal_timer import NormalTimer
+from core.timer.slide_timer import SlideTimer
+
+
+class SimulationEvents(TimerEvents):
+    """把计时器事件连同虚拟时间和颜色状态逐行输出"""
+
+    def __init__(self, clock, out):
+        self.clock = clock
+        self.out = out
+        self.text = None
+        self.count = 0
+
+    def _emit(self, kind, value):
+        self.count += 1
+        if self.out is not None:
+            self.out.write(f"{self.clock.now():%Y-%m-%d %H:%M:%S.%f}"[:-3] + f"\t{kind}\t{value}\n")
+
+    def update_display(self, remaining):
+        m, s = divmod(abs(remaining), 60)
+        self.set_display_text(f"-{m:02d}:{s:02d}" if remaining < 0 else f"{m:02d}:{s:02d}")
+
+    def update_display_tenths(self, tenths):
+        seconds, tenth = divmod(tenths, 10)
+        m, s = divmod(seconds, 60)
+        self.set_display_text(f"{m:02d}:{s:02d}.{tenth}")
+
+    def set_display_text(self, text):
+        if text != self.text:
+            self.text = text
+            self._emit("display", text)
+
+    def update_pacing(self, slide, offset):
+        if offset is None:
+            self._emit("pacing", f"第 {slide} 页" if slide else "-")
+        else:
+            state = "落后" if offset > 0 else "超前" if offset < 0 else "按计划"
+            self._emit("pacing", f"第 {slide} 页 {state} {abs(offset):.0f} 秒")
+
+    def flash_alert(self):
+        self._emit("flash", self.text)
+
+    def set_color_state(self, state):
+        self._emit("color", state)
+
+    def notify(self, title, message, topmost=False):
+        self._emit("notify", f"{title}: {message}")
+
+
+def parse_windows(values):
+    """解析 "起点-终点"（秒）形式的放映时段"""
+    windows = []
+    for value in values:
+        start, end = value.split("-")
+        windows.append((float(start), float(end)))
+    return windows
+
+
+def parse_pauses(values):
+    """解析 "时刻:时长"（秒）形式的暂停"""
+    pauses = []
+    for value in values:
+        at, duration = value.split(":")
+        pauses.append((float(at), float(duration)))
+    return pauses
+
+
+def build_timer(args, events, clock, scheduler):
+    if args.mode == "cow":
+        return CowTimer(events, clock, scheduler)
+    if args.mode == "slide":
+        if args.minutes:
+            APP_CONFIG.SLIDE_MODE_DEFAULT_DURATION = args.minutes
+        steps = []
+        for start, end in parse_windows(args.show):
+            title = "PowerPoint 幻灯片放映 - [演示文稿.pptx]"
+            if args.flip:
+                # 每 FLIP 秒翻一页，后端报告页码
+                pages = max(1, int((end - start) // args.flip))
+                for page in range(pages):
+                    steps.append((start + page * args.flip, 4242, title, (page + 1, pages)))
+            else:
+                steps.append((start, 4242, title))
+            steps.append((end, None, ""))
+        return SlideTimer(events, clock, scheduler, detector=ScriptedDetector(steps, scheduler))
+    timer = NormalTimer(events, clock, scheduler)
+    timer.note = args.note
+    return timer
+
+
+def run(args):
+    clock = VirtualClock(datetime.fromisoformat(args.start))
+    scheduler = TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+    events = SimulationEvents(clock, None if args.quiet else sys.stdout)
+    timer = build_timer(args, events, clock, scheduler)
+
+    # 操作脚本：(虚拟时刻, 动作)
+    actions = []
+    if args.mode == "normal":
+        actions.append((0.0, lambda: timer.start_countdown(args.minutes or APP_CONFIG.NORMAL_MODE_DEFAULT_DURATION)))
+        for at, duration in parse_pauses(args.pause):
+            actions.append((at, timer.pause))
+            actions.append((at + duration, timer.resume))
+    else:
+        actions.append((0.0, timer.activate))
+    actions.sort(key=lambda item: item[0])
+
+    total = args.hours * 3600
+    chunk = 60.0  # 每推进一分钟虚拟时间检查一次操作脚本与回放速度
+    wakeups = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    while clock.elapsed < total:
+        while actions and actions[0][0] <= clock.elapsed:
+            actions.pop(0)[1]()
+        step = min(chunk, total - clock.elapsed)
+        if actions:
+            step = min(step, max(0.0, actions[0][0] - clock.elapsed))
+        wakeups += clock.run(scheduler, step)
+        if args.speed > 0:
+            # 按倍速回放时，真实时间不能跑在虚拟时间前面
+            lag = clock.elapsed / args.speed - (time.perf_counter() - wall_start)
+            if lag > 0:
+                time.sleep(lag)
+    cpu = time.process_time() - cpu_start
+
+    hours = max(args.hours, 1e-9)
+    sys.stderr.write(
+        f"[模拟完成] 模式 {args.mode}，虚拟 {args.hours:g} 小时，唤醒 {wakeups} 次，事件 {events.count} 条，"
+        f"CPU {cpu * 1000:.1f} ms（每模拟小时 {cpu / hours * 1000:.2f} ms）\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="倒计时悬浮球时间旅行模拟")
+    parser.add_argument("mode", choices=["normal", "slide", "cow"], help="计时模式")
+    parser.add_argument("--start", default="2025-01-06T07:00", help="虚拟起始时间（ISO 格式）")
+    parser.add_argument("--hours", type=float, default=None, help="模拟时长（小时）")
+    parser.add_argument("--speed", type=float, default=0, help="回放倍速，0 表示尽快跑完")
+    parser.add_argument("--minutes", type=int, default=None, help="常规/幻灯片模式的倒计时分钟数")
+    parser.add_argument("--show", action="append", default=[], metavar="START-END",
+                        help="幻灯片放映时段（相对起点的秒数），可重复")
+    parser.add_argument("--flip", type=float, default=None, metavar="SECONDS",
+                        help="放映期间每 SECONDS 秒翻一页（检测后端报告页码）")
+    parser.add_argument("--pause", action="append", default=[], metavar="AT:SECONDS",
+                        help="常规模式在 AT 秒暂停 SECONDS 秒，可重复")
+    parser.add_argument("--note", action="store_true", help="常规模式开启警告阈值提醒")
+    parser.add_argument("--tenths", action="store_true", help="临界阈值以内显示十分之一秒")
+    parser.add_argument("--quiet", action="store_true", help="只输出统计，不输出事件")
+    args = parser.parse_args()
+
+    if args.hours is None:
+        args.hours = 24.0 if args.mode == "cow" else 1.0
+    if args.tenths:
+        APP_CONFIG.SHOW_TENTHS = True
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
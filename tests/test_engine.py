@@ -0,0 +1,105 @@
+import pytest
+
+from core.timer.clock import VirtualClock
+from core.timer.engine import CountdownEngine
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+def make_engine(clock, allow_overtime=False):
+    return CountdownEngine(allow_overtime=allow_overtime, clock=clock.monotonic)
+
+
+def test_remaining_is_derived_from_the_deadline(clock):
+    engine = make_engine(clock)
+    engine.start(60)
+    assert engine.is_running and engine.remaining == 60
+    clock.advance(0.4)
+    assert engine.remaining == 60  # 向上取整，与显示一致
+    assert engine.remaining_exact() == pytest.approx(59.6)
+    clock.advance(0.6)
+    assert engine.remaining == 59
+
+
+def test_load_does_not_start(clock):
+    engine = make_engine(clock)
+    engine.load(30)
+    clock.advance(10)
+    assert not engine.is_running
+    assert engine.remaining == 30 and engine.total_seconds == 30
+
+
+def test_pause_freezes_and_resume_moves_the_deadline(clock):
+    engine = make_engine(clock)
+    engine.start(60)
+    clock.advance(20.5)
+    engine.pause()
+    engine.pause()  # 重复暂停不改变状态
+    clock.advance(100)
+    assert engine.remaining_exact() == pytest.approx(39.5)
+    engine.resume()
+    engine.resume()
+    clock.advance(39.5)
+    assert engine.remaining == 0
+    assert engine.crossing_at(0) is None
+
+
+def test_stall_catches_up_in_one_read(clock):
+    engine = make_engine(clock)
+    engine.start(60)
+    clock.advance(45.2)  # 事件循环卡住，中间一次都没有刷新
+    assert engine.remaining == 15
+    clock.advance(100)
+    assert engine.remaining == 0  # 不允许超时时停在 0
+
+
+def test_overtime_goes_negative(clock):
+    engine = make_engine(clock, allow_overtime=True)
+    engine.start(10)
+    clock.advance(12.5)
+    assert engine.remaining_exact() == pytest.approx(-2.5)
+    assert engine.remaining == -2
+    assert engine.next_change_in() == pytest.approx(0.5, abs=1e-5)
+
+
+def test_set_remaining_keeps_the_running_state(clock):
+    engine = make_engine(clock)
+    engine.start(60)
+    engine.set_remaining(5)
+    clock.advance(1)
+    assert engine.remaining == 4
+    engine.pause()
+    engine.set_remaining(20)
+    assert not engine.is_running and engine.remaining == 20
+
+
+def test_crossing_at_and_next_change(clock):
+    engine = make_engine(clock)
+    assert engine.crossing_at(30) is None and engine.next_change_in() is None
+    engine.start(60)
+    assert engine.crossing_at(30) == pytest.approx(30, abs=1e-5)
+    clock.advance(0.25)
+    assert engine.next_change_in() == pytest.approx(0.75, abs=1e-5)
+    assert engine.next_change_in(0.1) == pytest.approx(0.05, abs=1e-5)
+    clock.advance(30)
+    assert engine.crossing_at(30) is None  # 已经越过
+    clock.advance(30)
+    assert engine.next_change_in() is None  # 时间耗尽后不再变化
+
+
+def test_tenths(clock):
+    engine = make_engine(clock)
+    engine.start(2)
+    clock.advance(0.55)
+    assert engine.remaining_tenths == 15
+
+
+def test_reset(clock):
+    engine = make_engine(clock)
+    engine.start(60)
+    engine.reset()
+    assert not engine.is_running
+    assert engine.remaining == 0 and engine.total_seconds == 0
@@ -0,0 +1,98 @@
+from datetime import date, time
+
+import pytest
+
+from config.settings import APP_CONFIG
+from core.timer.income import IncomeEngine, format_income
+from core.timer.work_calendar import WorkCalendar
+
+DEC_2024 = 23000 / 22  # 2024 年 12 月 22 个工作日
+JAN_2025 = 23000 / 23  # 2025 年 1 月 23 个工作日
+WORK_SECONDS = 9 * 3600
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(APP_CONFIG, "INCOME_PER_MONTH", 23000)
+    monkeypatch.setattr(APP_CONFIG, "WORKING_DAYS_PER_MONTH", 20)
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_MOONING_ON_TIME", time(9, 0))
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_AFTERNOON_OFF_TIME", time(18, 0))
+
+
+def make_engine(tmp_path, text=None):
+    path = tmp_path / "calendar.txt"
+    if text is not None:
+        path.write_text(text, encoding="utf-8")
+    return IncomeEngine(WorkCalendar(str(path)))
+
+
+def test_daily_income_follows_the_month(tmp_path):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2025, 1, 6))
+    assert engine.work_seconds == WORK_SECONDS
+    assert engine.per_second == pytest.approx(JAN_2025 / WORK_SECONDS)
+    assert engine.daily_income(2024, 12) == pytest.approx(DEC_2024)
+
+
+def test_bases_on_new_years_day(tmp_path):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2025, 1, 1))  # 周三，本周从 2024-12-30 开始
+    assert engine.bases["week"] == pytest.approx(2 * DEC_2024)
+    assert engine.bases["month"] == 0
+    assert engine.bases["year"] == 0
+
+
+def test_week_base_spans_the_year_boundary(tmp_path):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2025, 1, 3))
+    assert engine.bases["week"] == pytest.approx(2 * DEC_2024 + 2 * JAN_2025)
+    assert engine.bases["month"] == pytest.approx(2 * JAN_2025)
+    assert engine.bases["year"] == pytest.approx(2 * JAN_2025)
+
+
+def test_bases_at_the_end_of_the_year(tmp_path):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2024, 12, 31))
+    assert engine.bases["month"] == pytest.approx(21 * DEC_2024)
+    assert engine.bases["year"] == pytest.approx(11 * 23000 + 21 * DEC_2024)
+    assert engine.earned("year", WORK_SECONDS) == pytest.approx(12 * 23000)
+
+
+def test_rest_day_earns_nothing_but_keeps_the_bases(tmp_path):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2025, 1, 5))  # 周日
+    assert engine.per_second == 0
+    assert engine.bases["week"] == pytest.approx(2 * DEC_2024 + 3 * JAN_2025)
+    assert engine.earned("week", 3600) == engine.bases["week"]
+
+
+def test_holiday_file_changes_the_daily_rate(tmp_path):
+    engine = make_engine(tmp_path, "holiday|2025-01-28|2025-01-31|春节\nworkday|2025-01-26|春节调休\n")
+    engine.prepare(date(2025, 1, 26))  # 周日调休上班
+    assert engine.per_second == pytest.approx(23000 / 20 / WORK_SECONDS)
+    engine.prepare(date(2025, 1, 28))
+    assert engine.per_second == 0
+
+
+def test_month_without_working_days_uses_the_configured_count(tmp_path):
+    engine = make_engine(tmp_path, "holiday|2025-02-01|2025-02-28\n")
+    assert engine.daily_income(2025, 2) == pytest.approx(23000 / 20)
+    engine.prepare(date(2025, 3, 3))
+    assert engine.bases["year"] == pytest.approx(23000)  # 二月整月休息，不计收入
+
+
+@pytest.mark.parametrize("view", ["today", "week", "month", "year"])
+def test_next_change_is_the_next_cent(tmp_path, view):
+    engine = make_engine(tmp_path)
+    engine.prepare(date(2025, 1, 8))
+    worked = 1234
+    shown = format_income(engine.earned(view, worked))
+    after = engine.next_change(view, worked)
+    assert after > worked
+    assert format_income(engine.earned(view, after - 1)) == shown
+    assert format_income(engine.earned(view, after)) != shown
+
+
+def test_format_income():
+    assert format_income(12.346, "月") == "月12.₃₅"
+    assert format_income(-0.5) == "-0.₅₀"
@@ -0,0 +1,79 @@
+import pytest
+
+from core.scheduler import ManualDriver, TickScheduler
+from core.system.detector import ScriptedDetector
+from core.timer.clock import VirtualClock
+from core.timer.events import EventRecorder
+from core.timer.pacing import SlidePacer, parse_budgets
+from core.timer.rule_file import RuleFile
+from core.timer.slide_timer import SlideTimer
+from config.settings import APP_CONFIG
+
+TITLE = "PowerPoint 幻灯片放映 - [第3季度汇报.pptx]"
+
+
+def test_rule_file_requires_a_parser():
+    with pytest.raises(TypeError):
+        RuleFile("missing.txt", "")
+
+
+def test_parse_budgets():
+    assert parse_budgets("30,60*2，45") == [30.0, 60.0, 60.0, 45.0]
+    with pytest.raises(ValueError):
+        parse_budgets("")
+
+
+def test_uniform_budget_from_page_count(tmp_path):
+    pacer = SlidePacer(str(tmp_path / "missing.txt"))
+    assert pacer.start(TITLE, 480, (1, 8))
+    assert pacer.bounds == (0.0, 60.0)
+    assert pacer.offset(70) == 10.0
+    assert pacer.on_position((3, 8))
+    assert pacer.offset(100) == -20.0
+    assert not pacer.on_position((3, 8))
+
+
+@pytest.mark.parametrize("position", [None, (0, 8), (9, 8)])
+def test_unknown_position_draws_no_arc(tmp_path, position):
+    pacer = SlidePacer(str(tmp_path / "missing.txt"))
+    assert not pacer.start(TITLE, 480, position)
+    assert pacer.slide is None
+    assert pacer.offset(100) is None
+
+
+def test_lost_position_keeps_the_last_slide(tmp_path):
+    pacer = SlidePacer(str(tmp_path / "missing.txt"))
+    pacer.start(TITLE, 480, (2, 8))
+    assert not pacer.on_position(None)  # 放映结束后的黑屏
+    assert pacer.slide == 2
+
+
+def test_deck_budget_and_bad_lines(tmp_path, capsys):
+    path = tmp_path / "pacing.txt"
+    path.write_text("deck|demo.pptx|30,60*2\nbad|x\n", encoding="utf-8")
+    pacer = SlidePacer(str(path))
+    pacer.start("PowerPoint Slide Show - [demo.pptx]", 480, (2, 9))
+    assert pacer.bounds == (30.0, 90.0)
+    pacer.on_position((4, 9))
+    assert pacer.bounds == (150.0, 150.0)
+    assert "第 2 行无效" in capsys.readouterr().out
+
+
+def test_slide_timer_follows_reported_positions(monkeypatch, tmp_path):
+    monkeypatch.setattr(APP_CONFIG, "SLIDE_MODE_DEFAULT_DURATION", 8)
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+    detector = ScriptedDetector([
+        (10, 4242, TITLE, (1, 8)),
+        (30, 4242, TITLE, (2, 8)),
+        (210, 4242, TITLE, (3, 8)),
+        (300, None, ""),
+    ], scheduler)
+    events = EventRecorder(clock)
+    timer = SlideTimer(events, clock, scheduler, detector=detector)
+    timer.pacer = SlidePacer(str(tmp_path / "missing.txt"))
+    timer.activate()
+    clock.run(scheduler, 400)
+    pacing = [event[2:] for event in events.events if event[1] == "pacing"]
+    # 每页 60 秒：放映 20 秒就翻到第 2 页超前 40 秒，200 秒才翻到第 3 页落后 20 秒
+    assert pacing == [(1, 0.0), (2, -40.0), (3, 20.0), (None, None)]
@@ -0,0 +1,38 @@
+import os
+
+import psutil
+import pytest
+
+from core.system.process_cache import ProcessCache
+
+
+def test_hits_do_not_query_the_process(monkeypatch):
+    cache = ProcessCache()
+    pid = os.getpid()
+    name = cache.name(pid)
+    monkeypatch.setattr(psutil, "Process", None)  # 命中时不应再打开进程
+    assert cache.name(pid) == name
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_prune_drops_exited_pids_so_a_reused_pid_is_read_again():
+    cache = ProcessCache()
+    pid = os.getpid()
+    cache.name(pid)
+    cache.prune(set())  # 这一轮的 PID 列表里没有它：已经退出
+    assert cache.stats()["size"] == 0
+    cache.name(pid)
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_eviction():
+    cache = ProcessCache(max_size=1)
+    cache.name(os.getpid())
+    cache.name(os.getppid())
+    assert list(cache.entries) == [os.getppid()]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_missing_process_raises():
+    with pytest.raises(psutil.NoSuchProcess):
+        ProcessCache().name(2 ** 22 + 12345)
@@ -0,0 +1,187 @@
+from datetime import datetime, time
+
+import pytest
+
+from config.settings import APP_CONFIG
+from core.scheduler import ManualDriver, TickScheduler
+from core.timer.clock import VirtualClock
+from core.timer.cow_timer import CowTimer
+from core.timer.events import EventRecorder, TimerEvents
+from core.timer.normal_timer import NormalTimer
+
+LUNCH_TIP = "干饭第一！"
+OFF_TIP = "再加会吧，公司招你亏麻了！"
+
+
+class AlertEvents(TimerEvents):
+    """只接收提醒，不接收任何显示刷新"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.alerts = []
+
+    def flash_alert(self):
+        self.alerts.append((self.clock.monotonic(), "flash"))
+
+    def set_color_state(self, state):
+        self.alerts.append((self.clock.monotonic(), "color", state))
+
+    def notify(self, title, message, topmost=False):
+        self.alerts.append((self.clock.monotonic(), "notify", message))
+
+
+class TextEvents(TimerEvents):
+    def set_display_text(self, text):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(APP_CONFIG, "WARNING_THRESHOLD", 30)
+    monkeypatch.setattr(APP_CONFIG, "CRITICAL_THRESHOLD", 15)
+    monkeypatch.setattr(APP_CONFIG, "SHOW_TENTHS", False)
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_MOONING_ON_TIME", time(8, 30))
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_ODD_WEEK_LUNCH_TIME", time(12, 0))
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_EVEN_WEEK_LUNCH_TIME", time(12, 0))
+    monkeypatch.setattr(APP_CONFIG, "COW_MODE_AFTERNOON_OFF_TIME", time(18, 0))
+
+
+def make_runtime(start=None):
+    clock = VirtualClock(start)
+    return clock, TickScheduler(clock=clock.monotonic, driver=ManualDriver())
+
+
+def kinds(recorder, kind):
+    return [event for event in recorder.events if event[1] == kind]
+
+
+# ---------- 调度器 ----------
+def test_scheduler_runs_jobs_in_deadline_order():
+    clock, scheduler = make_runtime()
+    calls = []
+    scheduler.call_later(2, lambda: calls.append(("b", clock.monotonic())))
+    scheduler.call_later(1, lambda: calls.append(("a", clock.monotonic())))
+    cancelled = scheduler.call_later(1.5, lambda: calls.append(("x", clock.monotonic())))
+    scheduler.cancel(cancelled)
+    assert clock.run(scheduler, 10) == 2
+    assert calls == [("a", 1), ("b", 2)]
+    assert scheduler.next_deadline() is None
+
+
+def test_periodic_job_keeps_its_cadence_and_skips_missed_beats():
+    clock, scheduler = make_runtime()
+    calls = []
+    job = scheduler.call_every(1.0, lambda: calls.append(clock.monotonic()))
+    clock.run(scheduler, 3.5)
+    assert calls == [1.0, 2.0, 3.0]
+    # 卡顿 5 秒后只补一次，然后从当前时刻重新起算
+    clock.advance(5)
+    scheduler.run_due()
+    assert calls[-1] == 8.5
+    assert job.when == 9.5
+
+
+def test_job_due_during_dispatch_runs_in_the_same_wakeup():
+    clock, scheduler = make_runtime()
+    calls = []
+    scheduler.call_later(1, lambda: scheduler.call_later(0, lambda: calls.append(clock.monotonic())))
+    assert clock.run(scheduler, 2) == 1
+    assert calls == [1]
+
+
+# ---------- 事件接口 ----------
+@pytest.mark.parametrize("events, expected", [
+    (TimerEvents(), False),
+    (AlertEvents(None), False),
+    (TextEvents(), True),
+    (EventRecorder(), True),
+])
+def test_wants_display(events, expected):
+    assert events.wants_display is expected
+
+
+# ---------- 常规模式 ----------
+def test_normal_countdown_event_sequence():
+    clock, scheduler = make_runtime()
+    events = EventRecorder(clock)
+    timer = NormalTimer(events, clock, scheduler)
+    timer.start_countdown(1)
+    clock.run(scheduler, 61)
+    colors = [(event[0], event[2]) for event in kinds(events, "color")]
+    start = clock.start
+    assert [(stamp - start).total_seconds() for stamp, _ in colors] == pytest.approx([30, 45, 60], abs=0.01)
+    assert [state for _, state in colors] == ["warning", "critical", "normal"]
+    displays = [event[2] for event in kinds(events, "display")]
+    assert displays[0] == "01:00" and displays[-1] == "00:00"
+    assert len(displays) == 61  # 每个整秒恰好一次
+    flashes = kinds(events, "flash")
+    assert len(flashes) == 1 and (flashes[0][0] - start).total_seconds() == pytest.approx(60, abs=0.01)
+    assert not timer.is_running
+
+
+def test_alerts_only_countdown_sleeps_until_thresholds():
+    clock, scheduler = make_runtime()
+    events = AlertEvents(clock)
+    timer = NormalTimer(events, clock, scheduler)
+    timer.note = True
+    timer.start_countdown(10)
+    wakeups = clock.run(scheduler, 601)
+    assert wakeups <= 4
+    assert [alert[1:] for alert in events.alerts] == [
+        ("color", "warning"), ("notify", "剩余时间： 0分30秒"), ("color", "critical"), ("color", "normal"), ("flash",),
+    ]
+    assert [alert[0] for alert in events.alerts] == pytest.approx([570, 570, 585, 600, 600], abs=0.01)
+
+
+def test_pause_moves_thresholds_with_the_deadline():
+    clock, scheduler = make_runtime()
+    events = AlertEvents(clock)
+    timer = NormalTimer(events, clock, scheduler)
+    timer.start_countdown(1)
+    clock.run(scheduler, 20)
+    timer.pause()
+    clock.run(scheduler, 100)  # 暂停期间什么都不发生
+    assert events.alerts == []
+    timer.resume()
+    clock.run(scheduler, 41)
+    assert [alert[0] for alert in events.alerts if alert[1] == "color"] == pytest.approx([130, 145, 160], abs=0.01)
+    assert events.alerts[-1] == (pytest.approx(160, abs=0.01), "flash")
+
+
+def test_tenths_window_refreshes_ten_times_per_second(monkeypatch):
+    monkeypatch.setattr(APP_CONFIG, "SHOW_TENTHS", True)
+    clock, scheduler = make_runtime()
+    events = EventRecorder(clock)
+    timer = NormalTimer(events, clock, scheduler)
+    timer.start_countdown(0.5)
+    clock.run(scheduler, 31)
+    displays = [event[2] for event in kinds(events, "display")]
+    assert "00:15.0" in displays and "00:14.9" in displays and "00:00.1" in displays
+    assert displays[-1] == "00:00"
+    assert timer.tenths_job is None
+
+
+# ---------- 牛马模式 ----------
+@pytest.mark.parametrize("make_events", [EventRecorder, AlertEvents])
+def test_cow_segment_alerts_fire_without_a_display(make_events):
+    clock, scheduler = make_runtime(datetime(2025, 1, 9, 11, 0))  # 周四
+    events = make_events(clock)
+    timer = CowTimer(events, clock, scheduler)
+    timer.activate()
+    clock.run(scheduler, 10 * 3600)
+    if isinstance(events, EventRecorder):
+        notifies = [((stamp - clock.start).total_seconds(), message) for stamp, _, _, message in kinds(events, "notify")]
+    else:
+        notifies = [(alert[0], alert[2]) for alert in events.alerts if alert[1] == "notify"]
+    assert [message for _, message in notifies] == [LUNCH_TIP, OFF_TIP]
+    assert notifies[0][0] == pytest.approx(3600, abs=1.01)
+    assert notifies[1][0] == pytest.approx(7 * 3600, abs=1.01)
+
+
+def test_cow_sleeps_through_the_evening():
+    clock, scheduler = make_runtime(datetime(2025, 1, 9, 18, 30))
+    events = EventRecorder(clock)
+    timer = CowTimer(events, clock, scheduler)
+    timer.activate()
+    assert events.text == "下班"
+    assert clock.run(scheduler, 5 * 3600) == 0  # 零点之前不再醒来
@@ -0,0 +1,108 @@
+import os
+from datetime import date
+
+import pytest
+
+from core.timer.work_calendar import WorkCalendar
+
+SPRING_FESTIVAL = """\
+holiday|2025-01-28|2025-02-04|春节
+workday|2025-01-26|春节调休
+workday|2025-02-08|春节调休
+"""
+
+
+def make_calendar(tmp_path, text=None):
+    path = tmp_path / "calendar.txt"
+    if text is not None:
+        path.write_text(text, encoding="utf-8")
+    return WorkCalendar(str(path))
+
+
+def test_default_rules_without_a_file(tmp_path):
+    calendar = make_calendar(tmp_path)
+    assert calendar.working_days_in_month(2025, 1) == 23
+    assert calendar.working_days_in_month(2025, 2) == 20
+    assert calendar.is_working_day(date(2025, 1, 6))
+    assert not calendar.is_working_day(date(2025, 1, 11))
+
+
+def test_holiday_file_overrides_weekends(tmp_path):
+    calendar = make_calendar(tmp_path, SPRING_FESTIVAL)
+    assert calendar.working_days_in_month(2025, 1) == 23 - 4 + 1  # 28-31 日放假，26 日（周日）调休上班
+    assert calendar.working_days_in_month(2025, 2) == 20 - 2 + 1  # 3、4 日放假，8 日（周六）调休上班
+    assert not calendar.is_working_day(date(2025, 1, 28))
+    assert calendar.is_working_day(date(2025, 1, 26))
+    assert calendar.note(date(2025, 1, 26)) == "春节调休"
+    assert calendar.note(date(2025, 2, 1)) == "春节"
+    assert calendar.note(date(2025, 2, 5)) == ""
+
+
+def test_custom_weekend(tmp_path):
+    calendar = make_calendar(tmp_path, "weekend|7\n")
+    assert calendar.is_working_day(date(2025, 1, 11))  # 周六上班
+    assert not calendar.is_working_day(date(2025, 1, 12))
+    assert calendar.working_days_in_month(2025, 1) == 27
+
+
+def test_rotation_starts_at_its_anchor(tmp_path):
+    calendar = make_calendar(tmp_path, "rotation|2025-01-06|11111101111100\n")
+    assert not calendar.is_working_day(date(2025, 1, 4))  # 锚定日之前仍按周末
+    assert calendar.is_working_day(date(2025, 1, 11))  # 大周的周六
+    assert not calendar.is_working_day(date(2025, 1, 12))
+    assert not calendar.is_working_day(date(2025, 1, 18))  # 小周的周六
+    assert calendar.is_working_day(date(2025, 1, 25))  # 第三周回到大周
+    assert not calendar.is_working_day(date(2025, 1, 26))
+
+
+def test_rotation_carries_over_into_the_next_year(tmp_path):
+    calendar = make_calendar(tmp_path, "rotation|2024-12-30|1111110\n")
+    assert not calendar.is_working_day(date(2024, 12, 29))
+    assert calendar.is_working_day(date(2025, 1, 4))  # 周六，锚定日起第 6 天
+    assert not calendar.is_working_day(date(2025, 1, 5))
+    assert calendar.working_days_in_month(2025, 1) == 31 - 4  # 每 7 天休 1 天：5、12、19、26 日
+
+
+def test_later_rotation_and_holidays_take_precedence(tmp_path):
+    text = "rotation|2025-01-06|1111111\nrotation|2025-01-20|1111100\nholiday|2025-01-08\n"
+    calendar = make_calendar(tmp_path, text)
+    assert calendar.is_working_day(date(2025, 1, 12))  # 第一段轮班：天天上班
+    assert not calendar.is_working_day(date(2025, 1, 8))  # 放假优先于轮班
+    assert not calendar.is_working_day(date(2025, 1, 25))  # 第二段轮班从 20 日起算
+
+
+def test_working_days_between_crosses_into_january(tmp_path):
+    calendar = make_calendar(tmp_path)
+    assert calendar.working_days_between(date(2024, 12, 30), date(2025, 1, 1)) == 2
+    assert calendar.working_days_between(date(2024, 1, 1), date(2025, 1, 1)) == 262  # 闰年
+    assert calendar.working_days_between(date(2025, 1, 6), date(2025, 1, 6)) == 0
+    assert calendar.is_working_day(date(2024, 12, 31))  # 闰年位图的最后一天
+
+
+def test_bad_lines_are_skipped(tmp_path, capsys):
+    calendar = make_calendar(tmp_path, "holiday|2025-13-01\nholiday|2025-01-10|2025-01-09\nrotation|2025-01-06|12\n"
+                                       "weekend|8\nholiday|2025-01-07\n")
+    assert not calendar.is_working_day(date(2025, 1, 7))
+    output = capsys.readouterr().out
+    assert all(f"第 {line} 行无效" in output for line in (1, 2, 3, 4))
+
+
+def test_refresh_reloads_only_when_the_file_changes(tmp_path):
+    calendar = make_calendar(tmp_path, "holiday|2025-01-07\n")
+    assert calendar.refresh()
+    assert not calendar.refresh()
+    assert not calendar.is_working_day(date(2025, 1, 7))
+    path = tmp_path / "calendar.txt"
+    path.write_text("workday|2025-01-11\n", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert calendar.refresh()
+    assert calendar.is_working_day(date(2025, 1, 7))
+    assert calendar.is_working_day(date(2025, 1, 11))
+
+
+@pytest.mark.parametrize("year", [2024, 2025, 2026])
+def test_month_counts_add_up_to_the_year(tmp_path, year):
+    calendar = make_calendar(tmp_path, SPRING_FESTIVAL)
+    total = sum(calendar.working_days_in_month(year, month) for month in range(1, 13))
+    assert total == calendar.working_days_between(date(year, 1, 1), date(year + 1, 1, 1))
@@ -286,6 +286,10 @@ class ConfigDialog(QDialog):
                 for k, v in config.model_dump().items():
                     f.write(f"{k.upper()}={v}\n")
 
+            # 颜色配置可能变化，丢弃预渲染图层
+            if hasattr(self.parent, "timer_renderer"):
+                self.parent.timer_renderer.invalidate_layers()
+
             QMessageBox.information(self, "成功", "配置已保存！重启软件生效。")
             self.accept()
 
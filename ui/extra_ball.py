@@ -0,0 +1,221 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QCursor
+from PyQt5.QtWidgets import QApplication, QMenu, QWidget
+
+from core.display.renderer import TimerRenderer
+from core.timer.countdowns import COUNTDOWNS
+from core.timer.thresholds import color_state
+
+
+class CountdownView:
+    """把具名倒计时包装成渲染器需要的计时器接口（同时充当 mode_manager）"""
+
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    def countdown(self):
+        return COUNTDOWNS.get(self.name)
+
+    @property
+    def total_seconds(self):
+        countdown = self.countdown
+        return countdown.total_seconds if countdown is not None else 0
+
+    @property
+    def remaining(self):
+        return COUNTDOWNS.remaining(self.name) if self.countdown is not None else 0
+
+    @property
+    def is_running(self):
+        countdown = self.countdown
+        return countdown is not None and countdown.is_running
+
+    @property
+    def color(self):
+        return color_state(self.remaining)
+
+    def get_status_text(self):
+        return "countdown"
+
+    def get_current_timer(self):
+        return self
+
+
+class ExtraBall(QWidget):
+    """
+    额外的悬浮球
+
+    与主球在同一进程里，共用调度器、配置和预渲染图层。
+    view 为 None 时同步显示主球的当前计时；否则单独显示一个具名倒计时。
+    """
+
+    def __init__(self, main, view=None):
+        super().__init__()
+        self.main = main
+        self.view = view
+        self.mode_manager = view or main.mode_manager  # 渲染器从这里取计时器
+        self.show_rings = view is None  # 具名倒计时的圆环只画在同步显示的球上
+        self.drag_pos = None
+
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setFixedSize(main.size())
+
+        self.timer_renderer = TimerRenderer(self)
+        self.timer_renderer.text_renderer.set_font_size(main.timer_renderer.text_renderer.font.pointSize())
+        if view is None:
+            self.timer_renderer.text_renderer.set_text(main.timer_renderer.text_renderer.text)
+        else:
+            self.refresh_countdown()
+
+    def refresh_countdown(self):
+        """具名倒计时球：按剩余时间刷新文字"""
+        text_renderer = self.timer_renderer.text_renderer
+        self.set_display_text(text_renderer.format_time(self.view.remaining))
+
+    def set_display_text(self, text):
+        self.timer_renderer.set_text(text)
+        self.sync_animation()
+
+    def sync_animation(self):
+        if hasattr(self, "timer_renderer"):  # 窗口初始化期间也会收到事件
+            self.timer_renderer.animation.sync()
+
+    def move_to_screen(self, screen):
+        """放到指定显示器的中央"""
+        geometry = screen.availableGeometry()
+        self.move(geometry.center().x() - self.width() // 2, geometry.center().y() - self.height() // 2)
+
+    def showEvent(self, event):
+        self.sync_animation()
+
+    def hideEvent(self, event):
+        self.sync_animation()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        self.sync_animation()
+
+    def paintEvent(self, event):
+        self.timer_renderer.paint_timer(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.RightButton:
+            self.show_context_menu(QCursor.pos())
+        elif event.button() == Qt.LeftButton:
+            self.drag_pos = event.globalPos() - self.frameGeometry().topLeft()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self.drag_pos is not None:
+            self.move(event.globalPos() - self.drag_pos)
+
+    def mouseDoubleClickEvent(self, event):
+        # 具名倒计时球：双击暂停 / 继续
+        if event.button() == Qt.LeftButton and self.view is not None and self.view.countdown is not None:
+            COUNTDOWNS.toggle(self.view.name)
+
+    def show_context_menu(self, pos):
+        menu = QMenu()
+        if self.view is not None:
+            menu.addAction("显示为圆环").triggered.connect(self.back_to_ring)
+        menu.addAction("关闭").triggered.connect(self.close)
+        menu.exec_(pos)
+
+    def back_to_ring(self):
+        if self.view.countdown is not None:
+            COUNTDOWNS.set_display(self.view.name, "ring")  # 由 BallManager 关闭本球
+        else:
+            self.close()
+
+    def closeEvent(self, event):
+        self.timer_renderer.detach()
+        self.main.ball_manager.forget(self)
+        super().closeEvent(event)
+
+
+class BallManager:
+    """管理主球之外的悬浮球"""
+
+    def __init__(self, main):
+        self.main = main
+        self.balls = []
+
+    def mirrors(self):
+        return [ball for ball in self.balls if ball.view is None]
+
+    def open_mirror(self, screen=None):
+        """新建一个同步显示主球的悬浮球"""
+        ball = ExtraBall(self.main)
+        self.balls.append(ball)
+        if screen is not None:
+            ball.move_to_screen(screen)
+        else:
+            ball.move(self.main.pos().x() + self.main.width() + 10, self.main.pos().y())
+        ball.show()
+        return ball
+
+    def open_on_every_screen(self):
+        """在主球之外的每个显示器上各放一个同步显示的悬浮球"""
+        main_screen = QApplication.screenAt(self.main.geometry().center())
+        occupied = {QApplication.screenAt(ball.geometry().center()) for ball in self.mirrors()}
+        for screen in QApplication.screens():
+            if screen is not main_screen and screen not in occupied:
+                self.open_mirror(screen)
+
+    def open_countdown(self, name):
+        """把一个具名倒计时单独显示为悬浮球"""
+        for ball in self.balls:
+            if ball.view is not None and ball.view.name == name:
+                return ball
+        ball = ExtraBall(self.main, CountdownView(name))
+        self.balls.append(ball)
+        ball.move(self.main.pos().x(), self.main.pos().y() + self.main.height() + 10)
+        ball.show()
+        return ball
+
+    def forget(self, ball):
+        if ball in self.balls:
+            self.balls.remove(ball)
+        # 关掉具名倒计时球时改回圆环显示
+        if ball.view is not None and ball.view.countdown is not None and ball.view.countdown.display == "ball":
+            COUNTDOWNS.set_display(ball.view.name, "ring")
+
+    def close_all(self):
+        for ball in list(self.balls):
+            ball.close()
+
+    # ---------- 主球事件转发 ----------
+    def broadcast_text(self, text):
+        for ball in self.mirrors():
+            ball.set_display_text(text)
+
+    def broadcast_flash(self):
+        for ball in self.mirrors():
+            ball.timer_renderer.start_flash_alert()
+
+    def refresh_all(self):
+        for ball in self.balls:
+            ball.timer_renderer.refresh()
+
+    def resize_all(self, size, font_size):
+        for ball in self.balls:
+            ball.setFixedSize(size, size)
+            ball.timer_renderer.text_renderer.set_font_size(font_size)
+            ball.update()
+
+    def on_countdowns_changed(self, countdown):
+        """具名倒计时变化或每秒刷新：打开 / 关闭 / 刷新对应的悬浮球"""
+        shown = {ball.view.name: ball for ball in self.balls if ball.view is not None}
+        for name, ball in shown.items():
+            current = COUNTDOWNS.get(name)
+            if current is None or current.display != "ball":
+                ball.close()
+            else:
+                ball.refresh_countdown()
+        for item in COUNTDOWNS:
+            if item.display == "ball" and item.name not in shown:
+                self.open_countdown(item.name)
+        for ball in self.mirrors():
+            ball.timer_renderer.refresh()
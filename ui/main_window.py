@@ -1,6 +1,5 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QApplication
+from PyQt5.QtWidgets import QWidget, QApplication
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
 from core.mode import ModeManager
 from core.system.tray import TrayHandler
 from core.input.mouse import MouseHandler
@@ -8,7 +7,11 @@ from core.system.autostart import AutostartManager
 from core.display.color import ColorManager
 from ui.menu import MenuManager
 from core.display.renderer import TimerRenderer
-from config.env import reset_config
+from core.notify import NOTIFIER, OverlayBackend, TrayBalloonBackend
+from core.timer.countdowns import COUNTDOWNS
+from ui.extra_ball import BallManager
+from config.env import reset_config, ENV_PATH
+from dotenv import set_key
 from config.settings import APP_CONFIG
 
 
@@ -27,12 +30,6 @@ class CountdownBall(QWidget):
         # 设置主窗口size
         self.setFixedSize(APP_CONFIG.BALL_SIZE, APP_CONFIG.BALL_SIZE)
 
-        self.time_label = QLabel("00:00", self) # 时间显示区域
-        self.time_label.setAlignment(Qt.AlignCenter) # 文本居中
-        self.time_label.setFont(QFont("Arial", 26, QFont.Bold)) # 颜色
-        self.time_label.setGeometry(0, 0, APP_CONFIG.BALL_SIZE, APP_CONFIG.BALL_SIZE) # 位置尺寸
-        self.time_label.setStyleSheet("color: rgba(255,255,255,0.95); background: transparent;")
-
     def _setup_components(self):
         self.mode_manager = ModeManager(self)
         self.tray_handler = TrayHandler(self)
@@ -41,6 +38,13 @@ class CountdownBall(QWidget):
         self.color_manager = ColorManager(self)
         self.menu_manager = MenuManager(self)
         self.timer_renderer = TimerRenderer(self)
+        # 其他悬浮球与主球共用调度器、配置和预渲染图层
+        self.ball_manager = BallManager(self)
+        # 计时器的提醒走托盘气泡和球上的提示条，不再弹阻塞对话框
+        NOTIFIER.add_backend(TrayBalloonBackend(self.tray_handler.tray_icon))
+        NOTIFIER.add_backend(OverlayBackend(self.timer_renderer))
+        # 具名倒计时的圆环画在主球上，状态变化或每秒刷新时重绘
+        COUNTDOWNS.add_listener(self.on_countdowns_changed)
 
 
     def center_on_screen(self):
@@ -51,14 +55,20 @@ class CountdownBall(QWidget):
         )
 
     def update_display(self,remaining): # 更新计时显示
+        self.set_display_text(self.timer_renderer.text_renderer.format_time(remaining))
+
+    def update_display_tenths(self, tenths): # 临界窗口内带十分之一秒的显示
+        self.set_display_text(self.timer_renderer.text_renderer.format_tenths(tenths))
+
+    def set_show_tenths(self, enabled): # 临界阈值以内是否显示十分之一秒
+        APP_CONFIG.SHOW_TENTHS = enabled
+        set_key(ENV_PATH, 'SHOW_TENTHS', '1' if enabled else '0')
+        self.mode_manager.get_current_timer().sync_tenths()
 
-        m, s = divmod(abs(remaining), 60)
-        print(m, s)
-        if remaining<0:
-            self.time_label.setText(f"-{m:02d}:{s:02d}")
-        else:
-            self.time_label.setText(f"{m:02d}:{s:02d}")
-        self.update()
+    def set_display_text(self, text): # 直接设置显示文字
+        self.timer_renderer.set_text(text)
+        self.sync_animation()
+        self.ball_manager.broadcast_text(text)
 
     def reset_timer(self):
         reset_config()
@@ -67,7 +77,34 @@ class CountdownBall(QWidget):
 
     def flash_alert(self): # 时间显示闪烁（结束计时）
         self.timer_renderer.start_flash_alert()
+        self.ball_manager.broadcast_flash()
+
+    def set_color_state(self, state): # 颜色状态变化（阈值事件）
+        self.timer_renderer.refresh()
+        self.ball_manager.refresh_all()
+
+    def update_pacing(self, slide, offset): # 幻灯片翻页，重画节奏弧线
+        self.timer_renderer.refresh()
+        self.ball_manager.refresh_all()
+
+    def on_countdowns_changed(self, countdown): # 具名倒计时变化
+        self.timer_renderer.refresh()
+        self.ball_manager.on_countdowns_changed(countdown)
+
+
+    def sync_animation(self): # 根据可见性启停脉冲动画
+        if hasattr(self, "timer_renderer"):  # 窗口初始化期间也会收到事件
+            self.timer_renderer.animation.sync()
+
+    def showEvent(self, event): # 显示事件
+        self.sync_animation()
+
+    def hideEvent(self, event): # 隐藏事件
+        self.sync_animation()
 
+    def changeEvent(self, event): # 窗口状态变化（最小化等）
+        super().changeEvent(event)
+        self.sync_animation()
 
     def paintEvent(self, event): # 绘画事件
         self.timer_renderer.paint_timer(event)
@@ -103,10 +140,10 @@ class CountdownBall(QWidget):
         """动态调整球体大小"""
         self.setFixedSize(size, size)
 
-        # 调整时间标签
+        # 调整时间文字
         font_size = max(12, int(size * 0.24))  #
-        self.time_label.setFont(QFont("Arial", font_size, QFont.Bold))
-        self.time_label.setGeometry(0, 0, size, size)
+        self.timer_renderer.text_renderer.set_font_size(font_size)
+        self.ball_manager.resize_all(size, font_size)
 
-        # 触发重绘
-        self.update()
\ No newline at end of file
+        # 丢弃旧尺寸的预渲染图层并触发重绘
+        self.timer_renderer.invalidate_layers()
\ No newline at end of file
@@ -1,4 +1,9 @@
-from PyQt5.QtWidgets import QMenu, QApplication, QMessageBox
+from datetime import time
+
+from PyQt5.QtWidgets import QMenu, QApplication, QMessageBox, QInputDialog
+from config.env import preprocess_str, validate_time_format
+from config.settings import APP_CONFIG
+from core.timer.countdowns import COUNTDOWNS
 from ui.config_dialog import ConfigDialog
 from ui.shortcut_dialog import ShortcutDialog
 from ui.ballsize_dialog import SizeDialog
@@ -17,6 +22,36 @@ class MenuManager:
             action.setChecked(self.parent.mode_manager.mode == name)
             action.triggered.connect(lambda _, m=name: self.parent.mode_manager.set_mode(m))
 
+        # 具名倒计时子菜单（与当前模式同时运行）
+        countdown_menu = menu.addMenu("多个倒计时")
+        countdown_menu.addAction("新建倒计时...").triggered.connect(self.add_named_countdown)
+        countdown_menu.addAction("新建截止时刻...").triggered.connect(self.add_stop_time)
+        if len(COUNTDOWNS):
+            countdown_menu.addSeparator()
+        for countdown in COUNTDOWNS:
+            m, s = divmod(COUNTDOWNS.remaining(countdown.name), 60)
+            state = "运行中" if countdown.is_running else ("已结束" if m == s == 0 else "已暂停")
+            item_menu = countdown_menu.addMenu(f"{countdown.name}  {m:02d}:{s:02d}（{state}）")
+            toggle_label = "暂停" if countdown.is_running else ("继续" if m or s else "重新开始")
+            item_menu.addAction(toggle_label).triggered.connect(lambda _, n=countdown.name: COUNTDOWNS.toggle(n))
+            if countdown.display == "ball":
+                item_menu.addAction("显示为圆环").triggered.connect(
+                    lambda _, n=countdown.name: COUNTDOWNS.set_display(n, "ring"))
+            else:
+                item_menu.addAction("单独显示为悬浮球").triggered.connect(
+                    lambda _, n=countdown.name: COUNTDOWNS.set_display(n, "ball"))
+            item_menu.addAction("删除").triggered.connect(lambda _, n=countdown.name: COUNTDOWNS.remove(n))
+
+        # 多个悬浮球（同一进程，共用调度器与图层缓存）
+        ball_menu = menu.addMenu("悬浮球")
+        ball_menu.addAction("新建同步悬浮球").triggered.connect(lambda: self.parent.ball_manager.open_mirror())
+        every_screen = ball_menu.addAction("每个显示器一个")
+        every_screen.setEnabled(len(QApplication.screens()) > 1)
+        every_screen.triggered.connect(self.parent.ball_manager.open_on_every_screen)
+        close_balls = ball_menu.addAction(f"关闭其他悬浮球（{len(self.parent.ball_manager.balls)}）")
+        close_balls.setEnabled(bool(self.parent.ball_manager.balls))
+        close_balls.triggered.connect(self.parent.ball_manager.close_all)
+
         #  快捷入口子菜单
         shortcut_menu = menu.addMenu("快捷入口")
         shortcut_dialog = ShortcutDialog(self.parent)
@@ -59,6 +94,11 @@ class MenuManager:
         size_action = settings_menu.addAction("球体大小")
         size_action.triggered.connect(self.open_size_dialog)
 
+        tenths_action = settings_menu.addAction("临界时显示 0.1 秒")
+        tenths_action.setCheckable(True)
+        tenths_action.setChecked(APP_CONFIG.SHOW_TENTHS)
+        tenths_action.triggered.connect(self.parent.set_show_tenths)
+
         config_action = settings_menu.addAction("配置管理")
         config_action.triggered.connect(lambda: ConfigDialog(self.parent).exec_())
 
@@ -97,6 +137,29 @@ class MenuManager:
 
         QMessageBox.about(self.parent, "我爱公司", info.strip())
 
+    def add_named_countdown(self):
+        """新建一个按分钟计的具名倒计时"""
+        name, ok = QInputDialog.getText(self.parent, "新建倒计时", "名称：", text="休息")
+        if not ok or not name.strip():
+            return
+        minutes, ok = QInputDialog.getInt(self.parent, "新建倒计时", "时长（分钟）：", 10, 1, 600)
+        if ok:
+            COUNTDOWNS.add(name.strip(), minutes * 60)
+
+    def add_stop_time(self):
+        """新建一个到指定时刻为止的具名倒计时"""
+        name, ok = QInputDialog.getText(self.parent, "新建截止时刻", "名称：", text="结束")
+        if not ok or not name.strip():
+            return
+        value, ok = QInputDialog.getText(self.parent, "新建截止时刻", "截止时刻（HH:MM）：")
+        if not ok:
+            return
+        if not validate_time_format(value):
+            QMessageBox.warning(self.parent, "警告", "时间格式无效，应为 HH:MM 格式")
+            return
+        hour, minute = map(int, preprocess_str(value).split(":"))
+        COUNTDOWNS.add_until(name.strip(), time(hour, minute))
+
     def open_size_dialog(self):
 
         dialog = SizeDialog(self.parent)